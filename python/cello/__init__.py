@@ -53,8 +53,11 @@ Example:
 
 """
 
+import functools
+from typing import NamedTuple, Optional
+
 from .validation import wrap_handler_with_validation
-from .database import transactional, Database, Redis, Transaction
+from .database import transactional, Database, Redis, Transaction, _request_scoped
 from .guards import (
     Guard,
     Role as RoleGuard,
@@ -298,6 +301,44 @@ __all__ = [
 ]
 __version__ = "1.2.2"
 
+# Startup banner templates, built once at import time. _print_banner picks
+# the ANSI variant for terminals and the plain one for pipes and log files.
+_BANNER_TEMPLATE_TTY = """
+\033[38;5;208m     ██████╗███████╗██╗     ██╗      ██████╗\033[0m
+\033[38;5;208m    ██╔════╝██╔════╝██║     ██║     ██╔═══██╗\033[0m
+\033[38;5;214m    ██║     █████╗  ██║     ██║     ██║   ██║\033[0m
+\033[38;5;214m    ██║     ██╔══╝  ██║     ██║     ██║   ██║\033[0m
+\033[38;5;220m    ╚██████╗███████╗███████╗███████╗╚██████╔╝\033[0m
+\033[38;5;220m     ╚═════╝╚══════╝╚══════╝╚══════╝ ╚═════╝\033[0m
+
+    \033[1mv{v}\033[0m  \033[2m|\033[0m  Rust-powered Python Web Framework
+
+    \033[32m➜\033[0m  \033[1mServer:\033[0m    {url}
+    \033[32m➜\033[0m  \033[1mWorkers:\033[0m   {workers}
+    \033[32m➜\033[0m  \033[1mEnvironment:\033[0m {env}
+
+    \033[2mPress CTRL+C to stop\033[0m
+
+"""
+
+_BANNER_TEMPLATE_PLAIN = """
+     ██████╗███████╗██╗     ██╗      ██████╗
+    ██╔════╝██╔════╝██║     ██║     ██╔═══██╗
+    ██║     █████╗  ██║     ██║     ██║   ██║
+    ██║     ██╔══╝  ██║     ██║     ██║   ██║
+    ╚██████╗███████╗███████╗███████╗╚██████╔╝
+     ╚═════╝╚══════╝╚══════╝╚══════╝ ╚═════╝
+
+    v{v}  |  Rust-powered Python Web Framework
+
+    ➜  Server:    {url}
+    ➜  Workers:   {workers}
+    ➜  Environment: {env}
+
+    Press CTRL+C to stop
+
+"""
+
 
 class Blueprint:
     """
@@ -387,6 +428,134 @@ def _worker_process_entry():
     pass
 
 
+# Marks run() arguments the caller did not pass, so that CLI flags and
+# environment defaults can fill them in.
+_UNSET = object()
+
+
+class RunConfig(NamedTuple):
+    """Resolved server settings used by App.run()."""
+
+    host: str
+    port: int
+    debug: bool
+    env: str
+    workers: Optional[int]
+    reload: bool
+    logs: bool
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(defaults):
+    """Build the CLI parser for run(), once per ``(host, port, env, workers)``."""
+    import argparse
+
+    host, port, env, workers = defaults
+    parser = argparse.ArgumentParser(description="Cello Web Server", add_help=False)
+    parser.add_argument("--host", default=host)
+    parser.add_argument("--port", type=int, default=port)
+    parser.add_argument("--env", default=env)
+    parser.add_argument("--debug", action="store_true")
+    parser.add_argument("--reload", action="store_true")
+    parser.add_argument("--workers", type=int, default=workers,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--no-logs", action="store_true")
+    return parser
+
+
+def _resolve_run_config(host, port, debug, env, workers, reload, logs, argv) -> RunConfig:
+    """Merge explicit run() arguments, CLI flags and defaults.
+
+    ``--host``, ``--port`` and ``--reload`` override the values passed to
+    run(), as documented for the CLI. For env, workers, debug and logs an
+    explicit argument wins over its flag. Anything still unset falls back
+    to the defaults. ``argv`` is None when CLI parsing is disabled (e.g.
+    under unittest). A ``workers`` value of None means "pick automatically"
+    in run().
+    """
+    if argv is not None:
+        parser = _build_parser((
+            host,
+            port,
+            "development" if env is _UNSET else env,
+            None if workers is _UNSET else workers,
+        ))
+        # Use parse_known_args to avoid conflicts
+        args, _ = parser.parse_known_args(argv)
+
+        host = args.host
+        port = args.port
+        if env is _UNSET:
+            env = args.env
+        if workers is _UNSET:
+            workers = args.workers
+        reload = reload or args.reload
+        # Debug logic: CLI flag enables it, or defaults to dev env
+        if debug is _UNSET:
+            debug = args.debug or env == "development"
+        # Logs logic: CLI --no-logs disables it
+        if logs is _UNSET:
+            logs = debug and not args.no_logs
+
+    if env is _UNSET:
+        env = "development"
+    if debug is _UNSET:
+        debug = env == "development"
+    if logs is _UNSET:
+        logs = debug
+    if workers is _UNSET:
+        workers = None
+
+    return RunConfig(host, port, debug, env, workers, reload, logs)
+
+
+def _noop_signal_handler(signum, frame):
+    """Signal handler that does nothing; delivery is observed via the wakeup fd."""
+
+
+def _wait_for_shutdown(child_pids):
+    """Block the supervisor until SIGINT/SIGTERM arrives or all workers exit.
+
+    Signals are routed through ``signal.set_wakeup_fd`` into a pipe, so no
+    Python code runs inside the signal handler itself and shutdown happens
+    in normal code context. Exited children are reaped on SIGCHLD.
+    """
+    import os
+    import select
+    import signal
+
+    r, w = os.pipe()
+    os.set_blocking(w, False)
+    old_wakeup_fd = signal.set_wakeup_fd(w)
+    previous = {
+        sig: signal.signal(sig, _noop_signal_handler)
+        for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD)
+    }
+    alive = set(child_pids)
+    try:
+        while True:
+            for pid in list(alive):
+                try:
+                    done, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    done = pid
+                if done:
+                    alive.discard(pid)
+            if not alive:
+                return
+
+            select.select([r], [], [])
+            received = os.read(r, 512)
+            if signal.SIGINT in received or signal.SIGTERM in received:
+                return
+    finally:
+        signal.set_wakeup_fd(old_wakeup_fd)
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        os.close(r)
+        os.close(w)
+
+
 def _apply_guards(handler, guards):
     """Wrap a handler with guard checks if guards are provided.
 
@@ -398,18 +567,21 @@ def _apply_guards(handler, guards):
 
     import functools
     import inspect
-    from .guards import verify_guards
+    from .guards import compile_guards, run_compiled
+
+    # Flatten the guards (and any And/Or/Not inside them) once per route
+    program = compile_guards(guards)
 
     if inspect.iscoroutinefunction(handler):
         @functools.wraps(handler)
         async def async_guard_wrapper(request, *args, **kwargs):
-            verify_guards(guards, request)
+            run_compiled(program, request)
             return await handler(request, *args, **kwargs)
         return async_guard_wrapper
     else:
         @functools.wraps(handler)
         def guard_wrapper(request, *args, **kwargs):
-            verify_guards(guards, request)
+            run_compiled(program, request)
             return handler(request, *args, **kwargs)
         return guard_wrapper
 
@@ -438,6 +610,7 @@ class App:
         self._routes = []  # Track routes for OpenAPI generation
         self._template_engine: "MiniJinjaEngine | None" = None  # v1.1.0
         self._redis = None  # Python Redis client; set by enable_redis()
+        self._singletons = {}  # Python-side copy of register_singleton() values
 
     def _register_route(self, method: str, path: str, func, tags: list = None, summary: str = None, description: str = None):
         """Internal: Register a route and track metadata for OpenAPI."""
@@ -476,8 +649,8 @@ class App:
                 return {"message": f"Hello, {request.params['name']}!"}
         """
         def decorator(func):
-            wrapped = _apply_guards(wrap_handler_with_validation(self._make_redis_aware(func)), guards)
-            self._app.get(path, wrapped)
+            wrapped = _apply_guards(wrap_handler_with_validation(_request_scoped(self._make_redis_aware(func))), guards)
+            self._app.get(path, self._bind_singletons(wrapped))
             self._register_route("GET", path, func, tags, summary, description)
             return wrapped
         return decorator
@@ -485,8 +658,8 @@ class App:
     def post(self, path: str, tags: list = None, summary: str = None, description: str = None, guards: list = None):
         """Register a POST route."""
         def decorator(func):
-            wrapped = _apply_guards(wrap_handler_with_validation(self._make_redis_aware(func)), guards)
-            self._app.post(path, wrapped)
+            wrapped = _apply_guards(wrap_handler_with_validation(_request_scoped(self._make_redis_aware(func))), guards)
+            self._app.post(path, self._bind_singletons(wrapped))
             self._register_route("POST", path, func, tags, summary, description)
             return wrapped
         return decorator
@@ -494,8 +667,8 @@ class App:
     def put(self, path: str, tags: list = None, summary: str = None, description: str = None, guards: list = None):
         """Register a PUT route."""
         def decorator(func):
-            wrapped = _apply_guards(wrap_handler_with_validation(self._make_redis_aware(func)), guards)
-            self._app.put(path, wrapped)
+            wrapped = _apply_guards(wrap_handler_with_validation(_request_scoped(self._make_redis_aware(func))), guards)
+            self._app.put(path, self._bind_singletons(wrapped))
             self._register_route("PUT", path, func, tags, summary, description)
             return wrapped
         return decorator
@@ -503,8 +676,8 @@ class App:
     def delete(self, path: str, tags: list = None, summary: str = None, description: str = None, guards: list = None):
         """Register a DELETE route."""
         def decorator(func):
-            wrapped = _apply_guards(wrap_handler_with_validation(self._make_redis_aware(func)), guards)
-            self._app.delete(path, wrapped)
+            wrapped = _apply_guards(wrap_handler_with_validation(_request_scoped(self._make_redis_aware(func))), guards)
+            self._app.delete(path, self._bind_singletons(wrapped))
             self._register_route("DELETE", path, func, tags, summary, description)
             return wrapped
         return decorator
@@ -512,8 +685,8 @@ class App:
     def patch(self, path: str, tags: list = None, summary: str = None, description: str = None, guards: list = None):
         """Register a PATCH route."""
         def decorator(func):
-            wrapped = _apply_guards(wrap_handler_with_validation(self._make_redis_aware(func)), guards)
-            self._app.patch(path, wrapped)
+            wrapped = _apply_guards(wrap_handler_with_validation(_request_scoped(self._make_redis_aware(func))), guards)
+            self._app.patch(path, self._bind_singletons(wrapped))
             self._register_route("PATCH", path, func, tags, summary, description)
             return wrapped
         return decorator
@@ -567,7 +740,7 @@ class App:
             methods = ["GET"]
 
         def decorator(func):
-            wrapped = wrap_handler_with_validation(func)
+            wrapped = self._bind_singletons(wrap_handler_with_validation(func))
             for method in methods:
                 method_upper = method.upper()
                 if method_upper == "GET":
@@ -1329,13 +1502,45 @@ class App:
         Args:
             name: Dependency name
             value: The singleton value
+
+        Handlers registered after this call get the value bound directly
+        into their ``Depends(name)`` parameters, so no per-request lookup
+        is needed. Handlers registered earlier are resolved by the Rust
+        dependency container at request time.
         """
+        self._singletons[name] = value
         self._app.register_singleton(name, value)
 
+    def _bind_singletons(self, handler):
+        """Internal: pre-bind known singletons to ``Depends`` parameters.
+
+        Returns a ``functools.partial`` with the singleton values as keyword
+        arguments, or the handler unchanged when nothing can be bound.
+        """
+        if not self._singletons:
+            return handler
+
+        import inspect
+
+        try:
+            params = inspect.signature(handler).parameters.values()
+        except (TypeError, ValueError):
+            return handler
+
+        bound = {
+            param.name: self._singletons[param.default.dependency]
+            for param in params
+            if isinstance(param.default, Depends)
+            and param.default.dependency in self._singletons
+        }
+        if not bound:
+            return handler
+        return functools.partial(handler, **bound)
+
     def run(self, host: str = "127.0.0.1", port: int = 8000,
-            debug: bool = None, env: str = None,
-            workers: int = None, reload: bool = False,
-            logs: bool = None):
+            debug: bool = _UNSET, env: str = _UNSET,
+            workers: int = _UNSET, reload: bool = False,
+            logs: bool = _UNSET):
         """
         Start the HTTP server.
 
@@ -1348,6 +1553,10 @@ class App:
             reload: Enable hot reload (default: False)
             logs: Enable logging (default: True in dev)
 
+        The ``--host``, ``--port`` and ``--reload`` command-line flags take
+        precedence over the matching arguments. The other flags only fill
+        in arguments left unset.
+
         Example:
             # Simple development server
             app.run()
@@ -1362,7 +1571,6 @@ class App:
         """
         import sys
         import os
-        import argparse
         import subprocess
         import time
 
@@ -1378,39 +1586,10 @@ class App:
             return
 
         # Parse CLI arguments (only if running as main script)
-        if "unittest" not in sys.modules:
-            parser = argparse.ArgumentParser(description="Cello Web Server", add_help=False)
-            parser.add_argument("--host", default=host)
-            parser.add_argument("--port", type=int, default=port)
-            parser.add_argument("--env", default=env or "development")
-            parser.add_argument("--debug", action="store_true")
-            parser.add_argument("--reload", action="store_true")
-            parser.add_argument("--workers", type=int, default=workers,
-                                help="Number of worker processes (default: CPU count)")
-            parser.add_argument("--no-logs", action="store_true")
-
-            # Use parse_known_args to avoid conflicts
-            args, _ = parser.parse_known_args()
-
-            # Update configuration from CLI
-            host = args.host
-            port = args.port
-            if env is None: env = args.env
-            if workers is None: workers = args.workers
-            if reload is False and args.reload: reload = True
-
-            # Debug logic: CLI flag enables it, or defaults to dev env
-            if debug is None:
-                debug = args.debug or (env == "development")
-
-            # Logs logic: CLI --no-logs disables it
-            if logs is None:
-                logs = not args.no_logs and debug
-
-        # Set defaults if still None
-        if env is None: env = "development"
-        if debug is None: debug = (env == "development")
-        if logs is None: logs = debug
+        argv = sys.argv[1:] if "unittest" not in sys.modules else None
+        host, port, debug, env, workers, reload, logs = _resolve_run_config(
+            host, port, debug, env, workers, reload, logs, argv
+        )
 
         # Reloading Logic (Development only)
         if reload and os.environ.get("CELLO_RUN_MAIN") != "true":
@@ -1462,26 +1641,19 @@ class App:
 
     @staticmethod
     def _print_banner(host: str, port: int, workers: int, env: str):
-        """Print the Cello startup banner with ASCII art logo."""
-        v = __version__
-        url = f"http://{host}:{port}"
-        banner = f"""
-\033[38;5;208m     ██████╗███████╗██╗     ██╗      ██████╗\033[0m
-\033[38;5;208m    ██╔════╝██╔════╝██║     ██║     ██╔═══██╗\033[0m
-\033[38;5;214m    ██║     █████╗  ██║     ██║     ██║   ██║\033[0m
-\033[38;5;214m    ██║     ██╔══╝  ██║     ██║     ██║   ██║\033[0m
-\033[38;5;220m    ╚██████╗███████╗███████╗███████╗╚██████╔╝\033[0m
-\033[38;5;220m     ╚═════╝╚══════╝╚══════╝╚══════╝ ╚═════╝\033[0m
-
-    \033[1mv{v}\033[0m  \033[2m|\033[0m  Rust-powered Python Web Framework
+        """Print the Cello startup banner with ASCII art logo.
 
-    \033[32m➜\033[0m  \033[1mServer:\033[0m    {url}
-    \033[32m➜\033[0m  \033[1mWorkers:\033[0m   {workers}
-    \033[32m➜\033[0m  \033[1mEnvironment:\033[0m {env}
+        Colors are only emitted when stdout is a terminal, so piped output
+        (log files, container log collectors) stays free of ANSI escapes.
+        """
+        import sys
 
-    \033[2mPress CTRL+C to stop\033[0m
-"""
-        print(banner)
+        isatty = getattr(sys.stdout, "isatty", None)
+        template = _BANNER_TEMPLATE_TTY if isatty and isatty() else _BANNER_TEMPLATE_PLAIN
+        sys.stdout.write(template.format(
+            v=__version__, url=f"http://{host}:{port}", workers=workers, env=env,
+        ))
+        sys.stdout.flush()
 
     def _run_multiprocess(self, host: str, port: int, workers: int, env: str):
         """Run server with multiple worker processes for maximum throughput.
@@ -1492,10 +1664,12 @@ class App:
           - Windows: Uses multiprocessing.Process (spawn-based).
             SO_REUSEADDR allows port reuse between processes.
 
-        Architecture:
-            Parent process: runs as worker + supervises children
+        Architecture (Unix):
+            Parent process: supervises children, waiting on a signal pipe
             N child processes: each runs as an independent worker
-            Total: N+1 processes on the port
+            Total: N processes on the port
+
+        On Windows the parent also serves requests (N+1 processes).
         """
         import signal
         import sys
@@ -1529,22 +1703,14 @@ class App:
             else:
                 child_pids.append(pid)
 
-        def _cleanup(signum=None, frame=None):
+        try:
+            _wait_for_shutdown(child_pids)
+        finally:
             for pid in child_pids:
                 try:
                     os.kill(pid, signal.SIGTERM)
                 except ProcessLookupError:
                     pass
-
-        signal.signal(signal.SIGINT, lambda s, f: (_cleanup(), os._exit(0)))
-        signal.signal(signal.SIGTERM, lambda s, f: (_cleanup(), os._exit(0)))
-
-        try:
-            self._app.run(host, port, None)
-        except KeyboardInterrupt:
-            pass
-        finally:
-            _cleanup()
             for pid in child_pids:
                 try:
                     os.waitpid(pid, os.WNOHANG)
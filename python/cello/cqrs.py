@@ -65,10 +65,106 @@ Example:
         return {"error": "Order not found"}
 """
 
+import asyncio
 import inspect
+import sys
 import time
 import uuid
-from typing import Any, Callable, Dict, Optional, Type
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type
+
+
+# Upper bound on generated functions per class; instances with more distinct
+# attribute layouts than this fall back to the generic implementation.
+_MAX_LAYOUTS = 32
+
+# Attributes set by the framework itself, never treated as user fields.
+_RESERVED_FIELDS = ("id", "timestamp")
+
+
+def _user_fields(names):
+    """Return the user-supplied attribute names from an instance layout."""
+    return [
+        name for name in names
+        if not name.startswith("_") and name not in _RESERVED_FIELDS
+    ]
+
+
+def _compile_to_dict(type_key: str, type_name: str, names) -> Callable:
+    """
+    Generate a ``to_dict`` function for one attribute layout.
+
+    The generated function builds the result dict in a single literal,
+    reading each user field straight from ``__dict__`` instead of
+    filtering every attribute on each call.
+    """
+    items = "".join(f", {name!r}: d[{name!r}]" for name in _user_fields(names))
+    source = (
+        "def to_dict(self):\n"
+        "    d = self.__dict__\n"
+        f"    return {{'id': self.id, {type_key!r}: {type_name!r}, "
+        f"'timestamp': self.timestamp{items}}}\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["to_dict"]
+
+
+def _layout_names(obj) -> tuple:
+    """Return the attribute layout of ``obj``: its ``__dict__`` keys.
+
+    Taken from the live ``__dict__`` rather than the constructor kwargs,
+    so fields assigned after ``__init__`` are serialized and keyed too.
+    """
+    return tuple(obj.__dict__)
+
+
+def _layout_to_dict(obj, type_key: str, type_name: str) -> Dict[str, Any]:
+    """Serialize ``obj`` through the generated function for its layout."""
+    names = _layout_names(obj)
+    layouts = type(obj)._to_dict_layouts
+    fn = layouts.get(names)
+    if fn is None:
+        if len(layouts) >= _MAX_LAYOUTS:
+            result = {"id": obj.id, type_key: type_name, "timestamp": obj.timestamp}
+            for key in _user_fields(names):
+                result[key] = obj.__dict__[key]
+            return result
+        fn = layouts[names] = _compile_to_dict(type_key, type_name, names)
+    return fn(obj)
+
+
+def _compile_repr(type_name: str, names) -> Callable:
+    """Generate a ``__repr__`` function for one attribute layout."""
+    fields = _user_fields(names)
+    fmt = "%s(id=%%r%s)" % (
+        type_name.replace("%", "%%"),
+        "".join(", %s=%%r" % name.replace("%", "%%") for name in fields),
+    )
+    args = "".join(f", d[{name!r}]" for name in fields)
+    source = (
+        "def __repr__(self):\n"
+        "    d = self.__dict__\n"
+        f"    return {fmt!r} % (self.id{args},)\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["__repr__"]
+
+
+def _layout_repr(obj, type_name: str) -> str:
+    """Format ``obj`` through the generated ``__repr__`` for its layout."""
+    names = _layout_names(obj)
+    layouts = type(obj)._repr_layouts
+    fn = layouts.get(names)
+    if fn is None:
+        if len(layouts) >= _MAX_LAYOUTS:
+            d = obj.__dict__
+            fields = "".join(f", {key}={d[key]!r}" for key in _user_fields(names))
+            return f"{type_name}(id={obj.id!r}{fields})"
+        fn = layouts[names] = _compile_repr(type_name, names)
+    return fn(obj)
 
 
 class Command:
@@ -80,8 +176,8 @@ class Command:
     are stored as instance attributes.
 
     Attributes:
-        id: Unique command identifier (auto-generated UUID).
-        timestamp: Unix timestamp when the command was created.
+        id: Unique command identifier (UUID4 hex, generated lazily).
+        timestamp: Unix time in nanoseconds when the command was created.
         command_type: String name of the command class.
 
     Example:
@@ -96,6 +192,23 @@ class Command:
         cmd.validate()
     """
 
+    #: Interned class name of the command, resolved once per subclass.
+    command_type: ClassVar[str] = "Command"
+
+    # Whether the class overrides validate(); dispatch skips the call if not.
+    _has_validate: ClassVar[bool] = False
+
+    # Generated ``to_dict``/``__repr__`` functions keyed by attribute layout.
+    _to_dict_layouts: ClassVar[Dict[tuple, Callable]] = {}
+    _repr_layouts: ClassVar[Dict[tuple, Callable]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.command_type = sys.intern(cls.__name__)
+        cls._has_validate = cls.validate is not Command.validate
+        cls._to_dict_layouts = {}
+        cls._repr_layouts = {}
+
     def __init__(self, **kwargs):
         """
         Initialize a new Command.
@@ -106,19 +219,25 @@ class Command:
         Args:
             **kwargs: Arbitrary keyword arguments stored as attributes.
         """
-        self.id: str = str(uuid.uuid4())
-        self.timestamp: float = time.time()
+        self._id: Optional[str] = kwargs.pop("id", None)
+        self.timestamp: int = time.time_ns()
         self.__dict__.update(kwargs)
 
     @property
-    def command_type(self) -> str:
+    def id(self) -> str:
         """
-        Get the command type name.
+        Unique command identifier.
 
-        Returns:
-            The class name of this command.
+        Generated as a UUID4 hex string on first access, so commands
+        whose id is never read do not pay for it.
         """
-        return self.__class__.__name__
+        if self._id is None:
+            self._id = uuid.uuid4().hex
+        return self._id
+
+    @id.setter
+    def id(self, value: str) -> None:
+        self._id = value
 
     def validate(self) -> None:
         """
@@ -142,8 +261,8 @@ class Command:
         Serialize the command to a dictionary.
 
         Returns:
-            Dictionary representation of the command, excluding
-            private attributes.
+            Dictionary representation of the command: id, type and
+            timestamp plus its public attributes.
 
         Example:
             cmd = CreateUser(name="Alice", role="admin")
@@ -151,22 +270,10 @@ class Command:
             # {"id": "...", "command_type": "CreateUser", "timestamp": ...,
             #  "name": "Alice", "role": "admin"}
         """
-        result = {
-            "id": self.id,
-            "command_type": self.command_type,
-            "timestamp": self.timestamp,
-        }
-        for key, value in self.__dict__.items():
-            if not key.startswith("_") and key not in ("id", "timestamp"):
-                result[key] = value
-        return result
+        return _layout_to_dict(self, "command_type", self.command_type)
 
     def __repr__(self) -> str:
-        attrs = {
-            k: v for k, v in self.__dict__.items()
-            if not k.startswith("_") and k not in ("id", "timestamp")
-        }
-        return f"{self.command_type}(id={self.id!r}, {attrs})"
+        return _layout_repr(self, self.command_type)
 
 
 class Query:
@@ -178,8 +285,8 @@ class Query:
     passed to __init__ are stored as instance attributes.
 
     Attributes:
-        id: Unique query identifier (auto-generated UUID).
-        timestamp: Unix timestamp when the query was created.
+        id: Unique query identifier (UUID4 hex, generated lazily).
+        timestamp: Unix time in nanoseconds when the query was created.
         query_type: String name of the query class.
 
     Example:
@@ -191,6 +298,19 @@ class Query:
         print(query.user_id)     # "user-123"
     """
 
+    #: Interned class name of the query, resolved once per subclass.
+    query_type: ClassVar[str] = "Query"
+
+    # Generated ``to_dict``/``__repr__`` functions keyed by attribute layout.
+    _to_dict_layouts: ClassVar[Dict[tuple, Callable]] = {}
+    _repr_layouts: ClassVar[Dict[tuple, Callable]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.query_type = sys.intern(cls.__name__)
+        cls._to_dict_layouts = {}
+        cls._repr_layouts = {}
+
     def __init__(self, **kwargs):
         """
         Initialize a new Query.
@@ -201,27 +321,34 @@ class Query:
         Args:
             **kwargs: Arbitrary keyword arguments stored as attributes.
         """
-        self.id: str = str(uuid.uuid4())
-        self.timestamp: float = time.time()
+        self._id: Optional[str] = kwargs.pop("id", None)
+        self.timestamp: int = time.time_ns()
         self.__dict__.update(kwargs)
 
     @property
-    def query_type(self) -> str:
+    def id(self) -> str:
         """
-        Get the query type name.
+        Unique query identifier.
 
-        Returns:
-            The class name of this query.
+        Generated as a UUID4 hex string on first access. Most queries
+        are executed and discarded without their id ever being read, so
+        those never pay for generating one.
         """
-        return self.__class__.__name__
+        if self._id is None:
+            self._id = uuid.uuid4().hex
+        return self._id
+
+    @id.setter
+    def id(self, value: str) -> None:
+        self._id = value
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Serialize the query to a dictionary.
 
         Returns:
-            Dictionary representation of the query, excluding
-            private attributes.
+            Dictionary representation of the query: id, type and
+            timestamp plus its public attributes.
 
         Example:
             query = GetUserById(user_id="user-123")
@@ -229,22 +356,10 @@ class Query:
             # {"id": "...", "query_type": "GetUserById", "timestamp": ...,
             #  "user_id": "user-123"}
         """
-        result = {
-            "id": self.id,
-            "query_type": self.query_type,
-            "timestamp": self.timestamp,
-        }
-        for key, value in self.__dict__.items():
-            if not key.startswith("_") and key not in ("id", "timestamp"):
-                result[key] = value
-        return result
+        return _layout_to_dict(self, "query_type", self.query_type)
 
     def __repr__(self) -> str:
-        attrs = {
-            k: v for k, v in self.__dict__.items()
-            if not k.startswith("_") and k not in ("id", "timestamp")
-        }
-        return f"{self.query_type}(id={self.id!r}, {attrs})"
+        return _layout_repr(self, self.query_type)
 
 
 class CommandResult:
@@ -269,6 +384,8 @@ class CommandResult:
         print(result.error)    # "Insufficient funds"
     """
 
+    __slots__ = ("success", "data", "_error", "_exc")
+
     def __init__(
         self,
         success: bool,
@@ -285,7 +402,26 @@ class CommandResult:
         """
         self.success: bool = success
         self.data: Optional[Any] = data
-        self.error: Optional[str] = error
+        self._error: Optional[str] = error
+        self._exc: Optional[BaseException] = None
+
+    @property
+    def error(self) -> Optional[str]:
+        """
+        Error message on failure, or None.
+
+        For results built with fail_exc(), the exception is converted
+        to a string on first access only.
+        """
+        if self._exc is not None:
+            self._error = str(self._exc)
+            self._exc = None
+        return self._error
+
+    @error.setter
+    def error(self, value: Optional[str]) -> None:
+        self._error = value
+        self._exc = None
 
     @classmethod
     def ok(cls, data: Any = None) -> "CommandResult":
@@ -319,6 +455,30 @@ class CommandResult:
         """
         return cls(success=False, error=error)
 
+    @classmethod
+    def fail_exc(cls, exc: BaseException) -> "CommandResult":
+        """
+        Create a failed CommandResult from an exception.
+
+        The error message is only built (via ``str(exc)``) if ``error``
+        is read, which keeps failures with expensive messages cheap.
+
+        Args:
+            exc: The exception that caused the failure.
+
+        Returns:
+            CommandResult with success=False.
+
+        Example:
+            try:
+                ...
+            except DatabaseError as e:
+                return CommandResult.fail_exc(e)
+        """
+        result = cls(success=False)
+        result._exc = exc
+        return result
+
     @classmethod
     def rejected(cls, reason: str) -> "CommandResult":
         """
@@ -355,7 +515,7 @@ class QueryResult:
         data: The query result data, or None.
         error: Optional error message.
         found: Whether data was found (True if data is not None and
-               no error occurred).
+               no error occurred), computed once at construction.
 
     Example:
         result = QueryResult.ok({"name": "Alice", "email": "alice@example.com"})
@@ -366,6 +526,8 @@ class QueryResult:
         print(result.found)  # False
     """
 
+    __slots__ = ("data", "_error", "_exc", "found")
+
     def __init__(
         self,
         data: Optional[Any] = None,
@@ -379,17 +541,27 @@ class QueryResult:
             error: Optional error message.
         """
         self.data: Optional[Any] = data
-        self.error: Optional[str] = error
+        self._error: Optional[str] = error
+        self._exc: Optional[BaseException] = None
+        self.found: bool = data is not None and error is None
 
     @property
-    def found(self) -> bool:
+    def error(self) -> Optional[str]:
         """
-        Whether the query found data.
+        Error message on failure, or None.
 
-        Returns:
-            True if data is not None and no error occurred.
+        For results built with fail_exc(), the exception is converted
+        to a string on first access only.
         """
-        return self.data is not None and self.error is None
+        if self._exc is not None:
+            self._error = str(self._exc)
+            self._exc = None
+        return self._error
+
+    @error.setter
+    def error(self, value: Optional[str]) -> None:
+        self._error = value
+        self._exc = None
 
     @classmethod
     def ok(cls, data: Any) -> "QueryResult":
@@ -412,6 +584,9 @@ class QueryResult:
         """
         Create a QueryResult indicating no data was found.
 
+        ``QueryResult.not_found()`` returns a shared instance; treat it
+        as read-only.
+
         Returns:
             QueryResult with data=None and no error.
 
@@ -419,6 +594,8 @@ class QueryResult:
             result = QueryResult.not_found()
             print(result.found)  # False
         """
+        if cls is QueryResult:
+            return _NOT_FOUND
         return cls(data=None, error=None)
 
     @classmethod
@@ -437,6 +614,28 @@ class QueryResult:
         """
         return cls(data=None, error=error)
 
+    @classmethod
+    def fail_exc(cls, exc: BaseException) -> "QueryResult":
+        """
+        Create a failed QueryResult from an exception.
+
+        The error message is only built (via ``str(exc)``) if ``error``
+        is read.
+
+        Args:
+            exc: The exception that caused the failure.
+
+        Returns:
+            QueryResult with found=False.
+
+        Example:
+            result = QueryResult.fail_exc(TimeoutError("db timeout"))
+        """
+        result = cls(data=None)
+        result._exc = exc
+        result.found = False
+        return result
+
     def __repr__(self) -> str:
         if self.error:
             return f"QueryResult(error={self.error!r})"
@@ -445,6 +644,50 @@ class QueryResult:
         return "QueryResult(not_found)"
 
 
+_NOT_FOUND = QueryResult(data=None, error=None)
+
+_NO_HANDLER_CMD_FMT = "No handler registered for command: {}"
+_NO_HANDLER_QUERY_FMT = "No handler registered for query: {}"
+
+
+def _call_command_handler(handler: Callable, command: Command) -> CommandResult:
+    """Call a synchronous command handler and wrap its result."""
+    result = handler(command)
+    if isinstance(result, CommandResult):
+        return result
+    return CommandResult(True, result)
+
+
+def _call_command_handler_captured(handler: Callable, command: Command) -> CommandResult:
+    """Like _call_command_handler, but turns exceptions into failed results."""
+    try:
+        result = handler(command)
+    except Exception as e:
+        return CommandResult.fail_exc(e)
+    if isinstance(result, CommandResult):
+        return result
+    return CommandResult(True, result)
+
+
+def _call_query_handler(handler: Callable, query: Query) -> QueryResult:
+    """Call a synchronous query handler and wrap its result."""
+    result = handler(query)
+    if isinstance(result, QueryResult):
+        return result
+    return QueryResult(result)
+
+
+def _call_query_handler_captured(handler: Callable, query: Query) -> QueryResult:
+    """Like _call_query_handler, but turns exceptions into failed results."""
+    try:
+        result = handler(query)
+    except Exception as e:
+        return QueryResult.fail_exc(e)
+    if isinstance(result, QueryResult):
+        return result
+    return QueryResult(result)
+
+
 def command_handler(command_class: Type[Command]) -> Callable:
     """
     Decorator to mark an async function as a handler for a command type.
@@ -470,7 +713,7 @@ def command_handler(command_class: Type[Command]) -> Callable:
     def decorator(func: Callable) -> Callable:
         func._cello_command_handler = True
         func._cello_command_class = command_class
-        func._cello_command_type = command_class.__name__
+        func._cello_command_type = sys.intern(command_class.__name__)
         return func
     return decorator
 
@@ -502,7 +745,7 @@ def query_handler(query_class: Type[Query]) -> Callable:
     def decorator(func: Callable) -> Callable:
         func._cello_query_handler = True
         func._cello_query_class = query_class
-        func._cello_query_type = query_class.__name__
+        func._cello_query_type = sys.intern(query_class.__name__)
         return func
     return decorator
 
@@ -528,9 +771,24 @@ class CommandBus:
         print(result.success)  # True
     """
 
-    def __init__(self):
-        """Initialize the CommandBus with an empty handler registry."""
-        self._handlers: Dict[str, Callable] = {}
+    def __init__(self, capture_errors: bool = True):
+        """
+        Initialize the CommandBus with an empty handler registry.
+
+        Args:
+            capture_errors: Convert exceptions raised by handlers into
+                failed results (default: True). When False, handler
+                exceptions propagate to the caller unchanged.
+        """
+        # Maps command class to (handler, is_coroutine_function).
+        self._handlers: Dict[type, Tuple[Callable, bool]] = {}
+        # Pre-built "no handler" failures, one per unhandled command class.
+        self._missing: Dict[type, CommandResult] = {}
+        self.capture_errors = capture_errors
+        # Pick the sync call path once instead of branching per message.
+        self._dispatch_sync_impl = (
+            _call_command_handler_captured if capture_errors else _call_command_handler
+        )
 
     def register(self, command_type: Type[Command], handler: Callable) -> None:
         """
@@ -543,7 +801,9 @@ class CommandBus:
         Example:
             bus.register(CreateOrder, handle_create_order)
         """
-        self._handlers[command_type.__name__] = handler
+        self._handlers[command_type] = (
+            handler, inspect.iscoroutinefunction(handler)
+        )
 
     async def dispatch(self, command: Command) -> CommandResult:
         """
@@ -565,32 +825,152 @@ class CommandBus:
             if result.success:
                 print("Order created:", result.data)
         """
-        # Validate the command
-        try:
-            command.validate()
-        except (ValueError, TypeError) as e:
-            return CommandResult.rejected(str(e))
-
-        handler = self._handlers.get(command.command_type)
-        if handler is None:
-            return CommandResult.fail(
-                f"No handler registered for command: {command.command_type}"
+        # Validate the command (only if the class overrides validate())
+        if type(command)._has_validate:
+            try:
+                command.validate()
+            except (ValueError, TypeError) as e:
+                return CommandResult.rejected(str(e))
+
+        entry = self._handlers.get(type(command))
+        if entry is None:
+            return self._no_handler(type(command))
+
+        handler, is_coro = entry
+        if not is_coro:
+            return self._dispatch_sync_impl(handler, command)
+
+        if not self.capture_errors:
+            result = await handler(command)
+        else:
+            try:
+                result = await handler(command)
+            except Exception as e:
+                return CommandResult.fail_exc(e)
+        if isinstance(result, CommandResult):
+            return result
+        return CommandResult(True, result)
+
+    def dispatch_sync(self, command: Command) -> CommandResult:
+        """
+        Dispatch a command to a synchronous handler without awaiting.
+
+        Behaves like dispatch() but can be called outside an event loop
+        and never creates a coroutine.
+
+        Args:
+            command: The command instance to dispatch.
+
+        Returns:
+            CommandResult from the handler, or a failure result
+            if no handler is found or validation fails.
+
+        Raises:
+            TypeError: If the registered handler is a coroutine function.
+
+        Example:
+            result = bus.dispatch_sync(CreateOrder(items=["Widget"]))
+        """
+        if type(command)._has_validate:
+            try:
+                command.validate()
+            except (ValueError, TypeError) as e:
+                return CommandResult.rejected(str(e))
+
+        entry = self._handlers.get(type(command))
+        if entry is None:
+            return self._no_handler(type(command))
+
+        handler, is_coro = entry
+        if is_coro:
+            raise TypeError(
+                f"Handler for {type(command).__name__} is async; use dispatch()"
             )
+        return self._dispatch_sync_impl(handler, command)
 
-        try:
-            if inspect.iscoroutinefunction(handler):
-                result = await handler(command)
-            else:
-                result = handler(command)
+    async def dispatch_many(self, commands: List[Command]) -> List[CommandResult]:
+        """
+        Dispatch a batch of commands, running async handlers concurrently.
+
+        Commands are grouped by class so each handler is looked up once
+        per batch; async handlers are awaited together with
+        asyncio.gather(). Results are returned in input order. With
+        ``capture_errors=False`` the first handler exception propagates.
+
+        Args:
+            commands: The command instances to dispatch.
 
-            if isinstance(result, CommandResult):
-                return result
-            return CommandResult.ok(result)
-        except Exception as e:
-            return CommandResult.fail(str(e))
+        Returns:
+            One CommandResult per command, in the same order.
+
+        Example:
+            results = await bus.dispatch_many(
+                [CreateOrder(items=["A"]), CreateOrder(items=["B"])]
+            )
+        """
+        results: List[Optional[CommandResult]] = [None] * len(commands)
+        groups: Dict[type, List[int]] = {}
+        for index, command in enumerate(commands):
+            groups.setdefault(type(command), []).append(index)
+
+        pending = []
+        for cls, indices in groups.items():
+            # Validate before the handler lookup, as dispatch() does
+            if cls._has_validate:
+                valid = []
+                for index in indices:
+                    try:
+                        commands[index].validate()
+                    except (ValueError, TypeError) as e:
+                        results[index] = CommandResult.rejected(str(e))
+                    else:
+                        valid.append(index)
+                indices = valid
+
+            entry = self._handlers.get(cls)
+            if entry is None:
+                if indices:
+                    missing = self._no_handler(cls)
+                    for index in indices:
+                        results[index] = missing
+                continue
+
+            handler, is_coro = entry
+            for index in indices:
+                command = commands[index]
+                if is_coro:
+                    pending.append((index, self._dispatch_async_impl(handler, command)))
+                else:
+                    results[index] = self._dispatch_sync_impl(handler, command)
+
+        if pending:
+            done = await asyncio.gather(*(coro for _, coro in pending))
+            for (index, _), result in zip(pending, done, strict=True):
+                results[index] = result
+        return results
+
+    async def _dispatch_async_impl(self, handler: Callable, command: Command) -> CommandResult:
+        """Internal: await an async handler and wrap its result."""
+        if not self.capture_errors:
+            result = await handler(command)
+        else:
+            try:
+                result = await handler(command)
+            except Exception as e:
+                return CommandResult.fail_exc(e)
+        if isinstance(result, CommandResult):
+            return result
+        return CommandResult(True, result)
+
+    def _no_handler(self, cls: type) -> CommandResult:
+        """Internal: shared failure result for a command class without a handler."""
+        result = self._missing.get(cls)
+        if result is None:
+            result = self._missing[cls] = CommandResult.fail(_NO_HANDLER_CMD_FMT.format(cls.__name__))
+        return result
 
     def __repr__(self) -> str:
-        handler_types = list(self._handlers.keys())
+        handler_types = [cls.__name__ for cls in self._handlers]
         return f"CommandBus(handlers={handler_types})"
 
 
@@ -617,24 +997,134 @@ class QueryBus:
         result = await bus.execute(GetUser(user_id="123"))
         if result.found:
             print("User:", result.data)
+
+    Results of idempotent queries can be cached per bus. Cached results
+    are shared between callers and should be treated as read-only:
+
+        bus = QueryBus(cache_size=1024, cache_ttl=30)
+        bus.register(GetUser, handle_get_user, cacheable=True)
     """
 
-    def __init__(self):
-        """Initialize the QueryBus with an empty handler registry."""
-        self._handlers: Dict[str, Callable] = {}
+    def __init__(
+        self,
+        capture_errors: bool = True,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+    ):
+        """
+        Initialize the QueryBus with an empty handler registry.
 
-    def register(self, query_type: Type[Query], handler: Callable) -> None:
+        Args:
+            capture_errors: Convert exceptions raised by handlers into
+                failed results (default: True). When False, handler
+                exceptions propagate to the caller unchanged.
+            cache_size: Maximum number of cached results for query
+                types registered with ``cacheable=True`` (default: 0,
+                caching disabled).
+            cache_ttl: Seconds a cached result stays valid, or None to
+                keep it until evicted or invalidated (default: None).
+        """
+        # Maps query class to (handler, is_coroutine_function).
+        self._handlers: Dict[type, Tuple[Callable, bool]] = {}
+        # Pre-built "no handler" failures, one per unhandled query class.
+        self._missing: Dict[type, QueryResult] = {}
+        self.capture_errors = capture_errors
+        # Pick the sync call path once instead of branching per message.
+        self._execute_sync_impl = (
+            _call_query_handler_captured if capture_errors else _call_query_handler
+        )
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._cacheable: set = set()
+        # LRU of (query class, field items) -> (result, expires_at or None).
+        self._cache: "OrderedDict[tuple, Tuple[QueryResult, Optional[float]]]" = OrderedDict()
+
+    def register(
+        self,
+        query_type: Type[Query],
+        handler: Callable,
+        cacheable: bool = False,
+    ) -> None:
         """
         Register a handler for a query type.
 
         Args:
             query_type: The Query subclass to handle.
             handler: Async callable that processes the query.
+            cacheable: Cache successful results of this idempotent query,
+                keyed by the query's fields. Requires a bus created with
+                ``cache_size > 0``.
+
+        Raises:
+            ValueError: If cacheable is set on a bus without a cache.
 
         Example:
-            bus.register(GetOrder, handle_get_order)
+            bus.register(GetOrder, handle_get_order, cacheable=True)
+        """
+        if cacheable and self._cache_size <= 0:
+            raise ValueError("cacheable=True requires QueryBus(cache_size > 0)")
+        self._handlers[query_type] = (
+            handler, inspect.iscoroutinefunction(handler)
+        )
+        if cacheable:
+            self._cacheable.add(query_type)
+        else:
+            self._cacheable.discard(query_type)
+            self.invalidate(query_type)
+
+    def invalidate(self, query_type: Optional[Type[Query]] = None) -> None:
         """
-        self._handlers[query_type.__name__] = handler
+        Drop cached results.
+
+        Args:
+            query_type: Only drop results for this Query subclass, or
+                None to clear the whole cache.
+
+        Example:
+            bus.invalidate(GetOrder)
+        """
+        if query_type is None:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key[0] is query_type]:
+            del self._cache[key]
+
+    def _cache_key(self, query: Query) -> Optional[tuple]:
+        """Internal: cache key for a cacheable query, or None."""
+        cls = type(query)
+        if cls not in self._cacheable:
+            return None
+        d = query.__dict__
+        key = (cls, tuple(sorted(
+            (name, d[name]) for name in _user_fields(_layout_names(query))
+        )))
+        try:
+            hash(key)
+        except TypeError:
+            return None  # Unhashable field values are never cached
+        return key
+
+    def _cache_get(self, key: tuple) -> Optional[QueryResult]:
+        """Internal: return a live cached result and mark it recently used."""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        result, expires_at = cached
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: tuple, result: QueryResult) -> None:
+        """Internal: store a successful result, evicting the oldest entry."""
+        if result._error is not None or result._exc is not None:
+            return
+        expires_at = None if self._cache_ttl is None else time.monotonic() + self._cache_ttl
+        self._cache[key] = (result, expires_at)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
 
     async def execute(self, query: Query) -> QueryResult:
         """
@@ -655,35 +1145,166 @@ class QueryBus:
             if result.found:
                 print("Order:", result.data)
         """
-        handler = self._handlers.get(query.query_type)
-        if handler is None:
-            return QueryResult.fail(
-                f"No handler registered for query: {query.query_type}"
-            )
-
-        try:
-            if inspect.iscoroutinefunction(handler):
+        entry = self._handlers.get(type(query))
+        if entry is None:
+            return self._no_handler(type(query))
+
+        key = None
+        if self._cacheable:
+            key = self._cache_key(query)
+            if key is not None:
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return cached
+
+        handler, is_coro = entry
+        if not is_coro:
+            result = self._execute_sync_impl(handler, query)
+        else:
+            if not self.capture_errors:
                 result = await handler(query)
             else:
-                result = handler(query)
+                try:
+                    result = await handler(query)
+                except Exception as e:
+                    return QueryResult.fail_exc(e)
+            if not isinstance(result, QueryResult):
+                result = QueryResult(result)
+
+        if key is not None:
+            self._cache_put(key, result)
+        return result
+
+    def execute_sync(self, query: Query) -> QueryResult:
+        """
+        Execute a query through a synchronous handler without awaiting.
+
+        Behaves like execute() but can be called outside an event loop
+        and never creates a coroutine.
+
+        Args:
+            query: The query instance to execute.
+
+        Returns:
+            QueryResult from the handler, or a failure result
+            if no handler is found.
+
+        Raises:
+            TypeError: If the registered handler is a coroutine function.
+
+        Example:
+            result = bus.execute_sync(GetOrder(order_id="order-123"))
+        """
+        entry = self._handlers.get(type(query))
+        if entry is None:
+            return self._no_handler(type(query))
+
+        handler, is_coro = entry
+        if is_coro:
+            raise TypeError(
+                f"Handler for {type(query).__name__} is async; use execute()"
+            )
+
+        key = None
+        if self._cacheable:
+            key = self._cache_key(query)
+            if key is not None:
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return cached
+
+        result = self._execute_sync_impl(handler, query)
+        if key is not None:
+            self._cache_put(key, result)
+        return result
 
-            if isinstance(result, QueryResult):
-                return result
-            return QueryResult.ok(result)
-        except Exception as e:
-            return QueryResult.fail(str(e))
+    async def execute_many(self, queries: List[Query]) -> List[QueryResult]:
+        """
+        Execute a batch of queries, running async handlers concurrently.
+
+        Queries are grouped by class so each handler is looked up once
+        per batch; async handlers are awaited together with
+        asyncio.gather(). Cacheable query types go through execute() so
+        the result cache is honoured. Results are returned in input
+        order. With ``capture_errors=False`` the first handler exception
+        propagates.
+
+        Args:
+            queries: The query instances to execute.
+
+        Returns:
+            One QueryResult per query, in the same order.
+
+        Example:
+            results = await bus.execute_many(
+                [GetOrder(order_id="a"), GetOrder(order_id="b")]
+            )
+        """
+        results: List[Optional[QueryResult]] = [None] * len(queries)
+        groups: Dict[type, List[int]] = {}
+        for index, query in enumerate(queries):
+            groups.setdefault(type(query), []).append(index)
+
+        pending = []
+        for cls, indices in groups.items():
+            entry = self._handlers.get(cls)
+            if entry is None:
+                missing = self._no_handler(cls)
+                for index in indices:
+                    results[index] = missing
+                continue
+
+            handler, is_coro = entry
+            if cls in self._cacheable:
+                pending.extend((index, self.execute(queries[index])) for index in indices)
+            elif is_coro:
+                pending.extend(
+                    (index, self._execute_async_impl(handler, queries[index]))
+                    for index in indices
+                )
+            else:
+                for index in indices:
+                    results[index] = self._execute_sync_impl(handler, queries[index])
+
+        if pending:
+            done = await asyncio.gather(*(coro for _, coro in pending))
+            for (index, _), result in zip(pending, done, strict=True):
+                results[index] = result
+        return results
+
+    async def _execute_async_impl(self, handler: Callable, query: Query) -> QueryResult:
+        """Internal: await an async handler and wrap its result."""
+        if not self.capture_errors:
+            result = await handler(query)
+        else:
+            try:
+                result = await handler(query)
+            except Exception as e:
+                return QueryResult.fail_exc(e)
+        if isinstance(result, QueryResult):
+            return result
+        return QueryResult(result)
+
+    def _no_handler(self, cls: type) -> QueryResult:
+        """Internal: shared failure result for a query class without a handler."""
+        result = self._missing.get(cls)
+        if result is None:
+            result = self._missing[cls] = QueryResult.fail(_NO_HANDLER_QUERY_FMT.format(cls.__name__))
+        return result
 
     def __repr__(self) -> str:
-        handler_types = list(self._handlers.keys())
+        handler_types = [cls.__name__ for cls in self._handlers]
         return f"QueryBus(handlers={handler_types})"
 
 
+@dataclass(frozen=True, slots=True)
 class CqrsConfig:
     """
     Configuration for the CQRS subsystem.
 
     Controls event synchronization, timeouts, and retry behaviour
-    for command and query processing.
+    for command and query processing. Instances are immutable; use
+    ``dataclasses.replace()`` to derive a modified copy.
 
     Attributes:
         enable_event_sync: Whether to synchronize events between
@@ -704,31 +1325,7 @@ class CqrsConfig:
         )
     """
 
-    def __init__(
-        self,
-        enable_event_sync: bool = True,
-        command_timeout_ms: int = 5000,
-        query_timeout_ms: int = 3000,
-        max_retries: int = 3,
-    ):
-        """
-        Initialize CqrsConfig.
-
-        Args:
-            enable_event_sync: Synchronize events between sides (default: True).
-            command_timeout_ms: Command timeout in ms (default: 5000).
-            query_timeout_ms: Query timeout in ms (default: 3000).
-            max_retries: Maximum retry attempts (default: 3).
-        """
-        self.enable_event_sync: bool = enable_event_sync
-        self.command_timeout_ms: int = command_timeout_ms
-        self.query_timeout_ms: int = query_timeout_ms
-        self.max_retries: int = max_retries
-
-    def __repr__(self) -> str:
-        return (
-            f"CqrsConfig(enable_event_sync={self.enable_event_sync}, "
-            f"command_timeout_ms={self.command_timeout_ms}, "
-            f"query_timeout_ms={self.query_timeout_ms}, "
-            f"max_retries={self.max_retries})"
-        )
+    enable_event_sync: bool = True
+    command_timeout_ms: int = 5000
+    query_timeout_ms: int = 3000
+    max_retries: int = 3
@@ -23,11 +23,101 @@ Example:
         return {"success": True}
 """
 
+import asyncio
+import collections
+import contextvars
+import hashlib
+import inspect
+import itertools
+import re
+import weakref
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Sequence
 
+try:
+    import orjson
 
-def transactional(func: Callable) -> Callable:
+    # orjson encodes straight to bytes, which go on the wire unchanged
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+
+# How transactional calls a driver method: not at all, plainly (awaiting
+# the result only if it is awaitable), or as a coroutine function.
+_ABSENT, _SYNC, _ASYNC = 0, 1, 2
+
+# (driver type, method name) -> call kind, filled on first use.
+_METHOD_KINDS: dict = {}
+
+
+def _method_kind(obj: Any, name: str) -> int:
+    """
+    Return how to call ``obj.<name>()``.
+
+    The answer is cached per type, so known drivers cost one dict lookup
+    per call. Only methods attached to the instance rather than its class
+    are looked up each time.
+    """
+    cls = type(obj)
+    kind = _METHOD_KINDS.get((cls, name))
+    if kind is not None:
+        return kind
+    method = getattr(cls, name, None)
+    if method is None:
+        return _SYNC if callable(getattr(obj, name, None)) else _ABSENT
+    kind = _ASYNC if inspect.iscoroutinefunction(method) else _SYNC
+    _METHOD_KINDS[(cls, name)] = kind
+    return kind
+
+
+async def _call_method(obj: Any, name: str, kind: int, **kwargs) -> Any:
+    """Call ``obj.<name>(**kwargs)`` according to ``kind`` and return the result."""
+    if kind == _ASYNC:
+        return await getattr(obj, name)(**kwargs)
+    result = getattr(obj, name)(**kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+# Database -> connection of the transaction opened by ``transactional`` in
+# the current context. Statements sent through that Database reuse it.
+_bound_connections: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "cello_bound_connections", default=None
+)
+
+# Connections bound by ``transactional(readonly=True)``. They are not inside
+# a transaction, so cursors opened on them need their own BEGIN/COMMIT.
+_readonly_connections: contextvars.ContextVar[frozenset] = contextvars.ContextVar(
+    "cello_readonly_connections", default=frozenset()
+)
+
+# Database -> Semaphore capping connection checkouts for the current
+# request. Route handlers and ``transactional`` seed the dict before the
+# handler runs; tasks spawned by the request copy the context and share it.
+_request_leases: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "cello_request_leases", default=None
+)
+
+# transactional(isolation=...) values -> SQL isolation level
+_ISOLATION_LEVELS = {
+    "read_uncommitted": "READ UNCOMMITTED",
+    "read_committed": "READ COMMITTED",
+    "repeatable_read": "REPEATABLE READ",
+    "serializable": "SERIALIZABLE",
+}
+
+
+def transactional(
+    func: Optional[Callable] = None, *, readonly: bool = False, isolation: Optional[str] = None
+) -> Callable:
     """
     Decorator for automatic transaction management.
 
@@ -35,8 +125,18 @@ def transactional(func: Callable) -> Callable:
     On success, the transaction is committed.
     On exception, the transaction is rolled back.
 
+    With ``readonly=True`` no transaction is opened: the handler's
+    statements share one connection, taken from ``db.read_pool`` when
+    set, and each runs in its own implicit transaction. That saves the
+    ``BEGIN``/``COMMIT`` round trips but gives no snapshot across
+    statements.
+
     Args:
         func: The handler function to wrap.
+        readonly: Skip ``BEGIN``/``COMMIT`` for handlers that only read.
+        isolation: Isolation level for the transaction: ``"read_committed"``,
+                   ``"repeatable_read"``, ``"serializable"`` or
+                   ``"read_uncommitted"``. Defaults to the server's.
 
     Returns:
         Wrapped function with transaction management.
@@ -51,49 +151,345 @@ def transactional(func: Callable) -> Callable:
             return {"success": True}
             # Transaction auto-commits on success
             # Transaction auto-rollbacks on exception
+
+        @app.get("/report")
+        @transactional(readonly=True)
+        async def report(request, db=Depends("database")):
+            return await db.fetch_all("SELECT * FROM daily_totals")
     """
+    if isolation is not None and isolation not in _ISOLATION_LEVELS:
+        raise ValueError(f"Unknown isolation level: {isolation!r}")
+    if func is None:
+        return lambda f: transactional(f, readonly=readonly, isolation=isolation)
+
+    is_async = inspect.iscoroutinefunction(func)
+    begin_kwargs = {} if isolation is None else {"isolation": isolation}
+
     @wraps(func)
     async def wrapper(*args, **kwargs):
         # Look for db in kwargs (from DI) or request state
         db = kwargs.get("db") or kwargs.get("database")
 
         if db is None:
-            # Try to get from request state
-            for arg in args:
-                if hasattr(arg, "state") and hasattr(arg.state, "db"):
-                    db = arg.state.db
-                    break
+            # Handlers take the request as their first argument
+            try:
+                db = args[0].state.db
+            except (AttributeError, IndexError):
+                pass
+
+        if readonly:
+            if not isinstance(db, Database):
+                return await func(*args, **kwargs) if is_async else func(*args, **kwargs)
+            source = db.read_pool or db
+            leases_token = _request_leases.set({})
+            try:
+                conn = await source._checkout()
+                # Route the handler's statements to one read connection
+                bound = dict(_bound_connections.get() or ())
+                bound[db] = bound[source] = conn
+                bound_token = _bound_connections.set(bound)
+                readonly_token = _readonly_connections.set(_readonly_connections.get() | {conn})
+                try:
+                    return await func(*args, **kwargs) if is_async else func(*args, **kwargs)
+                finally:
+                    _readonly_connections.reset(readonly_token)
+                    _bound_connections.reset(bound_token)
+                    source._checkin(conn)
+            finally:
+                _request_leases.reset(leases_token)
+
+        begin = _ABSENT if db is None else _method_kind(db, "begin")
+        if not begin:
+            # No database available, just call the function
+            if is_async:
+                return await func(*args, **kwargs)
+            return func(*args, **kwargs)
 
-        if db is not None and hasattr(db, "begin"):
-            tx = await db.begin() if hasattr(db.begin, "__call__") else db.begin()
+        # Start a fresh checkout budget for this request
+        leases_token = _request_leases.set({})
+        try:
+            tx = await _call_method(db, "begin", begin, **begin_kwargs)
+            bound_token = None
+            if isinstance(tx, Transaction):
+                # Route db.execute() & co. to the transaction's connection
+                bound = dict(_bound_connections.get() or ())
+                bound[tx._db] = tx._conn
+                bound_token = _bound_connections.set(bound)
             try:
                 # Inject transaction into kwargs
                 kwargs["_transaction"] = tx
-                result = await func(*args, **kwargs) if _is_async(func) else func(*args, **kwargs)
-                if hasattr(tx, "commit"):
-                    commit = tx.commit()
-                    if hasattr(commit, "__await__"):
-                        await commit
+                result = await func(*args, **kwargs) if is_async else func(*args, **kwargs)
+                commit = _method_kind(tx, "commit")
+                if commit:
+                    await _call_method(tx, "commit", commit)
                 return result
             except Exception:
-                if hasattr(tx, "rollback"):
-                    rollback = tx.rollback()
-                    if hasattr(rollback, "__await__"):
-                        await rollback
+                rollback = _method_kind(tx, "rollback")
+                if rollback:
+                    await _call_method(tx, "rollback", rollback)
                 raise
-        else:
-            # No database available, just call the function
-            if _is_async(func):
-                return await func(*args, **kwargs)
-            return func(*args, **kwargs)
+            finally:
+                if bound_token is not None:
+                    _bound_connections.reset(bound_token)
+        finally:
+            _request_leases.reset(leases_token)
 
     return wrapper
 
 
-def _is_async(func: Callable) -> bool:
-    """Check if a function is async."""
-    import inspect
-    return inspect.iscoroutinefunction(func)
+def _request_scoped(handler: Callable) -> Callable:
+    """
+    Give each call of an async route handler its own checkout budget.
+
+    The lease dict is seeded before the handler runs, so tasks it fans
+    out with ``gather`` copy the same dict and share one Semaphore per
+    pool instead of each creating their own.
+    """
+    if not inspect.iscoroutinefunction(handler):
+        return handler
+
+    @wraps(handler)
+    async def wrapper(*args, **kwargs):
+        token = _request_leases.set({})
+        try:
+            return await handler(*args, **kwargs)
+        finally:
+            _request_leases.reset(token)
+
+    return wrapper
+
+
+async def _warm_pool(client: Any, count: int) -> None:
+    """
+    Open ``count`` pool connections concurrently.
+
+    All handshakes are started before any is awaited, so warm-up takes
+    about one round trip rather than ``count`` and the connections are
+    not all set up back to back on the same I/O resource.
+    """
+    await asyncio.gather(*[client._warm_connection() for _ in range(count)])
+
+
+# Suffixes for server-side cursor names, unique within the process.
+_cursor_ids = itertools.count()
+
+
+async def _iter_cursor(
+    conn: "_Connection", query: str, params: tuple, prefetch: int, as_tuple: bool
+) -> AsyncIterator:
+    """
+    Stream the rows of ``query`` through a server-side cursor on ``conn``.
+
+    Rows are fetched ``prefetch`` at a time, so at most one batch is held
+    in memory. ``conn`` must already be inside a transaction.
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+    name = f"_cello_cursor_{next(_cursor_ids)}"
+    await conn.execute(f"DECLARE {name} NO SCROLL CURSOR FOR {query}", *params)
+    try:
+        fetch = f"FETCH FORWARD {prefetch} FROM {name}"
+        while True:
+            rows = await conn.fetch_all(fetch, as_tuple=as_tuple)
+            for row in rows:
+                yield row
+            if len(rows) < prefetch:
+                break
+    except GeneratorExit:
+        # The consumer stopped early; the transaction is still usable
+        await conn.execute(f"CLOSE {name}")
+        raise
+    # Not reached on errors: the transaction may be aborted, so CLOSE would
+    # fail and replace the original exception. Ending it closes the cursor.
+    await conn.execute(f"CLOSE {name}")
+
+
+def _to_arrow_table(columns: Any) -> Any:
+    """Wrap a connection's columnar result in a ``pyarrow.Table``."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "fetch_arrow() requires pyarrow. Install it with: pip install pyarrow"
+        ) from None
+    # pyarrow.table() imports Arrow C stream exporters without copying
+    return pyarrow.table(columns)
+
+
+class _Connection:
+    """
+    One pooled database connection.
+
+    All statements sent through the same instance run in the same server
+    session, which is what makes a transaction's statements see each
+    other and lets the server reuse its prepared-statement cache.
+    """
+
+    async def execute(self, query: str, *params) -> int:
+        # Placeholder - real implementation runs on the Rust connection
+        return 0
+
+    async def execute_many(self, query: str, rows: list) -> int:
+        # Placeholder - real implementation prepares once and pipelines rows
+        return 0
+
+    async def fetch_all(self, query: str, *params, as_tuple: bool = False) -> list:
+        # Placeholder - real implementation runs on the Rust connection
+        return []
+
+    async def fetch_one(self, query: str, *params) -> Optional[dict]:
+        # Placeholder - real implementation decodes only the first row
+        return None
+
+    async def fetch_val(self, query: str, *params, column: int = 0) -> Any:
+        # Placeholder - real implementation decodes one column of one row
+        return None
+
+    async def fetch_arrow(self, query: str, *params) -> Any:
+        # Placeholder - real implementation decodes straight into Arrow
+        # column buffers and returns an object exporting __arrow_c_stream__
+        return {}
+
+    async def prepare(self, query: str) -> Any:
+        # Placeholder - real implementation sends Parse/Describe once and
+        # returns a handle holding the parameter and column types
+        return query
+
+    async def execute_prepared(self, stmt: Any, params: tuple) -> int:
+        # Placeholder - real implementation sends only Bind/Execute/Sync
+        return 0
+
+    async def fetch_prepared(
+        self, stmt: Any, params: tuple, as_tuple: bool = False, max_rows: int = 0
+    ) -> list:
+        # Placeholder - real implementation sends only Bind/Execute/Sync,
+        # asking for at most max_rows rows (0 = all)
+        return []
+
+
+class _ThreadedConnection(_Connection):
+    """
+    Async facade over a connection whose methods block.
+
+    Each call runs in a worker thread via ``asyncio.to_thread`` so a
+    synchronous driver never stalls the event loop.
+    """
+
+    def __init__(self, conn: Any):
+        self._conn = conn
+
+    async def execute(self, query: str, *params) -> int:
+        return await asyncio.to_thread(self._conn.execute, query, *params)
+
+    async def execute_many(self, query: str, rows: list) -> int:
+        return await asyncio.to_thread(self._conn.execute_many, query, rows)
+
+    async def fetch_all(self, query: str, *params, as_tuple: bool = False) -> list:
+        return await asyncio.to_thread(self._conn.fetch_all, query, *params, as_tuple=as_tuple)
+
+    async def fetch_one(self, query: str, *params) -> Optional[dict]:
+        return await asyncio.to_thread(self._conn.fetch_one, query, *params)
+
+    async def fetch_val(self, query: str, *params, column: int = 0) -> Any:
+        return await asyncio.to_thread(self._conn.fetch_val, query, *params, column=column)
+
+    async def fetch_arrow(self, query: str, *params) -> Any:
+        return await asyncio.to_thread(self._conn.fetch_arrow, query, *params)
+
+    async def prepare(self, query: str) -> Any:
+        return await asyncio.to_thread(self._conn.prepare, query)
+
+    async def execute_prepared(self, stmt: Any, params: tuple) -> int:
+        return await asyncio.to_thread(self._conn.execute_prepared, stmt, params)
+
+    async def fetch_prepared(
+        self, stmt: Any, params: tuple, as_tuple: bool = False, max_rows: int = 0
+    ) -> list:
+        return await asyncio.to_thread(
+            self._conn.fetch_prepared, stmt, params, as_tuple, max_rows
+        )
+
+
+_PLACEHOLDER_RE = re.compile(r"\$(\d+)")
+
+# Parameter count -> generated bind function, shared by all statements.
+_BINDERS: dict = {}
+
+
+def _compile_binder(count: int) -> Callable:
+    """
+    Generate a function taking exactly ``count`` positional parameters.
+
+    It returns them as a tuple, so a call with the wrong number of
+    parameters fails with a TypeError before anything is sent.
+    """
+    names = ", ".join(f"p{i}" for i in range(1, count + 1))
+    source = f"def bind({names}):\n    return ({names}{',' if count == 1 else ''})\n"
+    namespace: dict = {}
+    exec(source, namespace)
+    return namespace["bind"]
+
+
+class PreparedStatement:
+    """
+    A statement parsed once per connection and reused across calls.
+
+    Created by ``Database.prepare``. The server parses and plans the
+    query the first time the statement runs on each pooled connection;
+    later calls send only the parameters. Calls made inside a
+    ``transactional`` handler use the transaction's connection.
+
+    Example:
+        get_user = await db.prepare("SELECT * FROM users WHERE id = $1")
+        user = await get_user.fetch_one(user_id)
+    """
+
+    __slots__ = ("_db", "query", "param_count", "_bind", "_handles")
+
+    def __init__(self, db: "Database", query: str):
+        self._db = db
+        self.query = query
+        self.param_count = max(map(int, _PLACEHOLDER_RE.findall(query)), default=0)
+        bind = _BINDERS.get(self.param_count)
+        if bind is None:
+            bind = _BINDERS[self.param_count] = _compile_binder(self.param_count)
+        self._bind = bind
+        # connection -> driver statement handle
+        self._handles: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def _handle(self, conn: _Connection) -> Any:
+        handle = self._handles.get(conn)
+        if handle is None:
+            handle = self._handles[conn] = await conn.prepare(self.query)
+        return handle
+
+    async def execute(self, *params) -> int:
+        """Run the statement and return the number of affected rows."""
+        params = self._bind(*params)
+        conn = await self._db._acquire()
+        try:
+            return await conn.execute_prepared(await self._handle(conn), params)
+        finally:
+            self._db._release(conn)
+
+    async def fetch_all(self, *params, as_tuple: bool = False) -> list:
+        """Run the statement and return all rows."""
+        params = self._bind(*params)
+        conn = await self._db._acquire()
+        try:
+            return await conn.fetch_prepared(await self._handle(conn), params, as_tuple)
+        finally:
+            self._db._release(conn)
+
+    async def fetch_one(self, *params) -> Optional[dict]:
+        """Run the statement and return the first row, or None."""
+        params = self._bind(*params)
+        conn = await self._db._acquire()
+        try:
+            rows = await conn.fetch_prepared(await self._handle(conn), params, False, 1)
+        finally:
+            self._db._release(conn)
+        return rows[0] if rows else None
 
 
 class Database:
@@ -102,6 +498,13 @@ class Database:
 
     Wraps the Rust-powered connection pool with Pythonic methods.
 
+    A single request may hold at most ``per_request_limit`` pooled
+    connections at once; further checkouts wait for one of its own
+    connections to come back, so one request fanning out with
+    ``asyncio.gather`` cannot drain the pool for everyone else. Inside a
+    ``transactional`` handler every statement reuses the transaction's
+    connection.
+
     Example:
         db = Database(config)
         rows = await db.fetch_all("SELECT * FROM users")
@@ -109,18 +512,31 @@ class Database:
         await db.execute("INSERT INTO users (name) VALUES ($1)", name)
     """
 
+    # Maximum concurrent checkouts per request; None disables the cap.
+    per_request_limit: Optional[int] = 4
+
     def __init__(self, config=None):
         """Initialize database wrapper."""
         self._config = config
         self._pool = None
+        self._idle: list[_Connection] = []
+        # Database serving transactional(readonly=True) handlers, e.g. a replica
+        self.read_pool: Optional["Database"] = None
+        # id(connection) -> request Semaphore it was checked out under
+        self._leases: dict = {}
 
     @classmethod
-    async def connect(cls, config) -> "Database":
+    async def connect(cls, config, prewarm: bool = True) -> "Database":
         """
         Connect to the database and create a connection pool.
 
+        Unless ``prewarm`` is False, ``config.min_idle`` connections are
+        opened and validated with ``SELECT 1`` before returning, so the
+        first requests don't pay for TCP, TLS and authentication.
+
         Args:
             config: DatabaseConfig instance with connection parameters.
+            prewarm: Open the pool's idle connections eagerly.
 
         Returns:
             Connected Database instance.
@@ -128,9 +544,94 @@ class Database:
         instance = cls(config)
         # In a real implementation, this would call Rust to create the pool
         instance._pool = True  # Placeholder
+        if prewarm:
+            await _warm_pool(instance, getattr(config, "min_idle", 1))
         return instance
 
-    async def fetch_all(self, query: str, *params) -> list[dict]:
+    async def _open_connection(self) -> _Connection:
+        """Open a new connection."""
+        # Placeholder - real implementation connects through the Rust pool
+        return _Connection()
+
+    async def _new_connection(self) -> _Connection:
+        """
+        Open a new connection ready for use from the event loop.
+
+        A driver with blocking methods is wrapped once here, so async
+        drivers pay nothing per call.
+        """
+        conn = await self._open_connection()
+        if not inspect.iscoroutinefunction(type(conn).execute):
+            conn = _ThreadedConnection(conn)
+        return conn
+
+    async def _warm_connection(self) -> None:
+        """Open one connection, validate it with a round trip and pool it."""
+        conn = await self._new_connection()
+        await conn.execute("SELECT 1")
+        self._idle.append(conn)
+
+    def _bound_connection(self) -> Optional[_Connection]:
+        """Return the connection bound by ``transactional``, if any."""
+        bound = _bound_connections.get()
+        return bound.get(self) if bound else None
+
+    def _request_lease(self) -> Optional[asyncio.Semaphore]:
+        """Return the current request's checkout Semaphore for this pool."""
+        if self.per_request_limit is None:
+            return None
+        leases = _request_leases.get()
+        if leases is None:
+            leases = {}
+            _request_leases.set(leases)
+        lease = leases.get(self)
+        if lease is None:
+            lease = leases[self] = asyncio.Semaphore(self.per_request_limit)
+        return lease
+
+    async def _acquire(self) -> _Connection:
+        """Get a connection for one statement, preferring the bound one."""
+        conn = self._bound_connection()
+        if conn is not None:
+            return conn
+        return await self._checkout()
+
+    def _release(self, conn: _Connection) -> None:
+        """Give back a connection obtained from ``_acquire``."""
+        if conn is not self._bound_connection():
+            self._checkin(conn)
+
+    async def _checkout(self) -> _Connection:
+        """
+        Check a connection out of the pool.
+
+        Waits while the current request already holds
+        ``per_request_limit`` connections. Idle connections are reused
+        LIFO: the most recently released one has the warmest TCP window
+        and server-side caches.
+        """
+        lease = self._request_lease()
+        if lease is not None:
+            await lease.acquire()
+        try:
+            conn = self._idle.pop() if self._idle else await self._new_connection()
+        except BaseException:
+            if lease is not None:
+                lease.release()
+            raise
+        if lease is not None:
+            self._leases[id(conn)] = lease
+        return conn
+
+    def _checkin(self, conn: _Connection) -> None:
+        """Return a checked-out connection to the pool."""
+        lease = self._leases.pop(id(conn), None)
+        if lease is not None:
+            lease.release()
+        if self._pool is not None:
+            self._idle.append(conn)
+
+    async def fetch_all(self, query: str, *params, as_tuple: bool = False) -> list:
         """
         Execute a query and return all rows as dictionaries.
 
@@ -145,12 +646,17 @@ class Database:
             query: SQL query string with $1, $2 placeholders for parameters.
                    Never interpolate user input directly into this string.
             *params: Query parameters (positional, matching $1, $2, ... placeholders).
+            as_tuple: Return rows as tuples in column order instead of dicts,
+                      skipping per-row dict construction.
 
         Returns:
-            List of row dictionaries.
+            List of row dictionaries (or tuples with ``as_tuple=True``).
         """
-        # Placeholder - real implementation calls Rust pool
-        return []
+        conn = await self._acquire()
+        try:
+            return await conn.fetch_all(query, *params, as_tuple=as_tuple)
+        finally:
+            self._release(conn)
 
     async def fetch_one(self, query: str, *params) -> Optional[dict]:
         """
@@ -167,8 +673,123 @@ class Database:
         Returns:
             Row dictionary or None.
         """
-        rows = await self.fetch_all(query, *params)
-        return rows[0] if rows else None
+        conn = await self._acquire()
+        try:
+            return await conn.fetch_one(query, *params)
+        finally:
+            self._release(conn)
+
+    async def fetch_val(self, query: str, *params, column: int = 0) -> Any:
+        """
+        Execute a query and return one column of the first row.
+
+        Only that value is decoded; no row dictionary is built. Use it for
+        ``SELECT count(*)``, ``EXISTS`` and similar scalar queries.
+
+        SECURITY: Always use parameterized queries with $1, $2, ... placeholders.
+        Never use string formatting to build queries.
+
+        Args:
+            query: SQL query string with $1, $2 placeholders for parameters.
+                   Never interpolate user input directly into this string.
+            *params: Query parameters (positional, matching $1, $2, ... placeholders).
+            column: Index of the column to return.
+
+        Returns:
+            The value, or None if the query returned no rows.
+
+        Example:
+            count = await db.fetch_val("SELECT count(*) FROM users")
+        """
+        conn = await self._acquire()
+        try:
+            return await conn.fetch_val(query, *params, column=column)
+        finally:
+            self._release(conn)
+
+    async def fetch_arrow(self, query: str, *params) -> Any:
+        """
+        Execute a query and return the result as a columnar ``pyarrow.Table``.
+
+        Rows are never turned into Python objects: the driver fills Arrow
+        column buffers, which are handed over through the Arrow C Data
+        Interface. Use it for analytics and for feeding pandas or polars.
+        Requires ``pyarrow``.
+
+        SECURITY: Always use parameterized queries with $1, $2, ... placeholders.
+        Never use string formatting to build queries.
+
+        Args:
+            query: SQL query string with $1, $2 placeholders for parameters.
+                   Never interpolate user input directly into this string.
+            *params: Query parameters (positional, matching $1, $2, ... placeholders).
+
+        Returns:
+            ``pyarrow.Table`` with one column per result column.
+
+        Example:
+            df = (await db.fetch_arrow("SELECT * FROM events")).to_pandas()
+        """
+        conn = await self._acquire()
+        try:
+            columns = await conn.fetch_arrow(query, *params)
+        finally:
+            self._release(conn)
+        return _to_arrow_table(columns)
+
+    async def iter(
+        self, query: str, *params, prefetch: int = 1000, as_tuple: bool = False
+    ) -> AsyncIterator:
+        """
+        Execute a query and stream its rows through a server-side cursor.
+
+        Rows are fetched ``prefetch`` at a time, so memory stays bounded by
+        one batch however large the result is. Cursors need a transaction:
+        one is opened on a pooled connection for the duration of the
+        iteration and rolled back if it ends early. Inside
+        ``transactional(readonly=True)`` the bound connection is used with
+        ``BEGIN READ ONLY``. Use ``Transaction.iter`` to stream inside an
+        existing transaction.
+
+        SECURITY: Always use parameterized queries with $1, $2, ... placeholders.
+        Never use string formatting to build queries.
+
+        Args:
+            query: SQL query string with $1, $2 placeholders for parameters.
+                   Never interpolate user input directly into this string.
+            *params: Query parameters (positional, matching $1, $2, ... placeholders).
+            prefetch: Number of rows fetched per round trip.
+            as_tuple: Yield rows as tuples instead of dicts.
+
+        Yields:
+            Row dictionaries (or tuples with ``as_tuple=True``).
+
+        Example:
+            async for row in db.iter("SELECT * FROM events WHERE day = $1", day):
+                process(row)
+        """
+        conn = self._bound_connection()
+        if conn is not None and conn not in _readonly_connections.get():
+            async for row in _iter_cursor(conn, query, params, prefetch, as_tuple):
+                yield row
+            return
+        # A read-only binding runs without a transaction; open one around
+        # the cursor on the bound connection instead of checking one out.
+        checked_out = conn is None
+        if checked_out:
+            conn = await self._checkout()
+        try:
+            await conn.execute("BEGIN" if checked_out else "BEGIN READ ONLY")
+            try:
+                async for row in _iter_cursor(conn, query, params, prefetch, as_tuple):
+                    yield row
+            except BaseException:
+                await conn.execute("ROLLBACK")
+                raise
+            await conn.execute("COMMIT")
+        finally:
+            if checked_out:
+                self._checkin(conn)
 
     async def execute(self, query: str, *params) -> int:
         """
@@ -185,44 +806,145 @@ class Database:
         Returns:
             Number of affected rows.
         """
-        return 0
+        conn = await self._acquire()
+        try:
+            return await conn.execute(query, *params)
+        finally:
+            self._release(conn)
+
+    async def execute_many(self, query: str, params: Iterable[Sequence]) -> int:
+        """
+        Execute a query once per parameter set in a single batch.
+
+        The statement is prepared once and all parameter sets are sent
+        together, instead of one round trip per row.
+
+        SECURITY: Always use parameterized queries with $1, $2, ... placeholders.
+        Never use string formatting to build queries.
+
+        Args:
+            query: SQL query string with $1, $2 placeholders for parameters.
+                   Never interpolate user input directly into this string.
+            params: Iterable of parameter sequences, one per execution.
+
+        Returns:
+            Total number of affected rows.
+
+        Example:
+            await db.execute_many(
+                "INSERT INTO users (name, email) VALUES ($1, $2)",
+                [("Alice", "alice@example.com"), ("Bob", "bob@example.com")],
+            )
+        """
+        rows = [tuple(p) for p in params]
+        if not rows:
+            return 0
+        conn = await self._acquire()
+        try:
+            return await conn.execute_many(query, rows)
+        finally:
+            self._release(conn)
+
+    async def prepare(self, query: str) -> PreparedStatement:
+        """
+        Prepare a statement for repeated execution.
 
-    async def begin(self):
-        """Begin a transaction."""
-        return Transaction(self)
+        The query is parsed and planned once per pooled connection
+        instead of on every call, and the returned statement checks its
+        parameter count before sending anything.
+
+        SECURITY: Always use parameterized queries with $1, $2, ... placeholders.
+        Never use string formatting to build queries.
+
+        Args:
+            query: SQL query string with $1, $2 placeholders for parameters.
+
+        Returns:
+            PreparedStatement bound to this database.
+
+        Example:
+            insert = await db.prepare("INSERT INTO hits (path) VALUES ($1)")
+            await insert.execute("/home")
+        """
+        return PreparedStatement(self, query)
+
+    async def begin(self, isolation: Optional[str] = None) -> "Transaction":
+        """
+        Begin a transaction.
+
+        The transaction holds one pooled connection until it commits or
+        rolls back, so all of its statements run in the same session.
+
+        Args:
+            isolation: Isolation level, e.g. ``"serializable"`` (see
+                       ``transactional``). Defaults to the server's.
+        """
+        if isolation is None:
+            statement = "BEGIN"
+        elif isolation in _ISOLATION_LEVELS:
+            statement = f"BEGIN ISOLATION LEVEL {_ISOLATION_LEVELS[isolation]}"
+        else:
+            raise ValueError(f"Unknown isolation level: {isolation!r}")
+        conn = await self._checkout()
+        try:
+            await conn.execute(statement)
+        except BaseException:
+            self._checkin(conn)
+            raise
+        return Transaction(self, conn)
 
     async def close(self):
         """Close the connection pool."""
         self._pool = None
+        self._idle.clear()
 
 
 class Transaction:
     """
     Database transaction wrapper.
 
-    Provides commit/rollback semantics for a group of operations.
+    Provides commit/rollback semantics for a group of operations. Every
+    statement runs on the connection checked out by ``Database.begin``;
+    the connection goes back to the pool on commit or rollback.
     """
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, conn: _Connection):
         self._db = db
+        self._conn: Optional[_Connection] = conn
         self._committed = False
         self._rolled_back = False
 
+    def _connection(self) -> _Connection:
+        if self._conn is None:
+            raise RuntimeError("Transaction is already committed or rolled back")
+        return self._conn
+
     async def execute(self, query: str, *params) -> int:
         """Execute a query within this transaction.
 
         SECURITY: Always use parameterized queries ($1, $2, ...).
         Never interpolate user input directly into the query string.
         """
-        return await self._db.execute(query, *params)
+        return await self._connection().execute(query, *params)
+
+    async def execute_many(self, query: str, params: Iterable[Sequence]) -> int:
+        """Execute a query once per parameter set within this transaction.
+
+        SECURITY: Always use parameterized queries ($1, $2, ...).
+        Never interpolate user input directly into the query string.
+        """
+        rows = [tuple(p) for p in params]
+        if not rows:
+            return 0
+        return await self._connection().execute_many(query, rows)
 
-    async def fetch_all(self, query: str, *params) -> list[dict]:
+    async def fetch_all(self, query: str, *params, as_tuple: bool = False) -> list:
         """Fetch all rows within this transaction.
 
         SECURITY: Always use parameterized queries ($1, $2, ...).
         Never interpolate user input directly into the query string.
         """
-        return await self._db.fetch_all(query, *params)
+        return await self._connection().fetch_all(query, *params, as_tuple=as_tuple)
 
     async def fetch_one(self, query: str, *params) -> Optional[dict]:
         """Fetch a single row within this transaction.
@@ -230,14 +952,57 @@ class Transaction:
         SECURITY: Always use parameterized queries ($1, $2, ...).
         Never interpolate user input directly into the query string.
         """
-        return await self._db.fetch_one(query, *params)
+        return await self._connection().fetch_one(query, *params)
+
+    async def fetch_val(self, query: str, *params, column: int = 0) -> Any:
+        """Fetch one column of the first row within this transaction.
+
+        SECURITY: Always use parameterized queries ($1, $2, ...).
+        Never interpolate user input directly into the query string.
+        """
+        return await self._connection().fetch_val(query, *params, column=column)
+
+    async def fetch_arrow(self, query: str, *params) -> Any:
+        """Fetch the result as a ``pyarrow.Table`` within this transaction.
+
+        SECURITY: Always use parameterized queries ($1, $2, ...).
+        Never interpolate user input directly into the query string.
+        """
+        return _to_arrow_table(await self._connection().fetch_arrow(query, *params))
+
+    async def iter(
+        self, query: str, *params, prefetch: int = 1000, as_tuple: bool = False
+    ) -> AsyncIterator:
+        """Stream rows through a server-side cursor within this transaction.
+
+        SECURITY: Always use parameterized queries ($1, $2, ...).
+        Never interpolate user input directly into the query string.
+        """
+        async for row in _iter_cursor(self._connection(), query, params, prefetch, as_tuple):
+            yield row
 
     async def commit(self):
-        """Commit the transaction."""
+        """Commit the transaction and release its connection."""
+        conn = self._connection()
+        self._conn = None
+        try:
+            await conn.execute("COMMIT")
+        finally:
+            self._db._checkin(conn)
         self._committed = True
 
     async def rollback(self):
-        """Rollback the transaction."""
+        """Rollback the transaction and release its connection.
+
+        Does nothing if the transaction has already finished.
+        """
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            await conn.execute("ROLLBACK")
+        finally:
+            self._db._checkin(conn)
         self._rolled_back = True
 
     async def __aenter__(self):
@@ -246,109 +1011,416 @@ class Transaction:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
             await self.rollback()
-        elif not self._committed:
+        elif self._conn is not None:
             await self.commit()
         return False
 
 
-class Redis:
+class RedisError(Exception):
+    """Error reply returned by the Redis server."""
+
+
+class _Incomplete(Exception):
+    """Raised by ``_RespReader`` when a reply has not fully arrived."""
+
+
+# Returned by _RespReader.gets() when no complete reply is buffered.
+_NO_REPLY = object()
+
+
+class _RespReader:
     """
-    Redis client wrapper providing a convenient Python API.
+    Incremental RESP2 reply parser.
 
-    Wraps the Rust-powered Redis connection pool with Pythonic methods.
+    Bytes are ``feed``-ed as they arrive from the socket; ``gets`` returns
+    the next complete reply, or ``_NO_REPLY`` until enough has arrived.
+    Status replies become str, bulk strings bytes, errors ``RedisError``
+    instances and nil None.
+    """
 
-    Example:
-        redis = Redis(config)
-        await redis.set("key", "value", ttl=3600)
-        value = await redis.get("key")
-        await redis.delete("key")
+    def __init__(self):
+        self._buf = bytearray()
+        self._pos = 0
+
+    def feed(self, data: bytes) -> None:
+        if self._pos:
+            del self._buf[: self._pos]
+            self._pos = 0
+        self._buf += data
+
+    def gets(self) -> Any:
+        start = self._pos
+        try:
+            return self._parse()
+        except _Incomplete:
+            self._pos = start
+            return _NO_REPLY
+
+    def _parse(self) -> Any:
+        buf = self._buf
+        pos = self._pos
+        end = buf.find(b"\r\n", pos)
+        if end < 0:
+            raise _Incomplete
+        kind = buf[pos]
+        line = bytes(buf[pos + 1 : end])
+        self._pos = end + 2
+        if kind == 0x24:  # $ bulk string
+            size = int(line)
+            if size < 0:
+                return None
+            start = self._pos
+            if len(buf) < start + size + 2:
+                raise _Incomplete
+            self._pos = start + size + 2
+            return bytes(buf[start : start + size])
+        if kind == 0x2B:  # + status
+            return line.decode()
+        if kind == 0x3A:  # : integer
+            return int(line)
+        if kind == 0x2A:  # * array
+            count = int(line)
+            if count < 0:
+                return None
+            return [self._parse() for _ in range(count)]
+        if kind == 0x2D:  # - error
+            return RedisError(line.decode())
+        raise RedisError(f"Protocol error: unexpected reply type {chr(kind)!r}")
+
+
+def _encode_command(buf: bytearray, args: tuple, pos: Optional[int] = None) -> int:
     """
+    Write one command into ``buf`` as a RESP array of bulk strings.
 
-    def __init__(self, config=None):
-        """Initialize Redis wrapper."""
-        self._config = config
-        self._client = None
+    Writing starts at ``pos`` (default: the end of ``buf``) and
+    overwrites whatever a reused buffer held there, growing it only when
+    needed. Returns the offset just past the command.
+    """
+    if pos is None:
+        pos = len(buf)
+    head = b"*%d\r\n" % len(args)
+    end = pos + len(head)
+    buf[pos:end] = head
+    for arg in args:
+        if isinstance(arg, (bytes, bytearray, memoryview)):
+            data = arg
+        elif isinstance(arg, str):
+            data = arg.encode()
+        else:
+            data = str(arg).encode()
+        head = b"$%d\r\n" % len(data)
+        pos, end = end, end + len(head)
+        buf[pos:end] = head
+        pos, end = end, end + len(data)
+        buf[pos:end] = data
+        pos, end = end, end + 2
+        buf[pos:end] = b"\r\n"
+    return end
 
-    @classmethod
-    async def connect(cls, config) -> "Redis":
+
+def _encode_value(value: Any) -> Any:
+    """Pass strings, bytes and numbers through; JSON-encode anything else."""
+    if isinstance(value, (str, bytes, bytearray, memoryview, int, float)):
+        return value
+    return _json_dumps(value)
+
+
+def _decode_reply(reply: Any) -> Any:
+    """Decode a bulk-string reply to str."""
+    if isinstance(reply, (bytes, bytearray)):
+        return reply.decode()
+    return reply
+
+
+def _decode_items(reply: Any) -> list:
+    """Decode each bulk string of an array reply to str, keeping nils."""
+    return [_decode_reply(item) for item in reply or ()]
+
+
+def _load_json(reply: Any) -> Any:
+    """Parse a JSON bulk-string reply, keeping nil as None."""
+    if reply is None:
+        return None
+    return _json_loads(reply)
+
+
+# Send buffers kept per Redis client, and the largest one worth keeping.
+_BUF_POOL_SIZE = 8
+_BUF_MAX_KEEP = 1 << 20
+
+
+def _reply_ok(reply: Any) -> bool:
+    """Convert a status reply (``OK`` or nil) to a bool."""
+    return reply is not None
+
+
+def _reply_to_dict(reply: Any) -> dict:
+    """Convert a flat ``[field, value, ...]`` reply to a dict."""
+    if isinstance(reply, dict):
+        return reply
+    it = iter(reply or ())
+    return dict(zip(it, it, strict=True))
+
+
+def _decode_dict(reply: Any) -> dict:
+    """Convert a ``[field, value, ...]`` reply to a dict of str."""
+    if isinstance(reply, dict):
+        return {_decode_reply(k): _decode_reply(v) for k, v in reply.items()}
+    it = iter(_decode_items(reply))
+    return dict(zip(it, it, strict=True))
+
+
+def _empty_reply(args: tuple) -> list:
+    return []
+
+
+def _nil_per_key(args: tuple) -> list:
+    return [None] * (len(args) - 1)
+
+
+def _empty_scan(args: tuple) -> list:
+    return [b"0", []]
+
+
+# Replies returned while no server connection is wired up. Callables
+# build the reply from the command's arguments.
+_PLACEHOLDER_REPLIES = {
+    "PING": "PONG",
+    "SET": "OK",
+    "MSET": "OK",
+    "DEL": 1,
+    "EXISTS": 0,
+    "INCR": 0,
+    "DECR": 0,
+    "EXPIRE": 1,
+    "HSET": 1,
+    "MGET": _nil_per_key,
+    "HGETALL": _empty_reply,
+    "SCAN": _empty_scan,
+    "HSCAN": _empty_scan,
+    "LPUSH": 0,
+    "RPUSH": 0,
+    "LRANGE": _empty_reply,
+    "SADD": 0,
+    "SISMEMBER": 0,
+    "PUBLISH": 0,
+}
+
+
+def _expire_slot_waiter(slot: asyncio.Future) -> None:
+    """Fail a caller that waited longer than ``queue_timeout`` for a slot."""
+    if not slot.done():
+        slot.set_exception(asyncio.TimeoutError("Redis command queue is full"))
+
+
+def _resolve_replies(queue: list, replies: list) -> list:
+    """
+    Resolve queued ``(args, convert, future)`` entries with their replies.
+
+    Every Future is resolved: a converter that raises fails only its own
+    entry, and entries left without a reply fail with ``RedisError``.
+    """
+    results = []
+    for index, (_, convert, fut) in enumerate(queue):
+        if index < len(replies):
+            reply = replies[index]
+        else:
+            reply = RedisError(f"No reply: got {len(replies)} for {len(queue)} commands")
+        if convert is not None and not isinstance(reply, Exception):
+            try:
+                reply = convert(reply)
+            except Exception as e:
+                reply = e
+        if isinstance(reply, Exception):
+            if not fut.done():
+                fut.set_exception(reply)
+        elif not fut.done():
+            fut.set_result(reply)
+        results.append(reply)
+    return results
+
+
+class _RedisCommands:
+    """
+    Redis command methods shared by ``Redis`` and ``Pipeline``.
+
+    Each method builds the command's argument tuple and hands it to
+    ``self._command`` together with an optional reply converter. Values
+    written by any command are encoded like ``set`` encodes them. Read
+    commands decode bulk strings to str; pass ``decode=False`` for the
+    raw bytes. On
+    ``Redis`` each method is re-exposed as a coroutine function that
+    awaits the coalesced reply; ``Pipeline`` queues the command and
+    returns a Future.
+    """
+
+    def _command(self, args: tuple, convert: Optional[Callable] = None):
         """
-        Connect to Redis and create a connection pool.
+        Send or queue one command. Subclasses must override this.
 
         Args:
-            config: RedisConfig instance with connection parameters.
+            args: Command name followed by its arguments.
+            convert: Applied to the raw reply before it is returned.
 
         Returns:
-            Connected Redis instance.
+            An awaitable resolving to the (converted) reply.
         """
-        instance = cls(config)
-        instance._client = True  # Placeholder
-        return instance
+        raise NotImplementedError(f"{type(self).__name__} must implement _command()")
 
-    async def get(self, key: str) -> Optional[str]:
-        """Get a value by key."""
-        return None
+    def get(self, key: str, decode: bool = True) -> Optional[str]:
+        """Get a value by key; ``decode=False`` returns the raw bytes."""
+        return self._command(("GET", key), _decode_reply if decode else None)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Set a value with optional TTL in seconds.
+
+        Strings, bytes and numbers are stored as-is; other values are
+        stored as JSON (encoded with ``orjson`` when it is installed).
+        """
+        value = _encode_value(value)
+        if ttl is None:
+            return self._command(("SET", key, value), _reply_ok)
+        return self._command(("SET", key, value, "EX", ttl), _reply_ok)
+
+    def get_json(self, key: str) -> Any:
+        """
+        Get a JSON value stored with ``set_json``.
+
+        Returns:
+            The decoded value, or None if the key does not exist.
+        """
+        return self._command(("GET", key), _load_json)
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Set a value with optional TTL in seconds."""
-        return True
+    def set_json(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Store ``value`` as JSON with optional TTL in seconds.
+
+        Example::
+
+            await r.set_json("user:1", {"name": "Alice", "roles": ["admin"]})
+            user = await r.get_json("user:1")
+        """
+        data = _json_dumps(value)
+        if ttl is None:
+            return self._command(("SET", key, data), _reply_ok)
+        return self._command(("SET", key, data, "EX", ttl), _reply_ok)
+
+    def mset(self, mapping: dict) -> bool:
+        """
+        Set several keys in one command.
+
+        Args:
+            mapping: Keys and the values to store under them.
+
+        Returns:
+            True when the values were stored.
+
+        Example::
+
+            await r.mset({"user:1": "Alice", "user:2": "Bob"})
+        """
+        args = ["MSET"]
+        for key, value in mapping.items():
+            args.append(key)
+            args.append(_encode_value(value))
+        return self._command(tuple(args), _reply_ok)
 
-    async def delete(self, key: str) -> bool:
+    def mget(self, keys: Iterable[str], decode: bool = True) -> list:
+        """
+        Get several keys in one command.
+
+        Args:
+            keys: Keys to read.
+            decode: Return str values instead of bytes.
+
+        Returns:
+            Values in the order of ``keys``, None for missing keys.
+
+        Example::
+
+            alice, bob = await r.mget(["user:1", "user:2"])
+        """
+        return self._command(("MGET", *keys), _decode_items if decode else None)
+
+    def delete(self, key: str) -> bool:
         """Delete a key."""
-        return True
+        return self._command(("DEL", key), bool)
 
-    async def exists(self, key: str) -> bool:
+    def exists(self, key: str) -> bool:
         """Check if a key exists."""
-        return False
+        return self._command(("EXISTS", key), bool)
 
-    async def incr(self, key: str) -> int:
+    def incr(self, key: str) -> int:
         """Increment a key's integer value."""
-        return 0
+        return self._command(("INCR", key))
 
-    async def decr(self, key: str) -> int:
+    def decr(self, key: str) -> int:
         """Decrement a key's integer value."""
-        return 0
+        return self._command(("DECR", key))
 
-    async def expire(self, key: str, ttl: int) -> bool:
+    def expire(self, key: str, ttl: int) -> bool:
         """Set TTL on a key in seconds."""
-        return True
+        return self._command(("EXPIRE", key, ttl), bool)
 
-    async def hget(self, key: str, field: str) -> Optional[str]:
-        """Get a hash field value."""
-        return None
+    def hget(self, key: str, field: str, decode: bool = True) -> Optional[str]:
+        """Get a hash field value; ``decode=False`` returns the raw bytes."""
+        return self._command(("HGET", key, field), _decode_reply if decode else None)
 
-    async def hset(self, key: str, field: str, value: Any) -> bool:
+    def hset(self, key: str, field: str, value: Any) -> bool:
         """Set a hash field value."""
-        return True
+        return self._command(("HSET", key, field, _encode_value(value)), _reply_ok)
 
-    async def hgetall(self, key: str) -> dict:
-        """Get all fields from a hash."""
-        return {}
+    def hset_many(self, key: str, mapping: dict) -> int:
+        """
+        Set several hash fields in one ``HSET`` command.
+
+        Returns:
+            Number of fields that were newly added.
+
+        Example::
+
+            await r.hset_many("user:1", {"name": "Alice", "plan": "pro"})
+        """
+        args = ["HSET", key]
+        for field, value in mapping.items():
+            args.append(field)
+            args.append(_encode_value(value))
+        return self._command(tuple(args))
+
+    def hgetall(self, key: str, decode: bool = True) -> dict:
+        """Get all fields from a hash; ``decode=False`` keeps bytes."""
+        return self._command(("HGETALL", key), _decode_dict if decode else _reply_to_dict)
 
-    async def lpush(self, key: str, *values) -> int:
+    def lpush(self, key: str, *values) -> int:
         """Push values to the left of a list."""
-        return 0
+        return self._command(("LPUSH", key, *map(_encode_value, values)))
 
-    async def rpush(self, key: str, *values) -> int:
+    def rpush(self, key: str, *values) -> int:
         """Push values to the right of a list."""
-        return 0
+        return self._command(("RPUSH", key, *map(_encode_value, values)))
 
-    async def lpop(self, key: str) -> Optional[str]:
-        """Pop from the left of a list."""
-        return None
+    def lpop(self, key: str, decode: bool = True) -> Optional[str]:
+        """Pop from the left of a list; ``decode=False`` returns the raw bytes."""
+        return self._command(("LPOP", key), _decode_reply if decode else None)
 
-    async def lrange(self, key: str, start: int = 0, stop: int = -1) -> list:
-        """Get a range from a list."""
-        return []
+    def lrange(self, key: str, start: int = 0, stop: int = -1, decode: bool = True) -> list:
+        """Get a range from a list; ``decode=False`` keeps bytes."""
+        return self._command(("LRANGE", key, start, stop), _decode_items if decode else None)
 
-    async def sismember(self, key: str, member: str) -> bool:
+    def sadd(self, key: str, *members) -> int:
+        """Add members to a set; returns how many were not already present."""
+        return self._command(("SADD", key) + members)
+
+    def sismember(self, key: str, member: str) -> bool:
         """Check if member exists in a set."""
-        return False
+        return self._command(("SISMEMBER", key, member), bool)
 
-    async def publish(self, channel: str, message: str) -> int:
+    def publish(self, channel: str, message: str) -> int:
         """Publish a message to a channel."""
-        return 0
+        return self._command(("PUBLISH", channel, message))
 
-    async def eval(self, script: str, numkeys: int, *keys_and_args) -> Any:
+    def eval(self, script: str, numkeys: int, *keys_and_args) -> Any:
         """
         Execute a Lua script atomically on the server.
 
@@ -367,9 +1439,9 @@ class Redis:
                 1, "mykey", "myvalue"
             )
         """
-        return None
+        return self._command(("EVAL", script, numkeys) + keys_and_args)
 
-    async def evalsha(self, sha: str, numkeys: int, *keys_and_args) -> Any:
+    def evalsha(self, sha: str, numkeys: int, *keys_and_args) -> Any:
         """
         Execute a previously loaded Lua script by its SHA1 digest.
 
@@ -389,7 +1461,384 @@ class Redis:
             sha = await r.script_load("return 1")
             result = await r.evalsha(sha, 0)
         """
-        return None
+        return self._command(("EVALSHA", sha, numkeys) + keys_and_args)
+
+
+class Redis(_RedisCommands):
+    """
+    Redis client wrapper providing a convenient Python API.
+
+    Wraps the Rust-powered Redis connection pool with Pythonic methods.
+
+    Commands issued during the same event-loop iteration are coalesced
+    and sent in one batch, so concurrent callers share a round trip
+    without using ``pipeline()`` explicitly.
+
+    At most ``config.max_inflight`` commands are queued or awaiting a
+    reply at once. Further commands wait, in order, for a slot to free
+    up, and fail with ``asyncio.TimeoutError`` after
+    ``config.queue_timeout`` seconds if one is set.
+
+    Example:
+        redis = Redis(config)
+        await redis.set("key", "value", ttl=3600)
+        value = await redis.get("key")
+        await redis.delete("key")
+
+        # Several commands in one round trip
+        async with redis.pipeline() as pipe:
+            pipe.incr("hits")
+            pipe.get("last_seen")
+    """
+
+    def __init__(self, config=None):
+        """Initialize Redis wrapper."""
+        self._config = config
+        self._client = None
+        # Stream transport, when attached: a writer for encoded batches
+        # and the reader task that resolves them in order.
+        self._writer = None
+        self._reader_task: Optional[asyncio.Task] = None
+        # [future, reply count, replies so far] per batch awaiting replies
+        self._awaiting: collections.deque = collections.deque()
+        # Reused send buffers; each keeps its size, so encoding a batch
+        # overwrites it in place instead of allocating.
+        self._buf_pool: list[bytearray] = []
+        # Lua source -> Script, see register_script()
+        self._scripts: dict = {}
+        self._pending: list = []
+        self._flush_scheduled = False
+        self._flush_tasks: set = set()
+        self._blocking_io = not inspect.iscoroutinefunction(type(self)._round_trip)
+        self._max_inflight = getattr(config, "max_inflight", 10000)
+        self._queue_timeout = getattr(config, "queue_timeout", None)
+        self._inflight = 0
+        self._slot_waiters: collections.deque = collections.deque()
+
+    @classmethod
+    async def connect(cls, config, prewarm: bool = True) -> "Redis":
+        """
+        Connect to Redis and create a connection pool.
+
+        Unless ``prewarm`` is False, ``config.min_idle`` connections are
+        opened and validated with ``PING`` before returning.
+
+        Args:
+            config: RedisConfig instance with connection parameters.
+            prewarm: Open the pool's idle connections eagerly.
+
+        Returns:
+            Connected Redis instance.
+        """
+        instance = cls(config)
+        instance._client = True  # Placeholder
+        if prewarm:
+            await _warm_pool(instance, getattr(config, "min_idle", 1))
+        return instance
+
+    async def _warm_connection(self) -> None:
+        """Open one pool connection and validate it with ``PING``."""
+        # Sent directly rather than through _command so each PING gets
+        # its own connection instead of being coalesced into one batch.
+        reply = (await self._send([("PING",)]))[0]
+        if isinstance(reply, Exception):
+            raise reply
+
+    async def _send(self, commands: list) -> list:
+        """
+        Send a batch of commands in one write and return their replies.
+
+        All commands are encoded into a single RESP buffer, so a batch
+        costs one round trip however many commands it holds. Error
+        replies are returned as exception instances, in order. A
+        blocking ``_round_trip`` is run in a worker thread.
+
+        The buffer comes from a small per-client pool and is overwritten
+        in place, so steady traffic encodes without allocating one.
+        """
+        buf = self._buf_pool.pop() if self._buf_pool else bytearray()
+        end = 0
+        for args in commands:
+            end = _encode_command(buf, args, end)
+        view = memoryview(buf)[:end]
+        try:
+            if self._blocking_io:
+                replies = await asyncio.to_thread(self._round_trip, view, commands)
+            else:
+                replies = await self._round_trip(view, commands)
+        finally:
+            view.release()
+        # Replies mean the server read every byte, so the transport no
+        # longer references buf. After a failure it may, so buf is dropped.
+        self._release_buf(buf)
+        return replies
+
+    def _release_buf(self, buf: bytearray) -> None:
+        """Keep a send buffer for reuse unless the pool is full or it is huge."""
+        if len(buf) <= _BUF_MAX_KEEP and len(self._buf_pool) < _BUF_POOL_SIZE:
+            self._buf_pool.append(buf)
+
+    def _attach(self, reader: asyncio.StreamReader, writer: Any) -> None:
+        """
+        Send commands over a stream connection.
+
+        Batches are then only written; one reader task per connection
+        parses replies as they stream back and resolves batches in the
+        order they were written, so later batches can go out before
+        earlier replies arrive.
+        """
+        self._writer = writer
+        self._reader_task = asyncio.ensure_future(self._reader_loop(reader))
+
+    async def _reader_loop(self, reader: asyncio.StreamReader) -> None:
+        """Read replies and hand them to the oldest awaiting batches."""
+        parser = _RespReader()
+        awaiting = self._awaiting
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    raise ConnectionError("Redis connection closed")
+                parser.feed(data)
+                while awaiting:
+                    reply = parser.gets()
+                    if reply is _NO_REPLY:
+                        break
+                    entry = awaiting[0]
+                    entry[2].append(reply)
+                    if len(entry[2]) == entry[1]:
+                        awaiting.popleft()
+                        if not entry[0].done():
+                            entry[0].set_result(entry[2])
+        except BaseException as e:
+            self._writer = None
+            while awaiting:
+                fut = awaiting.popleft()[0]
+                if fut.done():
+                    continue
+                if isinstance(e, Exception):
+                    fut.set_exception(e)
+                else:
+                    fut.cancel()
+            if not isinstance(e, Exception):
+                raise
+
+    async def _round_trip(self, buf: memoryview, commands: list) -> list:
+        """Write an encoded batch and read one reply per command."""
+        if self._writer is not None:
+            fut = asyncio.get_running_loop().create_future()
+            self._awaiting.append([fut, len(commands), []])
+            self._writer.write(buf)
+            await self._writer.drain()
+            return await fut
+        # Placeholder - real implementation writes buf to the Rust
+        # connection in one call and reads one reply per command.
+        replies = []
+        for args in commands:
+            reply = _PLACEHOLDER_REPLIES.get(args[0])
+            replies.append(reply(args) if callable(reply) else reply)
+        return replies
+
+    def _command(self, args: tuple, convert: Optional[Callable] = None):
+        """
+        Queue a command for the next batch and return an awaitable reply.
+
+        While fewer than ``max_inflight`` commands are outstanding this
+        is a Future; otherwise a coroutine that first waits for a slot.
+        """
+        if self._inflight >= self._max_inflight or self._slot_waiters:
+            return self._command_when_free(args, convert)
+        self._inflight += 1
+        return self._enqueue(args, convert)
+
+    async def _command_when_free(self, args: tuple, convert: Optional[Callable]) -> Any:
+        """Wait for an in-flight slot, then queue the command."""
+        loop = asyncio.get_running_loop()
+        slot = loop.create_future()
+        self._slot_waiters.append(slot)
+        timer = None
+        if self._queue_timeout is not None:
+            timer = loop.call_later(self._queue_timeout, _expire_slot_waiter, slot)
+        try:
+            await slot
+        except BaseException:
+            # Cancelled after the slot was handed over: pass it on
+            if slot.done() and not slot.cancelled() and slot.exception() is None:
+                self._release_slots(1)
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+        return await self._enqueue(args, convert)
+
+    def _release_slots(self, count: int) -> None:
+        """Free ``count`` in-flight slots, handing each to the oldest waiter."""
+        waiters = self._slot_waiters
+        for _ in range(count):
+            while waiters:
+                slot = waiters.popleft()
+                if not slot.done():
+                    slot.set_result(None)
+                    break
+            else:
+                self._inflight -= 1
+
+    def _enqueue(self, args: tuple, convert: Optional[Callable]) -> asyncio.Future:
+        """
+        Queue a command for the next batch and return a Future for its reply.
+
+        The first command of an event-loop iteration schedules ``_flush``
+        with ``call_soon``; everything queued before it runs goes out in
+        the same write.
+        """
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending.append((args, convert, fut))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return fut
+
+    def _flush(self) -> None:
+        """Hand the commands queued this iteration to a send task."""
+        self._flush_scheduled = False
+        queue, self._pending = self._pending, []
+        if not queue:
+            return
+        task = asyncio.ensure_future(self._send_queue(queue))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send_queue(self, queue: list) -> None:
+        """Send one coalesced batch, resolve its Futures and free its slots."""
+        try:
+            replies = await self._send([args for args, _, _ in queue])
+        except BaseException as e:
+            for _, _, fut in queue:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        finally:
+            self._release_slots(len(queue))
+        _resolve_replies(queue, replies)
+
+    async def bulk_push(
+        self, key: str, values: Iterable, *, side: str = "r", chunk: int = 1000
+    ) -> int:
+        """
+        Push many values onto a list with one command per ``chunk`` values.
+
+        Uses the variadic ``RPUSH``/``LPUSH`` form instead of one command
+        per value. The chunk commands are issued together, so they share
+        a single round trip.
+
+        Args:
+            key: List key.
+            values: Values to push, in order.
+            side: ``"r"`` to append (``RPUSH``) or ``"l"`` to prepend (``LPUSH``).
+            chunk: Maximum values per command.
+
+        Returns:
+            Length of the list after the last push (0 if ``values`` is empty).
+
+        Example::
+
+            await r.bulk_push("events", events, chunk=500)
+        """
+        if side not in ("r", "l"):
+            raise ValueError("side must be 'r' or 'l'")
+        if chunk < 1:
+            raise ValueError("chunk must be at least 1")
+        push = self.rpush if side == "r" else self.lpush
+        values = tuple(values)
+        replies = await asyncio.gather(
+            *[push(key, *values[i : i + chunk]) for i in range(0, len(values), chunk)]
+        )
+        return replies[-1] if replies else 0
+
+    async def scan(
+        self, match: Optional[str] = None, count: int = 1000, decode: bool = True
+    ) -> AsyncIterator:
+        """
+        Iterate over keys with ``SCAN`` instead of a blocking ``KEYS``.
+
+        Each round trip returns about ``count`` keys, so the server is
+        never blocked for the whole keyspace and only one page is held
+        in memory. A key may be yielded more than once if the keyspace
+        is resized while iterating.
+
+        Args:
+            match: Glob-style pattern to filter keys.
+            count: Keys the server examines per call (a hint).
+            decode: Yield str instead of bytes.
+
+        Yields:
+            Matching keys.
+
+        Example::
+
+            async for key in r.scan(match="session:*"):
+                await r.delete(key)
+        """
+        args = ("COUNT", count) if match is None else ("MATCH", match, "COUNT", count)
+        cursor = 0
+        while True:
+            cursor, keys = await self._command(("SCAN", cursor) + args)
+            for key in keys:
+                yield _decode_reply(key) if decode else key
+            cursor = int(cursor)
+            if cursor == 0:
+                break
+
+    async def hscan(
+        self, key: str, match: Optional[str] = None, count: int = 1000, decode: bool = True
+    ) -> AsyncIterator:
+        """
+        Iterate over a hash's fields with ``HSCAN`` instead of ``HGETALL``.
+
+        Args:
+            key: Hash key.
+            match: Glob-style pattern to filter field names.
+            count: Fields the server examines per call (a hint).
+            decode: Yield str instead of bytes.
+
+        Yields:
+            ``(field, value)`` pairs.
+
+        Example::
+
+            async for field, value in r.hscan("user:1:settings"):
+                print(field, value)
+        """
+        args = ("COUNT", count) if match is None else ("MATCH", match, "COUNT", count)
+        cursor = 0
+        while True:
+            cursor, items = await self._command(("HSCAN", key, cursor) + args)
+            it = iter(items)
+            for field, value in zip(it, it, strict=True):
+                if decode:
+                    yield _decode_reply(field), _decode_reply(value)
+                else:
+                    yield field, value
+            cursor = int(cursor)
+            if cursor == 0:
+                break
+
+    def pipeline(self) -> "Pipeline":
+        """
+        Create a pipeline that sends queued commands in one round trip.
+
+        Returns:
+            Pipeline bound to this client.
+
+        Example::
+
+            async with r.pipeline() as pipe:
+                pipe.set("a", 1)
+                count = pipe.incr("counter")
+            print(count.result())
+        """
+        return Pipeline(self)
 
     async def script_load(self, script: str) -> str:
         """
@@ -414,9 +1863,203 @@ class Redis:
             \"\"\")
             result = await r.evalsha(sha, 2, "tokens", "queue", token, data)
         """
-        import hashlib
         return hashlib.sha1(script.encode()).hexdigest()
 
+    def register_script(self, script: str) -> "Script":
+        """
+        Wrap a Lua script for repeated execution by SHA1.
+
+        Calls send ``EVALSHA``, so a multi-step operation costs one round
+        trip and the source goes over the wire only if the server has
+        not cached it yet. Registering the same source twice returns the
+        same ``Script``.
+
+        Args:
+            script: Lua script source.
+
+        Returns:
+            Callable ``Script`` bound to this client.
+
+        Example::
+
+            pop_and_mark = r.register_script(\"\"\"
+                local v = redis.call('LPOP', KEYS[1])
+                if v then redis.call('SET', KEYS[2], v) end
+                return v
+            \"\"\")
+            job = await pop_and_mark(keys=["jobs", "current_job"])
+        """
+        found = self._scripts.get(script)
+        if found is None:
+            found = self._scripts[script] = Script(self, script)
+        return found
+
+    async def rate_limit_check(self, key: str, limit: int, window: int) -> bool:
+        """
+        Count a hit against a fixed-window rate limit in one round trip.
+
+        Args:
+            key: Counter key, e.g. ``"rl:<client-ip>"``.
+            limit: Hits allowed per window.
+            window: Window length in seconds.
+
+        Returns:
+            True if this hit is within the limit.
+        """
+        script = self.register_script(_RATE_LIMIT_SCRIPT)
+        return bool(await script(keys=[key], args=[limit, window]))
+
+    async def compare_and_set(self, key: str, old: Any, new: Any) -> bool:
+        """
+        Atomically set ``key`` to ``new`` if it currently holds ``old``.
+
+        Returns:
+            True if the value was replaced.
+        """
+        script = self.register_script(_COMPARE_AND_SET_SCRIPT)
+        return bool(await script(keys=[key], args=[old, new]))
+
     async def close(self):
         """Close the Redis connection pool."""
         self._client = None
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def _coroutine_command(method: Callable) -> Callable:
+    """Expose a shared command method as a coroutine function on ``Redis``."""
+    @wraps(method)
+    async def command(self, *args, **kwargs):
+        return await method(self, *args, **kwargs)
+    return command
+
+
+# Pipeline methods return the queued Future synchronously; on Redis they
+# stay ``async def`` so create_task(), asyncio.run() and introspection work.
+for _name, _method in list(vars(_RedisCommands).items()):
+    if not _name.startswith("_") and _name not in vars(Redis):
+        setattr(Redis, _name, _coroutine_command(_method))
+del _name, _method
+
+
+_RATE_LIMIT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then redis.call('EXPIRE', KEYS[1], ARGV[2]) end
+if count > tonumber(ARGV[1]) then return 0 end
+return 1
+"""
+
+_COMPARE_AND_SET_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+
+class Script:
+    """
+    Lua script executed by SHA1 with ``EVALSHA``.
+
+    The digest is computed locally. If the server answers ``NOSCRIPT``
+    (first use, restart or ``SCRIPT FLUSH``) the call is retried once
+    with ``EVAL``, which also caches the script for later calls.
+
+    Example:
+        incr_capped = redis.register_script(
+            "local n = redis.call('INCR', KEYS[1]) "
+            "if n > tonumber(ARGV[1]) then redis.call('SET', KEYS[1], ARGV[1]) end "
+            "return n"
+        )
+        await incr_capped(keys=["counter"], args=[100])
+    """
+
+    __slots__ = ("_redis", "source", "sha")
+
+    def __init__(self, redis: "Redis", source: str):
+        self._redis = redis
+        self.source = source
+        self.sha = hashlib.sha1(source.encode()).hexdigest()
+
+    async def __call__(self, keys: Sequence = (), args: Sequence = ()) -> Any:
+        """Run the script with ``KEYS`` and ``ARGV`` and return its result."""
+        try:
+            return await self._redis.evalsha(self.sha, len(keys), *keys, *args)
+        except RedisError as e:
+            if not str(e).startswith("NOSCRIPT"):
+                raise
+        return await self._redis.eval(self.source, len(keys), *keys, *args)
+
+
+class Pipeline(_RedisCommands):
+    """
+    Batch of Redis commands sent in a single round trip.
+
+    Command methods have the same signatures as on ``Redis`` but only
+    queue the command and return a Future for its reply. The queue is
+    flushed by ``execute()`` or on leaving an ``async with`` block.
+
+    Example:
+        async with redis.pipeline() as pipe:
+            pipe.set("user:1", "Alice")
+            name = pipe.get("user:1")
+        print(name.result())
+
+        pipe = redis.pipeline()
+        pipe.incr("a")
+        pipe.incr("b")
+        a, b = await pipe.execute()
+    """
+
+    def __init__(self, redis: Redis):
+        self._redis = redis
+        self._queue: list = []
+
+    def _command(self, args: tuple, convert: Optional[Callable] = None) -> asyncio.Future:
+        """Queue a command and return a Future for its converted reply."""
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.append((args, convert, fut))
+        return fut
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    async def execute(self) -> list:
+        """
+        Send all queued commands and resolve their Futures.
+
+        Returns:
+            Converted replies in the order the commands were queued.
+            Error replies appear as exception instances.
+        """
+        queue, self._queue = self._queue, []
+        if not queue:
+            return []
+        try:
+            replies = await self._redis._send([args for args, _, _ in queue])
+        except BaseException:
+            for _, _, fut in queue:
+                fut.cancel()
+            raise
+        return _resolve_replies(queue, replies)
+
+    def reset(self) -> None:
+        """Discard queued commands without sending them."""
+        queue, self._queue = self._queue, []
+        for _, _, fut in queue:
+            fut.cancel()
+
+    async def __aenter__(self) -> "Pipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.execute()
+        else:
+            self.reset()
+        return False
@@ -64,9 +64,13 @@ Example:
         await app.state.event_store.close()
 """
 
+import operator
+import sys
 import time
 import uuid
-from typing import Any, Callable, Dict, List, Optional
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional
 
 
 def event_handler(event_type: str) -> Callable:
@@ -97,11 +101,45 @@ def event_handler(event_type: str) -> Callable:
     """
     def decorator(func: Callable) -> Callable:
         func._cello_event_handler = True
-        func._cello_event_type = event_type
+        # sys.intern() only accepts exact str; str-based enums are kept as is
+        func._cello_event_type = (
+            sys.intern(event_type) if type(event_type) is str else event_type
+        )
         return func
     return decorator
 
 
+# Shared read-only metadata for events created without any, so each
+# event does not allocate its own empty dict.
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _new_id() -> str:
+    """Return a random UUID4 as 32 hex digits (no dash formatting)."""
+    return uuid.uuid4().hex
+
+
+def _compile_json(cls: type, **exprs: str) -> Callable:
+    """
+    Generate a ``json`` method serializing every slot of ``cls``.
+
+    The generated function builds the result in a single dict literal
+    straight from the slot attributes, so the serialized keys always
+    follow ``__slots__``. ``exprs`` replaces the value expression for
+    individual slots. The hand-written method's docstring is kept.
+    """
+    items = ", ".join(
+        f"{name!r}: {exprs.get(name, f'self.{name}')}" for name in cls.__slots__
+    )
+    source = f"def json(self):\n    return {{{items}}}\n"
+    namespace: Dict[str, Any] = {"_EMPTY_METADATA": _EMPTY_METADATA}
+    exec(source, namespace)
+    fn = namespace["json"]
+    fn.__qualname__ = f"{cls.__qualname__}.json"
+    fn.__doc__ = cls.json.__doc__
+    return fn
+
+
 class Event:
     """
     Represents a domain event in the event sourcing system.
@@ -111,11 +149,13 @@ class Event:
     an aggregate identified by aggregate_id.
 
     Attributes:
-        id: Unique event identifier (auto-generated UUID).
+        id: Unique event identifier (UUID4 hex from ``_id_factory``).
         event_type: String identifying the type of event.
         aggregate_id: ID of the aggregate this event belongs to.
         data: Dictionary of event payload data.
-        metadata: Optional dictionary of additional metadata.
+        metadata: Dictionary of additional metadata. Events created without
+            metadata share one read-only empty mapping; pass a dict to
+            attach metadata after construction.
         version: Event version number (starts at 0).
         timestamp: Unix timestamp when the event was created.
 
@@ -129,12 +169,21 @@ class Event:
         print(event.json())
     """
 
+    __slots__ = (
+        "id", "event_type", "aggregate_id", "data", "metadata", "version", "timestamp",
+    )
+
+    #: Zero-argument callable producing new event IDs; override on a
+    #: subclass to plug in e.g. a UUIDv7 or ULID generator.
+    _id_factory: ClassVar[Callable[[], str]] = staticmethod(_new_id)
+
     def __init__(
         self,
         event_type: str,
         data: Dict[str, Any],
         aggregate_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[float] = None,
     ):
         """
         Initialize a new Event.
@@ -144,14 +193,25 @@ class Event:
             data: Dictionary of event payload data.
             aggregate_id: ID of the aggregate this event belongs to.
             metadata: Optional dictionary of additional metadata.
+            timestamp: Optional creation time. Defaults to ``time.time()``;
+                pass one clock reading to stamp a whole batch of events.
+
+        Example:
+            now = time.time()
+            events = [Event("ItemAdded", item, timestamp=now) for item in items]
         """
-        self.id: str = str(uuid.uuid4())
-        self.event_type: str = event_type
+        self.id: str = self._id_factory()
+        # Interned so handler-map lookups match keys by identity
+        self.event_type: str = (
+            sys.intern(event_type) if type(event_type) is str else event_type
+        )
         self.aggregate_id: Optional[str] = aggregate_id
         self.data: Dict[str, Any] = data
-        self.metadata: Dict[str, Any] = metadata or {}
+        self.metadata: Mapping[str, Any] = (
+            _EMPTY_METADATA if metadata is None else metadata
+        )
         self.version: int = 0
-        self.timestamp: float = time.time()
+        self.timestamp: float = time.time() if timestamp is None else timestamp
 
     def json(self) -> Dict[str, Any]:
         """
@@ -183,6 +243,17 @@ class Event:
         )
 
 
+# The shared empty metadata is a mappingproxy; emit a real dict so the
+# result stays JSON-serializable.
+Event.json = _compile_json(
+    Event,
+    metadata="{} if self.metadata is _EMPTY_METADATA else self.metadata",
+)
+
+# Reads every slot of an event as one tuple, in ``__slots__`` order.
+_event_row = operator.attrgetter(*Event.__slots__)
+
+
 class Aggregate:
     """
     Base class for event-sourced aggregates.
@@ -196,7 +267,7 @@ class Aggregate:
     methods named ``_handle_<event_type>`` are discovered automatically.
 
     Attributes:
-        id: Unique aggregate identifier (auto-generated UUID).
+        id: Unique aggregate identifier (UUID4 hex unless given).
         version: Current version of the aggregate.
         state: Dictionary holding the aggregate's current state.
         uncommitted_events: List of events not yet persisted.
@@ -223,30 +294,52 @@ class Aggregate:
         print(account.state)  # {"balance": 1000, "owner": "Alice"}
     """
 
+    #: Zero-argument callable producing IDs for new aggregates.
+    _id_factory: ClassVar[Callable[[], str]] = staticmethod(_new_id)
+
+    #: Upper bound on pending events; applying past it raises RuntimeError,
+    #: which surfaces a missing ``clear_uncommitted`` early. None disables.
+    max_uncommitted: ClassVar[Optional[int]] = None
+
+    # event_type -> name of the handler method, built per subclass
+    _cello_handler_map: ClassVar[Dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve each name as attribute lookup would (subclasses win),
+        # reading class dicts directly so no descriptor is triggered.
+        attrs: Dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            attrs.update(vars(klass))
+        handlers = {
+            attr._cello_event_type: name
+            for name, attr in attrs.items()
+            if callable(attr)
+            and getattr(attr, "_cello_event_handler", False)
+            and getattr(attr, "_cello_event_type", None)
+        }
+        # _handle_<event_type> methods serve types with no decorated handler
+        for name, attr in attrs.items():
+            if name.startswith("_handle_") and callable(attr):
+                handlers.setdefault(sys.intern(name[len("_handle_"):]), name)
+        cls._cello_handler_map = handlers
+
     def __init__(self, aggregate_id: Optional[str] = None):
         """
         Initialize a new Aggregate.
 
         Args:
-            aggregate_id: Optional aggregate ID. If None, a UUID is generated.
+            aggregate_id: Optional aggregate ID. If None, one is generated
+                by ``_id_factory``. String IDs are interned, so repeated
+                appends for the same aggregate share one key object.
         """
-        self.id: str = aggregate_id or str(uuid.uuid4())
+        if type(aggregate_id) is str:
+            aggregate_id = sys.intern(aggregate_id)
+        self.id: str = aggregate_id or self._id_factory()
         self.version: int = 0
         self.state: Dict[str, Any] = {}
         self.uncommitted_events: List[Event] = []
 
-        # Build event handler registry from decorated methods
-        self._event_handlers: Dict[str, Callable] = {}
-        for attr_name in dir(self):
-            try:
-                attr = getattr(self, attr_name)
-            except AttributeError:
-                continue
-            if callable(attr) and getattr(attr, "_cello_event_handler", False):
-                event_type = getattr(attr, "_cello_event_type", None)
-                if event_type:
-                    self._event_handlers[event_type] = attr
-
     def apply(self, event: Event) -> None:
         """
         Apply an event to this aggregate.
@@ -262,32 +355,92 @@ class Aggregate:
         Args:
             event: The event to apply.
 
+        Raises:
+            RuntimeError: If ``max_uncommitted`` events are already pending.
+
         Example:
             order = OrderAggregate()
             event = Event("OrderCreated", {"total": 42.00})
             order.apply(event)
             assert len(order.uncommitted_events) == 1
         """
+        if self.max_uncommitted is not None:
+            self._check_uncommitted(1)
+
         # Set event version and aggregate_id
         event.version = self.version + 1
         if event.aggregate_id is None:
             event.aggregate_id = self.id
 
-        # Look for decorated handler first
-        handler = self._event_handlers.get(event.event_type)
-
-        # Fall back to _handle_<event_type> convention
-        if handler is None:
-            handler_name = f"_handle_{event.event_type}"
-            handler = getattr(self, handler_name, None)
-
-        if handler is not None:
-            handler(event)
+        name = self._cello_handler_map.get(event.event_type)
+        if name is not None:
+            getattr(self, name)(event)
 
         self.uncommitted_events.append(event)
         self.version = event.version
 
-    def load_from_events(self, events: List[Event]) -> None:
+    def apply_many(self, events: List[Event]) -> None:
+        """
+        Apply several events in order, as repeated ``apply`` calls would.
+
+        Handler lookups are resolved once per event type for the batch,
+        which makes this cheaper than calling ``apply`` in a loop for
+        commands that emit many events.
+
+        Args:
+            events: Ordered list of events to apply.
+
+        Raises:
+            RuntimeError: If the batch would exceed ``max_uncommitted``;
+                no event is applied in that case.
+
+        Example:
+            cart = CartAggregate()
+            cart.apply_many([
+                Event("ItemAdded", {"sku": "A-1"}),
+                Event("ItemAdded", {"sku": "B-2"}),
+            ])
+            assert cart.version == 2
+        """
+        if self.max_uncommitted is not None:
+            self._check_uncommitted(len(events))
+
+        handler_map = self._cello_handler_map
+        handlers: Dict[str, Optional[Callable]] = {}
+        record = self.uncommitted_events.append
+        aggregate_id = self.id
+        version = self.version
+        for event in events:
+            version += 1
+            event.version = version
+            if event.aggregate_id is None:
+                event.aggregate_id = aggregate_id
+
+            event_type = event.event_type
+            try:
+                handler = handlers[event_type]
+            except KeyError:
+                name = handler_map.get(event_type)
+                handler = handlers[event_type] = None if name is None else getattr(self, name)
+            if handler is not None:
+                handler(event)
+
+            record(event)
+            # Kept per event: handlers see the version before their event
+            self.version = version
+
+    def _check_uncommitted(self, incoming: int) -> None:
+        if len(self.uncommitted_events) + incoming > self.max_uncommitted:
+            raise RuntimeError(
+                f"{type(self).__name__} {self.id!r} has "
+                f"{len(self.uncommitted_events)} uncommitted events "
+                f"(max_uncommitted={self.max_uncommitted}); "
+                f"persist them and call clear_uncommitted()"
+            )
+
+    def load_from_events(
+        self, events: List[Event], snapshot: Optional["Snapshot"] = None
+    ) -> None:
         """
         Rebuild aggregate state by replaying a list of events.
 
@@ -301,6 +454,9 @@ class Aggregate:
 
         Args:
             events: Ordered list of events to replay.
+            snapshot: Optional snapshot to start from. Its state is copied
+                and ``events`` must continue from its version, which lets
+                streams pruned by ``max_events`` be rebuilt.
 
         Raises:
             ValueError: If event versions are not sequential.
@@ -311,42 +467,51 @@ class Aggregate:
             order.load_from_events(events)
             print(order.state)
         """
-        self.state = {}
-        self.version = 0
-
+        if snapshot is None:
+            self.state = {}
+            version = 0
+        else:
+            self.state = dict(snapshot.state)
+            version = snapshot.version
+        self.version = version
+
+        handler_map = self._cello_handler_map
+        # event_type -> bound handler (or None), resolved once per replay
+        handlers: Dict[str, Optional[Callable]] = {}
         for event in events:
-            expected_version = self.version + 1
-            if event.version != expected_version:
+            version += 1
+            if event.version != version:
                 raise ValueError(
-                    f"Event version out of order: expected {expected_version}, "
+                    f"Event version out of order: expected {version}, "
                     f"got {event.version} (event_type={event.event_type!r}, "
                     f"aggregate_id={self.id!r})"
                 )
 
-            # Look for decorated handler first
-            handler = self._event_handlers.get(event.event_type)
-
-            # Fall back to _handle_<event_type> convention
-            if handler is None:
-                handler_name = f"_handle_{event.event_type}"
-                handler = getattr(self, handler_name, None)
-
+            event_type = event.event_type
+            try:
+                handler = handlers[event_type]
+            except KeyError:
+                name = handler_map.get(event_type)
+                handler = handlers[event_type] = None if name is None else getattr(self, name)
             if handler is not None:
                 handler(event)
 
-            self.version = event.version
+            # Kept per event: handlers may read the aggregate's version
+            self.version = version
 
     def clear_uncommitted(self) -> None:
         """
         Clear the list of uncommitted events.
 
         Call this after successfully persisting events to the event store.
+        The list is emptied in place, so keep a copy if you still need the
+        events afterwards.
 
         Example:
             await event_store.append(aggregate.id, aggregate.uncommitted_events)
             aggregate.clear_uncommitted()
         """
-        self.uncommitted_events = []
+        self.uncommitted_events.clear()
 
     def get_version(self) -> int:
         """
@@ -388,6 +553,8 @@ class Snapshot:
         await event_store.save_snapshot(snapshot)
     """
 
+    __slots__ = ("aggregate_id", "version", "state", "timestamp")
+
     def __init__(
         self,
         aggregate_id: str,
@@ -452,6 +619,14 @@ class EventStore:
         await store.close()
     """
 
+    #: Operations that need a connection. While connected, each one is
+    #: shadowed on the instance by its unguarded ``_<name>`` wrapper, so the
+    #: hot path skips the ``connected`` check. The in-memory work itself
+    #: lives in plain ``_<name>_sync`` methods; the coroutines only wrap it.
+    _GUARDED: ClassVar[tuple] = (
+        "append", "get_events", "get_events_raw", "save_snapshot", "get_snapshot",
+    )
+
     def __init__(self, config: Optional["EventSourcingConfig"] = None):
         """
         Initialize the EventStore.
@@ -462,11 +637,23 @@ class EventStore:
             config: Optional EventSourcingConfig. Defaults to in-memory storage.
         """
         self.config: "EventSourcingConfig" = config or EventSourcingConfig()
-        self.connected: bool = False
+        self.connected = False
 
         # Internal dict-based storage for testing/development
-        self._events: Dict[str, List[Event]] = {}
+        # defaultdicts so append() creates a stream in the same lookup;
+        # readers use .get() and never create one.
+        self._events: Dict[str, List[Event]] = defaultdict(list)
+        # Serialized form of the stored events, filled on first read by
+        # get_events_raw. Always a prefix of the matching ``_events`` list.
+        self._rows: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         self._snapshots: Dict[str, Snapshot] = {}
+        # Last version assigned per stream. Kept apart from the events
+        # because pruning may drop every stored event of a stream.
+        self._versions: Dict[str, int] = {}
+        # Streams are never replaced once created, so the last appended-to
+        # pair can be reused when the next append names the same key object.
+        self._last_id: Optional[str] = None
+        self._last_stream: List[Event] = []
 
     @classmethod
     async def connect(cls, config: Optional["EventSourcingConfig"] = None) -> "EventStore":
@@ -489,12 +676,30 @@ class EventStore:
         store.connected = True
         return store
 
+    @property
+    def connected(self) -> bool:
+        """Whether the store is currently connected."""
+        return self._connected
+
+    @connected.setter
+    def connected(self, value: bool) -> None:
+        self._connected = value
+        cls = type(self)
+        for name in self._GUARDED:
+            # Subclass overrides of the public method are left in charge.
+            if value and getattr(cls, name) is getattr(EventStore, name):
+                self.__dict__[name] = getattr(self, "_" + name)
+            else:
+                self.__dict__.pop(name, None)
+
     async def append(self, aggregate_id: str, events: List[Event]) -> None:
         """
         Append events to the event stream for an aggregate.
 
         Events are added in order and assigned sequential version numbers
-        within the aggregate's stream.
+        within the aggregate's stream. Once a stream holds more than
+        ``config.max_events`` events, those covered by the aggregate's
+        latest snapshot are dropped.
 
         Args:
             aggregate_id: ID of the aggregate owning these events.
@@ -509,25 +714,26 @@ class EventStore:
         """
         if not self.connected:
             raise RuntimeError("EventStore is not connected. Call connect() first.")
-
-        if aggregate_id not in self._events:
-            self._events[aggregate_id] = []
-
-        current_version = len(self._events[aggregate_id])
+        self._append_sync(aggregate_id, events)
+
+    def _append_sync(self, aggregate_id: str, events: List[Event]) -> None:
+        if aggregate_id is self._last_id:
+            stream = self._last_stream
+        else:
+            stream = self._events[aggregate_id]
+            self._last_id, self._last_stream = aggregate_id, stream
+        current_version = self._versions.get(aggregate_id, 0)
         for event in events:
             current_version += 1
             event.version = current_version
             event.aggregate_id = aggregate_id
-            self._events[aggregate_id].append(event)
+        self._versions[aggregate_id] = current_version
+        stream.extend(events)
+        if len(stream) > self.config.max_events > 0:
+            self._prune(aggregate_id)
 
-        # Auto-snapshot if configured
-        if (
-            self.config.enable_snapshots
-            and self.config.snapshot_interval > 0
-            and current_version % self.config.snapshot_interval == 0
-        ):
-            # Store a marker; the caller is responsible for computing state
-            pass
+    async def _append(self, aggregate_id: str, events: List[Event]) -> None:
+        self._append_sync(aggregate_id, events)
 
     async def get_events(
         self, aggregate_id: str, since_version: int = 0
@@ -551,15 +757,109 @@ class EventStore:
         """
         if not self.connected:
             raise RuntimeError("EventStore is not connected. Call connect() first.")
+        return self._get_events_sync(aggregate_id, since_version)
+
+    def _get_events_sync(self, aggregate_id: str, since_version: int = 0) -> List[Event]:
+        stream = self._events.get(aggregate_id)
+        if not stream:
+            return []
+        # append() assigns dense ascending versions, so the cut point is
+        # an index offset from the first retained event.
+        start = since_version - stream[0].version + 1
+        return stream[start:] if start > 0 else stream[:]
+
+    async def _get_events(self, aggregate_id: str, since_version: int = 0) -> List[Event]:
+        return self._get_events_sync(aggregate_id, since_version)
+
+    async def get_events_raw(
+        self, aggregate_id: str, since_version: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve events for an aggregate as serialized dictionaries.
+
+        Same selection as ``get_events``, but returns the ``Event.json()``
+        form. Each event is serialized once, on the first read that covers
+        it, and cached; appends never pay for it. Read paths that only
+        forward events over the wire skip serializing each Event on every
+        request. The returned dicts are copies, so mutating them leaves the
+        cache intact; ``data`` is still the stored event's own dict, as with
+        ``Event.json()``.
+
+        Args:
+            aggregate_id: ID of the aggregate to retrieve events for.
+            since_version: Only return events after this version (default: 0).
+
+        Returns:
+            Ordered list of event dictionaries.
+
+        Raises:
+            RuntimeError: If the store is not connected.
+
+        Example:
+            @app.get("/orders/{id}/events")
+            async def order_events(request):
+                return await store.get_events_raw(request.params["id"])
+        """
+        if not self.connected:
+            raise RuntimeError("EventStore is not connected. Call connect() first.")
+        return self._get_events_raw_sync(aggregate_id, since_version)
+
+    def _get_events_raw_sync(
+        self, aggregate_id: str, since_version: int = 0
+    ) -> List[Dict[str, Any]]:
+        stream = self._events.get(aggregate_id)
+        if not stream:
+            return []
+        rows = self._rows[aggregate_id]
+        if len(rows) < len(stream):
+            rows.extend([event.json() for event in stream[len(rows):]])
+        start = since_version - stream[0].version + 1
+        return [row.copy() for row in (rows[start:] if start > 0 else rows)]
+
+    async def _get_events_raw(
+        self, aggregate_id: str, since_version: int = 0
+    ) -> List[Dict[str, Any]]:
+        return self._get_events_raw_sync(aggregate_id, since_version)
+
+    async def get_event_columns(
+        self, aggregate_id: str, since_version: int = 0
+    ) -> Dict[str, List[Any]]:
+        """
+        Retrieve events for an aggregate as parallel columns.
+
+        Same selection as ``get_events``, transposed into one list per
+        event field. Bulk serializers can stream each column directly
+        instead of walking every Event's attributes.
+
+        Args:
+            aggregate_id: ID of the aggregate to retrieve events for.
+            since_version: Only return events after this version (default: 0).
 
-        all_events = self._events.get(aggregate_id, [])
-        return [e for e in all_events if e.version > since_version]
+        Returns:
+            Dict mapping each Event field name to a list of values.
+
+        Example:
+            columns = await store.get_event_columns("order-1")
+            for event_type, version in zip(columns["event_type"], columns["version"]):
+                print(version, event_type)
+        """
+        events = await self.get_events(aggregate_id, since_version)
+        columns = list(zip(*map(_event_row, events), strict=True)) or [()] * len(Event.__slots__)
+        result = dict(zip(Event.__slots__, map(list, columns), strict=True))
+        # Emit real dicts for the shared empty metadata, as Event.json does
+        result["metadata"] = [
+            {} if metadata is _EMPTY_METADATA else metadata
+            for metadata in result["metadata"]
+        ]
+        return result
 
     async def save_snapshot(self, snapshot: Snapshot) -> None:
         """
         Save a snapshot of aggregate state.
 
-        Only the latest snapshot per aggregate is retained.
+        Only the latest snapshot per aggregate is retained. If the stream
+        is over ``config.max_events``, events up to the snapshot's version
+        are dropped.
 
         Args:
             snapshot: Snapshot instance to save.
@@ -570,8 +870,29 @@ class EventStore:
         """
         if not self.connected:
             raise RuntimeError("EventStore is not connected. Call connect() first.")
+        self._save_snapshot_sync(snapshot)
 
+    def _save_snapshot_sync(self, snapshot: Snapshot) -> None:
         self._snapshots[snapshot.aggregate_id] = snapshot
+        stream = self._events.get(snapshot.aggregate_id)
+        if stream and len(stream) > self.config.max_events > 0:
+            self._prune(snapshot.aggregate_id)
+
+    def _prune(self, aggregate_id: str) -> None:
+        """Drop stored events already covered by the latest snapshot."""
+        snapshot = self._snapshots.get(aggregate_id)
+        if snapshot is None:
+            return
+        stream = self._events[aggregate_id]
+        drop = min(snapshot.version - stream[0].version + 1, len(stream))
+        if drop > 0:
+            del stream[:drop]
+            rows = self._rows.get(aggregate_id)
+            if rows:
+                del rows[:drop]
+
+    async def _save_snapshot(self, snapshot: Snapshot) -> None:
+        self._save_snapshot_sync(snapshot)
 
     async def get_snapshot(self, aggregate_id: str) -> Optional[Snapshot]:
         """
@@ -591,9 +912,14 @@ class EventStore:
         """
         if not self.connected:
             raise RuntimeError("EventStore is not connected. Call connect() first.")
+        return self._get_snapshot_sync(aggregate_id)
 
+    def _get_snapshot_sync(self, aggregate_id: str) -> Optional[Snapshot]:
         return self._snapshots.get(aggregate_id)
 
+    async def _get_snapshot(self, aggregate_id: str) -> Optional[Snapshot]:
+        return self._get_snapshot_sync(aggregate_id)
+
     async def close(self) -> None:
         """
         Close the event store connection.
@@ -627,7 +953,8 @@ class EventSourcingConfig:
         store_type: Storage backend type ("memory" or "postgresql").
         snapshot_interval: Number of events between automatic snapshots.
         enable_snapshots: Whether to enable snapshot support.
-        max_events: Maximum number of events to retain per aggregate.
+        max_events: Events retained per aggregate before those covered by
+            a snapshot are pruned (0 disables pruning).
 
     Example:
         # In-memory for development
@@ -651,7 +978,8 @@ class EventSourcingConfig:
             store_type: Storage backend ("memory" or "postgresql").
             snapshot_interval: Events between automatic snapshots (default: 100).
             enable_snapshots: Enable snapshot support (default: True).
-            max_events: Maximum events per aggregate (default: 10000).
+            max_events: Events kept per aggregate before snapshotted ones
+                are pruned; 0 disables pruning (default: 10000).
         """
         self.store_type: str = store_type
         self.snapshot_interval: int = snapshot_interval
@@ -43,33 +43,43 @@ Example:
     users = await user_loader.load_many([1, 2, 3])
 """
 
+import asyncio
 import inspect
-from functools import wraps
-from typing import Any, Callable, Optional, Dict, List
+import sys
+from collections.abc import Mapping
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Optional, Dict, List, Set, Tuple
+from weakref import WeakKeyDictionary
 
+# (field name, resolver, is_coroutine)
+_PlanStep = Tuple[str, Callable, bool]
+# (field name, generated call(info, variables), is_coroutine)
+_MutationStep = Tuple[str, Callable, bool]
+# (query steps, mutation steps)
+_Plan = Tuple[Tuple[_PlanStep, ...], Tuple[_MutationStep, ...]]
 
-class Query:
+
+class _ResolverBase:
     """
-    Decorator class for marking a function as a GraphQL query resolver.
+    Shared implementation of the Query, Mutation and Subscription decorators.
 
-    Stores the decorated function along with its name and metadata
-    extracted from type hints and docstring.
+    Wraps a resolver function and keeps its name and the metadata read
+    from its signature, in slots. The instance ``__dict__`` only holds
+    ``__doc__``, which cannot be a slot because the class docstring
+    already occupies that name.
+    """
 
-    Example:
-        @Query
-        def users(info) -> list:
-            \"\"\"Fetch all users.\"\"\"
-            return [{"id": 1, "name": "Alice"}]
+    __slots__ = (
+        "_func", "_name", "_doc", "_return_type", "_parameters", "_is_async",
+        "__wrapped__", "__name__", "__qualname__", "__weakref__", "__dict__",
+    )
 
-        @Query
-        def user(info, id: int) -> dict:
-            \"\"\"Fetch a single user by ID.\"\"\"
-            return {"id": id, "name": "Alice"}
-    """
+    # Whether an async generator function counts as async for this kind
+    _async_generators = False
 
     def __init__(self, func: Callable):
         """
-        Initialize the Query decorator.
+        Initialize the decorator.
 
         Args:
             func: The resolver function to wrap.
@@ -77,9 +87,19 @@ class Query:
         self._func = func
         self._name = func.__name__
         self._doc = func.__doc__ or ""
-        self._return_type = _extract_return_type(func)
-        self._parameters = _extract_parameters(func)
-        wraps(func)(self)
+        return_type, parameters = _extract_signature(func)
+        self._return_type = return_type
+        self._parameters = dict(parameters)
+        # Read by GraphQL.add_query/add_mutation so registration skips inspect
+        self._is_async = inspect.iscoroutinefunction(func) or (
+            self._async_generators and inspect.isasyncgenfunction(func)
+        )
+        # Only what introspection needs; functools.wraps would also copy
+        # __dict__ and __annotations__ on every registration.
+        self.__wrapped__ = func
+        self.__name__ = self._name
+        self.__qualname__ = getattr(func, "__qualname__", self._name)
+        self.__doc__ = func.__doc__
 
     def __call__(self, *args, **kwargs) -> Any:
         """Execute the underlying resolver function."""
@@ -106,10 +126,32 @@ class Query:
         return self._parameters
 
     def __repr__(self) -> str:
-        return f"<Query '{self._name}'>"
+        return f"<{type(self).__name__} '{self._name}'>"
 
 
-class Mutation:
+class Query(_ResolverBase):
+    """
+    Decorator class for marking a function as a GraphQL query resolver.
+
+    Stores the decorated function along with its name and metadata
+    extracted from type hints and docstring.
+
+    Example:
+        @Query
+        def users(info) -> list:
+            \"\"\"Fetch all users.\"\"\"
+            return [{"id": 1, "name": "Alice"}]
+
+        @Query
+        def user(info, id: int) -> dict:
+            \"\"\"Fetch a single user by ID.\"\"\"
+            return {"id": id, "name": "Alice"}
+    """
+
+    __slots__ = ()
+
+
+class Mutation(_ResolverBase):
     """
     Decorator class for marking a function as a GraphQL mutation resolver.
 
@@ -128,49 +170,10 @@ class Mutation:
             return {"deleted": True}
     """
 
-    def __init__(self, func: Callable):
-        """
-        Initialize the Mutation decorator.
-
-        Args:
-            func: The resolver function to wrap.
-        """
-        self._func = func
-        self._name = func.__name__
-        self._doc = func.__doc__ or ""
-        self._return_type = _extract_return_type(func)
-        self._parameters = _extract_parameters(func)
-        wraps(func)(self)
-
-    def __call__(self, *args, **kwargs) -> Any:
-        """Execute the underlying resolver function."""
-        return self._func(*args, **kwargs)
+    __slots__ = ()
 
-    @property
-    def name(self) -> str:
-        """Get the resolver name."""
-        return self._name
 
-    @property
-    def func(self) -> Callable:
-        """Get the underlying function."""
-        return self._func
-
-    @property
-    def return_type(self) -> Optional[str]:
-        """Get the return type annotation as a string."""
-        return self._return_type
-
-    @property
-    def parameters(self) -> Dict[str, str]:
-        """Get parameter names mapped to their type annotations."""
-        return self._parameters
-
-    def __repr__(self) -> str:
-        return f"<Mutation '{self._name}'>"
-
-
-class Subscription:
+class Subscription(_ResolverBase):
     """
     Decorator class for marking a function as a GraphQL subscription resolver.
 
@@ -190,47 +193,8 @@ class Subscription:
             return {"user": {"id": 1, "name": "Alice"}}
     """
 
-    def __init__(self, func: Callable):
-        """
-        Initialize the Subscription decorator.
-
-        Args:
-            func: The resolver function to wrap.
-        """
-        self._func = func
-        self._name = func.__name__
-        self._doc = func.__doc__ or ""
-        self._return_type = _extract_return_type(func)
-        self._parameters = _extract_parameters(func)
-        self._is_async = inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func)
-        wraps(func)(self)
-
-    def __call__(self, *args, **kwargs) -> Any:
-        """Execute the underlying resolver function."""
-        return self._func(*args, **kwargs)
-
-    @property
-    def name(self) -> str:
-        """Get the resolver name."""
-        return self._name
-
-    @property
-    def func(self) -> Callable:
-        """Get the underlying function."""
-        return self._func
-
-    @property
-    def return_type(self) -> Optional[str]:
-        """Get the return type annotation as a string."""
-        return self._return_type
-
-    @property
-    def parameters(self) -> Dict[str, str]:
-        """Get parameter names mapped to their type annotations."""
-        return self._parameters
-
-    def __repr__(self) -> str:
-        return f"<Subscription '{self._name}'>"
+    __slots__ = ()
+    _async_generators = True
 
 
 class Field:
@@ -251,6 +215,8 @@ class Field:
         )
     """
 
+    __slots__ = ("name", "type_name", "description", "_resolver", "_resolve_impl")
+
     def __init__(
         self,
         name: str,
@@ -288,9 +254,52 @@ class Field:
         Returns:
             The resolved field value.
         """
-        if self.resolver is not None:
-            return self.resolver(obj, info, **kwargs)
+        return self._resolve_impl(obj, info, **kwargs)
+
+    def resolve_list(self, parents: List[Any], info: Any) -> List[Any]:
+        """
+        Resolve this field for every parent in a list.
+
+        Parents are assumed to share a type, so the dict-or-attribute
+        decision is made once from the first item and the lookup runs
+        through ``operator.itemgetter``/``attrgetter``. Missing keys or
+        attributes resolve to None, matching :meth:`resolve`.
 
+        Args:
+            parents: The parent objects (typically rows of a list field).
+            info: The GraphQL resolve info context.
+
+        Returns:
+            The resolved values, in the same order as ``parents``.
+        """
+        if not parents:
+            return []
+        if self._resolver is not None:
+            resolver = self._resolver
+            return [resolver(parent, info) for parent in parents]
+
+        name = self.name
+        try:
+            if isinstance(parents[0], dict):
+                return list(map(itemgetter(name), parents))
+            return list(map(attrgetter(name), parents))
+        except (KeyError, AttributeError, TypeError):
+            # Sparse or mixed rows: fall back to per-item lookup
+            default = self._default_resolve
+            return [default(parent, info) for parent in parents]
+
+    @property
+    def resolver(self) -> Optional[Callable]:
+        """Get the custom resolver, or None for default name lookup."""
+        return self._resolver
+
+    @resolver.setter
+    def resolver(self, resolver: Optional[Callable]) -> None:
+        # Pick the resolve path once, not on every resolve() call
+        self._resolver = resolver
+        self._resolve_impl = self._default_resolve if resolver is None else resolver
+
+    def _default_resolve(self, obj: Any, info: Any, **kwargs) -> Any:
         # Default resolution: dict key or attribute lookup
         if isinstance(obj, dict):
             return obj.get(self.name)
@@ -320,17 +329,27 @@ class DataLoader:
 
         user_loader = DataLoader(batch_load_users)
 
-        # These will be batched into a single DB query
-        user_a = await user_loader.load(1)
-        user_b = await user_loader.load(2)
-        users = await user_loader.load_many([3, 4, 5])
+        # Loads issued in the same event-loop tick share one DB query
+        user_a, user_b, users = await asyncio.gather(
+            user_loader.load(1),
+            user_loader.load(2),
+            user_loader.load_many([3, 4, 5]),
+        )
 
         # Clear cache for a specific key or all keys
         user_loader.clear(1)
         user_loader.clear()
     """
 
-    def __init__(self, batch_fn: Callable):
+    __slots__ = (
+        "_batch_fn", "_cache_enabled", "_cache", "_batch", "_pending",
+        "_dispatch_scheduled", "_dispatch_tasks",
+    )
+
+    # batch_fn -> process-wide loader handed out by ``shared``
+    _shared_instances: Dict[Callable, "DataLoader"] = {}
+
+    def __init__(self, batch_fn: Callable, cache: bool = True):
         """
         Initialize the DataLoader.
 
@@ -338,17 +357,54 @@ class DataLoader:
             batch_fn: An async function that accepts a list of keys and returns
                       a list of results in the same order. Must return one result
                       per key.
+            cache: Keep loaded values for later loads (default: True). When
+                   False, loads are still coalesced but every batch refetches.
         """
         self._batch_fn = batch_fn
+        self._cache_enabled = cache
         self._cache: Dict[Any, Any] = {}
-        self._batch: List[Any] = []
+        # Pending keys as an insertion-ordered dict: deduplicated on insert,
+        # and only keys missing from the cache are ever added.
+        self._batch: Dict[Any, None] = {}
+        # key -> future resolved by the dispatch that fetches it
+        self._pending: Dict[Any, asyncio.Future] = {}
+        self._dispatch_scheduled = False
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def shared(cls, batch_fn: Callable) -> "DataLoader":
+        """
+        Return the process-wide loader for ``batch_fn``.
+
+        Concurrent requests using the shared loader coalesce into the same
+        batches, so N in-flight requests loading the same keys make one
+        ``batch_fn`` call per event-loop tick instead of N. Shared loaders
+        do not cache: values are only shared between loads that overlap
+        in time, so one request never sees another's stale results.
+
+        Args:
+            batch_fn: The batch function to share a loader for.
+
+        Returns:
+            The shared, non-caching DataLoader for ``batch_fn``.
+
+        Example:
+            @Query
+            async def user(info, id: int) -> dict:
+                return await DataLoader.shared(batch_load_users).load(id)
+        """
+        loader = cls._shared_instances.get(batch_fn)
+        if loader is None:
+            loader = cls._shared_instances[batch_fn] = cls(batch_fn, cache=False)
+        return loader
 
     async def load(self, key: Any) -> Any:
         """
         Load a single value by key.
 
-        Returns a cached result if available, otherwise adds the key to the
-        current batch, dispatches the batch, and returns the result.
+        Returns a cached result if available. Otherwise the key joins the
+        current batch, and every load issued in the same event-loop tick
+        is fetched by one batch function call.
 
         Args:
             key: The key to load.
@@ -358,18 +414,14 @@ class DataLoader:
         """
         if key in self._cache:
             return self._cache[key]
-
-        self._batch.append(key)
-        results = await self._dispatch()
-
-        return self._cache.get(key)
+        return await asyncio.shield(self._enqueue(key))
 
     async def load_many(self, keys: List[Any]) -> List[Any]:
         """
         Load multiple values by their keys.
 
         Keys already present in the cache are returned immediately.
-        Missing keys are batched together in a single dispatch call.
+        Missing keys join the current batch alongside any concurrent loads.
 
         Args:
             keys: A list of keys to load.
@@ -377,13 +429,23 @@ class DataLoader:
         Returns:
             A list of values in the same order as the input keys.
         """
-        missing_keys = [k for k in keys if k not in self._cache]
+        cache = self._cache
+        # Created on the first miss, so a warm loader allocates nothing extra
+        waits: Optional[Dict[Any, asyncio.Future]] = None
+        for k in keys:
+            if k not in cache:
+                if waits is None:
+                    waits = {}
+                elif k in waits:
+                    continue
+                waits[k] = self._enqueue(k)
 
-        if missing_keys:
-            self._batch.extend(missing_keys)
-            await self._dispatch()
+        if waits is None:
+            return [cache[k] for k in keys]
 
-        return [self._cache.get(k) for k in keys]
+        gathered = await asyncio.gather(*map(asyncio.shield, waits.values()))
+        values = dict(zip(waits, gathered, strict=True))
+        return [values[k] if k in values else cache.get(k) for k in keys]
 
     def clear(self, key: Any = None) -> None:
         """
@@ -400,53 +462,73 @@ class DataLoader:
         else:
             self._cache.clear()
 
-    async def _dispatch(self) -> List[Any]:
+    def _enqueue(self, key: Any) -> asyncio.Future:
         """
-        Execute the batch function with all accumulated keys.
-
-        Drains the internal batch list, calls the batch function, and
-        populates the cache with the returned results. The batch function
-        must return exactly one result per key, in the same order.
-
-        Returns:
-            The list of results from the batch function.
+        Return the future for ``key``, batching it if it is not yet in flight.
 
-        Raises:
-            ValueError: If the batch function returns a different number
-                        of results than keys provided.
+        The first key of a batch schedules one dispatch for the next loop
+        iteration, so loads issued before then coalesce into it.
         """
-        if not self._batch:
-            return []
-
-        # Drain the batch list
-        keys = list(self._batch)
-        self._batch.clear()
-
-        # Deduplicate while preserving order for the batch call
-        seen = set()
-        unique_keys = []
-        for k in keys:
-            if k not in seen and k not in self._cache:
-                seen.add(k)
-                unique_keys.append(k)
-
-        if not unique_keys:
-            return []
-
-        # Call the batch function
-        results = await self._batch_fn(unique_keys)
-
-        if len(results) != len(unique_keys):
-            raise ValueError(
-                f"DataLoader batch function returned {len(results)} results "
-                f"for {len(unique_keys)} keys. Must return exactly one result per key."
-            )
-
-        # Populate cache
-        for key, value in zip(unique_keys, results):
-            self._cache[key] = value
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            self._batch[key] = None
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._start_dispatch, loop)
+        return future
+
+    def _start_dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._dispatch())
+        # Hold a reference until done; the loop only keeps weak ones
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(self) -> None:
+        """
+        Execute the batch function with all accumulated keys.
 
-        return results
+        Drains the internal batch, calls the batch function, populates
+        the cache, and resolves the pending future of every key. The
+        batch function must return exactly one result per key, in the
+        same order; otherwise each waiting load raises ValueError.
+        Errors from the batch function are delivered the same way.
+        """
+        self._dispatch_scheduled = False
+        # Swap in a fresh batch so loads issued while the batch function
+        # runs start the next one; keys are already unique and uncached
+        batch, self._batch = self._batch, {}
+        if not batch:
+            return
+
+        unique_keys = list(batch)
+        pending = self._pending
+
+        try:
+            results = await self._batch_fn(unique_keys)
+            if len(results) != len(unique_keys):
+                raise ValueError(
+                    f"DataLoader batch function returned {len(results)} results "
+                    f"for {len(unique_keys)} keys. Must return exactly one result per key."
+                )
+        except asyncio.CancelledError:
+            for key in unique_keys:
+                pending.pop(key).cancel()
+            raise
+        except Exception as exc:
+            for key in unique_keys:
+                future = pending.pop(key)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        if self._cache_enabled:
+            self._cache.update(zip(unique_keys, results, strict=True))
+        for key, value in zip(unique_keys, results, strict=True):
+            future = pending.pop(key)
+            if not future.done():
+                future.set_result(value)
 
 
 class GraphQL:
@@ -482,6 +564,13 @@ class GraphQL:
         self._queries: Dict[str, Callable] = {}
         self._mutations: Dict[str, Callable] = {}
         self._subscriptions: Dict[str, Callable] = {}
+        # name -> (name, resolver, is_coroutine), resolved at registration
+        # so execute() does no introspection per request
+        self._query_plan: Dict[str, Tuple[str, Callable, bool]] = {}
+        self._mutation_plan: Dict[str, _MutationStep] = {}
+        # Resolver steps every operation runs, rebuilt after a resolver is
+        # registered. Not keyed by query: the plan does not depend on it yet.
+        self._cached_plan: Optional[_Plan] = None
 
     def add_query(self, func: Callable) -> None:
         """
@@ -501,9 +590,14 @@ class GraphQL:
             gql.add_query(users)
         """
         if isinstance(func, Query):
-            self._queries[func.name] = func.func
+            name, resolver, is_coro = func._name, func._func, func._is_async
         else:
-            self._queries[func.__name__] = func
+            name, resolver = func.__name__, func
+            is_coro = inspect.iscoroutinefunction(func)
+        name = sys.intern(name)
+        self._queries[name] = resolver
+        self._query_plan[name] = (name, resolver, is_coro)
+        self._cached_plan = None
 
     def add_mutation(self, func: Callable) -> None:
         """
@@ -523,9 +617,16 @@ class GraphQL:
             gql.add_mutation(create_user)
         """
         if isinstance(func, Mutation):
-            self._mutations[func.name] = func.func
+            name, resolver, is_coro = func._name, func._func, func._is_async
         else:
-            self._mutations[func.__name__] = func
+            name, resolver = func.__name__, func
+            is_coro = inspect.iscoroutinefunction(func)
+        name = sys.intern(name)
+        self._mutations[name] = resolver
+        self._mutation_plan[name] = (
+            name, _compile_mutation_call(resolver, _keyword_names(resolver)), is_coro,
+        )
+        self._cached_plan = None
 
     def add_subscription(self, func: Callable) -> None:
         """
@@ -545,9 +646,9 @@ class GraphQL:
             gql.add_subscription(on_message)
         """
         if isinstance(func, Subscription):
-            self._subscriptions[func.name] = func.func
+            self._subscriptions[sys.intern(func.name)] = func.func
         else:
-            self._subscriptions[func.__name__] = func
+            self._subscriptions[sys.intern(func.__name__)] = func
 
     async def execute(
         self,
@@ -576,38 +677,63 @@ class GraphQL:
             )
         """
         # Placeholder execution - real implementation delegates to Rust engine
-        result: Dict[str, Any] = {"data": {}}
+        data: Dict[str, Any] = {}
         errors: List[Dict[str, Any]] = []
 
+        variables = variables or {}
+
         # Build context info for resolvers
         info = {
             "query": query,
-            "variables": variables or {},
+            "variables": variables,
             "operation_name": operation_name,
         }
 
-        # Attempt to resolve known query fields
-        for name, resolver in self._queries.items():
+        query_steps, mutation_steps = self._cached_plan or self._build_plan()
+
+        # Query fields may resolve concurrently: start every resolver, then
+        # gather the coroutines. Outcomes are recorded in field order.
+        outcomes: List[Tuple[str, Any, Optional[BaseException]]] = []
+        waiting: List[int] = []
+        coros = []
+        for name, resolver, is_coro in query_steps:
             try:
-                if inspect.iscoroutinefunction(resolver):
-                    value = await resolver(info)
-                else:
-                    value = resolver(info)
-                result["data"][name] = value
+                value = resolver(info)
             except Exception as exc:
+                outcomes.append((name, None, exc))
+                continue
+            if is_coro:
+                waiting.append(len(outcomes))
+                coros.append(value)
+            outcomes.append((name, value, None))
+
+        if coros:
+            gathered = await asyncio.gather(*coros, return_exceptions=True)
+            for index, value in zip(waiting, gathered, strict=True):
+                if isinstance(value, BaseException):
+                    if not isinstance(value, Exception):
+                        raise value
+                    outcomes[index] = (outcomes[index][0], None, value)
+                else:
+                    outcomes[index] = (outcomes[index][0], value, None)
+
+        for name, value, exc in outcomes:
+            if exc is None:
+                data[name] = value
+            else:
                 errors.append({
                     "message": str(exc),
                     "path": [name],
                 })
 
-        # Attempt to resolve known mutation fields
-        for name, resolver in self._mutations.items():
+        # Mutation fields run serially, in registration order. Each gets
+        # only the variables it declares (all of them if it takes **kwargs).
+        for name, call, is_coro in mutation_steps:
             try:
-                if inspect.iscoroutinefunction(resolver):
-                    value = await resolver(info, **(variables or {}))
-                else:
-                    value = resolver(info, **(variables or {}))
-                result["data"][name] = value
+                value = call(info, variables)
+                if is_coro:
+                    value = await value
+                data[name] = value
             except Exception as exc:
                 errors.append({
                     "message": str(exc),
@@ -615,17 +741,30 @@ class GraphQL:
                 })
 
         if errors:
-            result["errors"] = errors
+            return {"data": data, "errors": errors}
+        return {"data": data}
 
-        return result
+    def _build_plan(self) -> _Plan:
+        """
+        Select the resolver steps to run, cached until the next registration.
+
+        The placeholder engine does not parse queries yet: every query
+        resolver runs, then every mutation resolver. Once field selection
+        depends on the query, plans should be cached per (bounded) query
+        string instead.
+        """
+        plan = self._cached_plan = (
+            tuple(self._query_plan.values()), tuple(self._mutation_plan.values())
+        )
+        return plan
 
-    def get_schema(self) -> Dict[str, Any]:
+    def get_schema(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Return schema information describing all registered resolvers.
 
         Returns:
-            A dictionary with "queries", "mutations", and "subscriptions"
-            keys, each containing a list of resolver descriptors.
+            A dict with "queries", "mutations", and "subscriptions" keys,
+            each containing a list of resolver descriptors.
 
         Example:
             schema_info = gql.get_schema()
@@ -635,32 +774,19 @@ class GraphQL:
             #     "subscriptions": [...]
             # }
         """
-        return {
-            "queries": [
-                {
-                    "name": name,
-                    "return_type": _extract_return_type(func),
-                    "parameters": _extract_parameters(func),
-                }
-                for name, func in self._queries.items()
-            ],
-            "mutations": [
-                {
-                    "name": name,
-                    "return_type": _extract_return_type(func),
-                    "parameters": _extract_parameters(func),
-                }
-                for name, func in self._mutations.items()
-            ],
-            "subscriptions": [
-                {
-                    "name": name,
-                    "return_type": _extract_return_type(func),
-                    "parameters": _extract_parameters(func),
-                }
-                for name, func in self._subscriptions.items()
-            ],
-        }
+        return dict(self.schema_view())
+
+    def schema_view(self) -> Mapping[str, List[Dict[str, Any]]]:
+        """
+        Return a lazy, read-only view of ``get_schema()``.
+
+        Each section is described the first time it is read, so a caller
+        that only looks at "queries" never describes the mutations.
+
+        Example:
+            names = [q["name"] for q in gql.schema_view()["queries"]]
+        """
+        return _SchemaView(self)
 
     def __repr__(self) -> str:
         return (
@@ -781,12 +907,8 @@ class Schema:
                 gql.add_query(item)
             elif isinstance(item, type):
                 # Class-based: register each method as a query
-                for attr_name in dir(item):
-                    if attr_name.startswith("_"):
-                        continue
-                    attr = getattr(item, attr_name)
-                    if callable(attr):
-                        gql.add_query(attr)
+                for attr in _class_resolvers(item):
+                    gql.add_query(attr)
 
         for item in self._mutations:
             if isinstance(item, Mutation):
@@ -794,12 +916,8 @@ class Schema:
             elif callable(item) and not isinstance(item, type):
                 gql.add_mutation(item)
             elif isinstance(item, type):
-                for attr_name in dir(item):
-                    if attr_name.startswith("_"):
-                        continue
-                    attr = getattr(item, attr_name)
-                    if callable(attr):
-                        gql.add_mutation(attr)
+                for attr in _class_resolvers(item):
+                    gql.add_mutation(attr)
 
         for item in self._subscriptions:
             if isinstance(item, Subscription):
@@ -807,12 +925,8 @@ class Schema:
             elif callable(item) and not isinstance(item, type):
                 gql.add_subscription(item)
             elif isinstance(item, type):
-                for attr_name in dir(item):
-                    if attr_name.startswith("_"):
-                        continue
-                    attr = getattr(item, attr_name)
-                    if callable(attr):
-                        gql.add_subscription(attr)
+                for attr in _class_resolvers(item):
+                    gql.add_subscription(attr)
 
         return gql
 
@@ -828,6 +942,179 @@ class Schema:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _class_resolvers(cls: type) -> List[Callable]:
+    """
+    Return the public callables defined on ``cls`` and its bases.
+
+    Reads the class dicts along the MRO (minus ``object``) instead of
+    ``dir()``, so the ~30 inherited ``object`` attributes are never
+    fetched. Names come out in definition order, base classes first.
+    """
+    names: Dict[str, None] = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        for name in vars(klass):
+            if not name.startswith("_"):
+                names[name] = None
+    resolvers = []
+    for name in names:
+        attr = getattr(cls, name)
+        if callable(attr):
+            resolvers.append(attr)
+    return resolvers
+
+
+def _keyword_names(func: Callable) -> Optional[Tuple[str, ...]]:
+    """
+    Return the argument names a resolver accepts by keyword after ``info``.
+
+    Returns None when the resolver takes ``**kwargs`` (or its signature
+    cannot be read), meaning it should receive every variable.
+    """
+    try:
+        sig = inspect.signature(func)
+    except (ValueError, TypeError):
+        return None
+    names = []
+    skip_first = True
+    for name, param in sig.parameters.items():
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            return None
+        if name in ("self", "cls"):
+            continue
+        # Skip the first non-self parameter (info)
+        if skip_first:
+            skip_first = False
+            continue
+        if param.kind in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY,
+        ):
+            names.append(name)
+    return tuple(names)
+
+
+def _compile_mutation_call(
+    resolver: Callable, accepted: Optional[Tuple[str, ...]]
+) -> Callable:
+    """
+    Generate a ``call(info, variables)`` wrapper for one mutation resolver.
+
+    The wrapper passes exactly the declared variables that are present,
+    with the names baked in as literals, and calls ``resolver(info)``
+    when none are. ``accepted`` of None passes every variable through.
+    """
+    if accepted is None:
+        body = (
+            "    if variables:\n"
+            "        return fn(info, **variables)\n"
+            "    return fn(info)\n"
+        )
+    elif not accepted:
+        body = "    return fn(info)\n"
+    elif len(accepted) == 1:
+        key = accepted[0]
+        body = (
+            f"    if {key!r} in variables:\n"
+            f"        return fn(info, {key}=variables[{key!r}])\n"
+            "    return fn(info)\n"
+        )
+    else:
+        picks = "".join(
+            f"    if {key!r} in variables:\n"
+            f"        kwargs[{key!r}] = variables[{key!r}]\n"
+            for key in accepted
+        )
+        body = (
+            "    kwargs = {}\n"
+            f"{picks}"
+            "    if kwargs:\n"
+            "        return fn(info, **kwargs)\n"
+            "    return fn(info)\n"
+        )
+    namespace: Dict[str, Any] = {"fn": resolver}
+    exec("def call(info, variables):\n" + body, namespace)
+    return namespace["call"]
+
+
+class _SchemaView(Mapping):
+    """Lazy ``schema_view()`` result: sections are described on first access."""
+
+    __slots__ = ("_registries", "_sections")
+
+    def __init__(self, gql: "GraphQL"):
+        self._registries = {
+            "queries": gql._queries,
+            "mutations": gql._mutations,
+            "subscriptions": gql._subscriptions,
+        }
+        self._sections: Dict[str, List[Dict[str, Any]]] = {}
+
+    def __getitem__(self, key: str) -> List[Dict[str, Any]]:
+        try:
+            return self._sections[key]
+        except KeyError:
+            section = self._sections[key] = _describe(self._registries[key])
+            return section
+
+    def __iter__(self):
+        return iter(self._registries)
+
+    def __len__(self) -> int:
+        return len(self._registries)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _describe(resolvers: Dict[str, Callable]) -> List[Dict[str, Any]]:
+    """Build the schema descriptors for one resolver registry."""
+    descriptors = []
+    for name, func in resolvers.items():
+        return_type, parameters = _extract_signature(func)
+        descriptors.append({
+            "name": name,
+            "return_type": return_type,
+            "parameters": dict(parameters),
+        })
+    return descriptors
+
+
+# func -> (return type, parameters), so each resolver's signature is parsed once
+_SIG_CACHE: "WeakKeyDictionary[Callable, Tuple[Optional[str], Dict[str, str]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _extract_signature(func: Callable) -> Tuple[Optional[str], Dict[str, str]]:
+    """
+    Extract the return type and parameters of a resolver, memoized per function.
+
+    Args:
+        func: The function to inspect.
+
+    Returns:
+        Tuple of the return type string (or None) and the parameter
+        mapping. The mapping is shared with the cache; copy it before
+        handing it out.
+    """
+    try:
+        return _SIG_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+
+    try:
+        sig = inspect.signature(func)
+    except (ValueError, TypeError):
+        entry: Tuple[Optional[str], Dict[str, str]] = (None, {})
+    else:
+        entry = (_format_return_type(sig), _format_parameters(sig))
+
+    try:
+        _SIG_CACHE[func] = entry
+    except TypeError:
+        pass  # not weak-referenceable (e.g. some builtins); just don't cache
+    return entry
+
+
 def _extract_return_type(func: Callable) -> Optional[str]:
     """
     Extract the return type annotation from a function as a string.
@@ -838,15 +1125,7 @@ def _extract_return_type(func: Callable) -> Optional[str]:
     Returns:
         String representation of the return type, or None if not annotated.
     """
-    try:
-        hints = inspect.signature(func).return_annotation
-        if hints is inspect.Parameter.empty:
-            return None
-        if isinstance(hints, type):
-            return hints.__name__
-        return str(hints)
-    except (ValueError, TypeError):
-        return None
+    return _extract_signature(func)[0]
 
 
 def _extract_parameters(func: Callable) -> Dict[str, str]:
@@ -862,24 +1141,35 @@ def _extract_parameters(func: Callable) -> Dict[str, str]:
     Returns:
         Dictionary mapping parameter names to their type annotation strings.
     """
+    return dict(_extract_signature(func)[1])
+
+
+def _format_return_type(sig: inspect.Signature) -> Optional[str]:
+    """Render a signature's return annotation as a string, or None."""
+    hints = sig.return_annotation
+    if hints is inspect.Parameter.empty:
+        return None
+    if isinstance(hints, type):
+        return hints.__name__
+    return str(hints)
+
+
+def _format_parameters(sig: inspect.Signature) -> Dict[str, str]:
+    """Render a signature's resolver arguments (after ``info``) as strings."""
     params: Dict[str, str] = {}
-    try:
-        sig = inspect.signature(func)
-        skip_first = True
-        for name, param in sig.parameters.items():
-            if name in ("self", "cls"):
-                continue
-            # Skip the first non-self parameter (info)
-            if skip_first:
-                skip_first = False
-                continue
-            if param.annotation is not inspect.Parameter.empty:
-                if isinstance(param.annotation, type):
-                    params[name] = param.annotation.__name__
-                else:
-                    params[name] = str(param.annotation)
+    skip_first = True
+    for name, param in sig.parameters.items():
+        if name in ("self", "cls"):
+            continue
+        # Skip the first non-self parameter (info)
+        if skip_first:
+            skip_first = False
+            continue
+        if param.annotation is not inspect.Parameter.empty:
+            if isinstance(param.annotation, type):
+                params[name] = param.annotation.__name__
             else:
-                params[name] = "Any"
-    except (ValueError, TypeError):
-        pass
+                params[name] = str(param.annotation)
+        else:
+            params[name] = "Any"
     return params
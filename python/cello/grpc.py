@@ -36,7 +36,7 @@ Example:
         await channel.close()
 """
 
-from functools import wraps
+import itertools
 from typing import Any, Callable, Optional
 
 
@@ -103,7 +103,7 @@ def grpc_method(func: Callable = None, *, stream: bool = False) -> Callable:
         stream: Whether this method uses streaming responses (default: False).
 
     Returns:
-        Decorated function with gRPC metadata attached.
+        The same function, with gRPC metadata attached.
 
     Example:
         class MyService(GrpcService):
@@ -117,15 +117,12 @@ def grpc_method(func: Callable = None, *, stream: bool = False) -> Callable:
                 yield {"chunk": 2}
     """
     def decorator(fn: Callable) -> Callable:
-        @wraps(fn)
-        def wrapper(*args, **kwargs):
-            return fn(*args, **kwargs)
-
-        # Attach gRPC metadata to the function
-        wrapper._grpc_method = True
-        wrapper._grpc_method_name = fn.__name__
-        wrapper._grpc_stream = stream
-        return wrapper
+        # Attach gRPC metadata to the function itself, so dispatch calls
+        # it directly rather than through a re-calling wrapper
+        fn._grpc_method = True
+        fn._grpc_method_name = fn.__name__
+        fn._grpc_stream = stream
+        return fn
 
     if func is not None:
         # Called without parentheses: @grpc_method
@@ -305,6 +302,14 @@ class GrpcService:
         print(service.get_methods())    # [{"name": "get_user", ...}, ...]
     """
 
+    # (attribute name, gRPC method name, stream) per decorated method,
+    # found once per class by __init_subclass__
+    _grpc_methods_cache: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._grpc_methods_cache = _scan_grpc_methods(cls)
+
     def __init__(self, name: str = None):
         """
         Initialize the gRPC service.
@@ -317,17 +322,13 @@ class GrpcService:
         self._discover_methods()
 
     def _discover_methods(self) -> None:
-        """Scan the class for methods decorated with @grpc_method."""
-        for attr_name in dir(self):
-            if attr_name.startswith("_"):
-                continue
-            attr = getattr(self, attr_name, None)
-            if callable(attr) and getattr(attr, "_grpc_method", False):
-                self._methods[attr._grpc_method_name] = {
-                    "name": attr._grpc_method_name,
-                    "handler": attr,
-                    "stream": attr._grpc_stream,
-                }
+        """Bind the methods decorated with @grpc_method, as found on the class."""
+        for attr_name, method_name, stream in self._grpc_methods_cache:
+            self._methods[method_name] = {
+                "name": method_name,
+                "handler": getattr(self, attr_name),
+                "stream": stream,
+            }
 
     def get_methods(self) -> list[dict]:
         """
@@ -337,8 +338,8 @@ class GrpcService:
             List of dicts with keys: name, stream.
         """
         return [
-            {"name": info["name"], "stream": info["stream"]}
-            for info in self._methods.values()
+            {"name": method_name, "stream": stream}
+            for _, method_name, stream in self._grpc_methods_cache
         ]
 
     def get_name(self) -> str:
@@ -355,6 +356,26 @@ class GrpcService:
         return f"GrpcService(name={self._name!r}, methods={method_count})"
 
 
+def _scan_grpc_methods(cls: type) -> tuple:
+    """
+    Find the @grpc_method-decorated methods of a service class.
+
+    Walks the class dicts along the MRO once, in sorted attribute order
+    (the order ``dir()`` gives), resolving each name through the class so
+    overrides win.
+    """
+    names = set()
+    for klass in cls.__mro__[:-1]:
+        names.update(name for name in vars(klass) if not name.startswith("_"))
+    found = {}
+    for attr_name in sorted(names):
+        attr = getattr(cls, attr_name, None)
+        if callable(attr) and getattr(attr, "_grpc_method", False):
+            method_name = attr._grpc_method_name
+            found[method_name] = (attr_name, method_name, attr._grpc_stream)
+    return tuple(found.values())
+
+
 class GrpcServer:
     """
     gRPC server that hosts registered services.
@@ -445,15 +466,47 @@ class GrpcServer:
         return f"GrpcServer(services={service_count}, running={self._running})"
 
 
+class _ChannelPool:
+    """
+    A fixed set of sub-channels to one target, handed out round-robin.
+
+    Each sub-channel is its own connection, so concurrent calls spread
+    across several HTTP/2 sockets instead of queueing behind one
+    connection's stream limit.
+    """
+
+    def __init__(self, target: str, size: int):
+        self.target = target
+        # Distinct channel args keep the transport from coalescing the
+        # sub-channels back onto a single connection.
+        self._subs = [{"target": target, "pool_id": i} for i in range(size)]
+        # next() on itertools.count is atomic under the GIL
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._subs)
+
+    def pick(self) -> dict:
+        """Return the next sub-channel in round-robin order."""
+        subs = self._subs
+        return subs[next(self._counter) % len(subs)]
+
+    def close(self) -> None:
+        """Close every sub-channel."""
+        # In a real implementation, each Rust sub-channel would be closed here
+        self._subs.clear()
+
+
 class GrpcChannel:
     """
     gRPC client channel for making remote procedure calls.
 
     Wraps the Rust-powered gRPC client with a Pythonic async API
-    for connecting to remote services and making calls.
+    for connecting to remote services and making calls. Calls are
+    spread round-robin over a pool of ``pool_size`` connections.
 
     Example:
-        channel = await GrpcChannel.connect("localhost:50051")
+        channel = await GrpcChannel.connect("localhost:50051", pool_size=8)
 
         result = await channel.call(
             "UserService",
@@ -465,7 +518,7 @@ class GrpcChannel:
         await channel.close()
     """
 
-    def __init__(self, target: str):
+    def __init__(self, target: str, pool_size: int = 4):
         """
         Initialize a gRPC channel.
 
@@ -473,23 +526,35 @@ class GrpcChannel:
 
         Args:
             target: Target address in host:port format.
+            pool_size: Number of underlying connections to spread calls over.
+
+        Raises:
+            ValueError: If pool_size is less than 1.
         """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}")
         self._target = target
+        self._pool_size = pool_size
+        self._pool: Optional[_ChannelPool] = None
         self._connected = False
 
     @classmethod
-    async def connect(cls, target: str) -> "GrpcChannel":
+    async def connect(cls, target: str, pool_size: int = 4) -> "GrpcChannel":
         """
         Create and connect a gRPC channel to the target address.
 
         Args:
             target: Target address in host:port format (e.g., "localhost:50051").
+            pool_size: Number of underlying connections to spread calls over
+                       (default: 4).
 
         Returns:
             A connected GrpcChannel instance.
         """
-        instance = cls(target)
-        # In a real implementation, this would establish a Rust-powered connection
+        instance = cls(target, pool_size=pool_size)
+        # In a real implementation, each sub-channel would establish a
+        # Rust-powered connection
+        instance._pool = _ChannelPool(target, pool_size)
         instance._connected = True
         return instance
 
@@ -514,17 +579,23 @@ class GrpcChannel:
                 message="Channel is not connected",
                 details=f"Target: {self._target}",
             )
-        # Placeholder - real implementation calls Rust gRPC client
+        # Placeholder - real implementation calls the Rust gRPC client on
+        # the picked sub-channel
+        self._pool.pick()
         return {}
 
     async def close(self) -> None:
         """
-        Close the gRPC channel and release resources.
+        Close the gRPC channel and every pooled connection.
         """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
         self._connected = False
 
     def __repr__(self) -> str:
         return (
             f"GrpcChannel(target={self._target!r}, "
+            f"pool_size={self._pool_size}, "
             f"connected={self._connected})"
         )
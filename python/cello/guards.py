@@ -1,10 +1,11 @@
 from typing import Any, List, Union, Callable, Dict
 import hmac
 import inspect
+import sys
 from functools import wraps
 
 
-def constant_time_compare(a: str, b: str) -> bool:
+def constant_time_compare(a: Union[str, bytes], b: Union[str, bytes]) -> bool:
     """Compare two strings in constant time to prevent timing attacks.
 
     SECURITY: Always use this function (or hmac.compare_digest) instead of
@@ -12,14 +13,25 @@ def constant_time_compare(a: str, b: str) -> bool:
     secret values. Direct ``==`` comparison leaks information about how
     many leading characters match, enabling timing-based attacks.
 
+    Secrets kept as bytes skip the UTF-8 encoding step; str and bytes
+    may be mixed.
+
     Args:
-        a: First string to compare.
-        b: Second string to compare.
+        a: First string (or bytes) to compare.
+        b: Second string (or bytes) to compare.
 
     Returns:
         True if the strings are equal, False otherwise.
     """
-    return hmac.compare_digest(a.encode("utf-8"), b.encode("utf-8"))
+    if type(a) is bytes and type(b) is bytes:
+        return hmac.compare_digest(a, b)
+    return hmac.compare_digest(_as_bytes(a), _as_bytes(b))
+
+def _as_bytes(value: Union[str, bytes]) -> bytes:
+    """Return ``value`` as a bytes-like object, UTF-8 encoding str."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return value
+    return value.encode("utf-8")
 
 class GuardError(Exception):
     """Base class for guard errors."""
@@ -48,32 +60,38 @@ class Role(Guard):
     Assumes `request.context["user"]["roles"]` exists and is a list of strings.
     """
     def __init__(self, roles: List[str], require_all: bool = False, user_key: str = "user", role_key: str = "roles"):
-        self.roles = set(roles)
+        self.roles = frozenset(roles)
+        # One required role is the common case: a plain membership test
+        self._single = next(iter(self.roles)) if len(self.roles) == 1 else None
         self.require_all = require_all
-        self.user_key = user_key
+        self.user_key = sys.intern(user_key)
         self.role_key = role_key
 
     def __call__(self, request: Any) -> Union[bool, None, str]:
-        user = getattr(request, "context", {}).get(self.user_key)
+        try:
+            user = request.context[self.user_key]
+        except (AttributeError, KeyError):
+            raise UnauthorizedError() from None
         if not user:
              raise UnauthorizedError()
         
-        user_roles = user.get(self.role_key, [])
+        user_roles = user.get(self.role_key, ())
         if not isinstance(user_roles, list):
              # Try to handle single role string
              if isinstance(user_roles, str):
                  user_roles = [user_roles]
              else:
-                 user_roles = []
-        
-        user_roles_set = set(user_roles)
+                 user_roles = ()
+
+        if self._single is not None and self._single in user_roles:
+            return True
 
         if self.require_all:
-            if not self.roles.issubset(user_roles_set):
-                 missing = self.roles - user_roles_set
+            if not self.roles.issubset(user_roles):
+                 missing = self.roles.difference(user_roles)
                  raise ForbiddenError(f"Missing required roles: {', '.join(missing)}")
         else:
-            if not self.roles.intersection(user_roles_set):
+            if self.roles.isdisjoint(user_roles):
                  raise ForbiddenError(f"Requires one of roles: {', '.join(self.roles)}")
         
         return True
@@ -84,31 +102,36 @@ class Permission(Guard):
     Assumes `request.context["user"]["permissions"]` exists and is a list of strings.
     """
     def __init__(self, permissions: List[str], require_all: bool = True, user_key: str = "user", perm_key: str = "permissions"):
-        self.permissions = set(permissions)
+        self.permissions = frozenset(permissions)
+        self._single = next(iter(self.permissions)) if len(self.permissions) == 1 else None
         self.require_all = require_all
-        self.user_key = user_key
+        self.user_key = sys.intern(user_key)
         self.perm_key = perm_key
 
     def __call__(self, request: Any) -> Union[bool, None, str]:
-        user = getattr(request, "context", {}).get(self.user_key)
+        try:
+            user = request.context[self.user_key]
+        except (AttributeError, KeyError):
+            raise UnauthorizedError() from None
         if not user:
              raise UnauthorizedError()
         
-        user_perms = user.get(self.perm_key, [])
+        user_perms = user.get(self.perm_key, ())
         if not isinstance(user_perms, list):
              if isinstance(user_perms, str):
                  user_perms = [user_perms]
              else:
-                 user_perms = []
-        
-        user_perms_set = set(user_perms)
+                 user_perms = ()
+
+        if self._single is not None and self._single in user_perms:
+            return True
 
         if self.require_all:
-            if not self.permissions.issubset(user_perms_set):
-                 missing = self.permissions - user_perms_set
+            if not self.permissions.issubset(user_perms):
+                 missing = self.permissions.difference(user_perms)
                  raise ForbiddenError(f"Missing required permissions: {', '.join(missing)}")
         else:
-            if not self.permissions.intersection(user_perms_set):
+            if self.permissions.isdisjoint(user_perms):
                  raise ForbiddenError(f"Requires one of permissions: {', '.join(self.permissions)}")
         
         return True
@@ -116,14 +139,37 @@ class Permission(Guard):
 class Authenticated(Guard):
     """Ensure user is authenticated (present in context)."""
     def __init__(self, user_key: str = "user"):
-        self.user_key = user_key
+        self.user_key = sys.intern(user_key)
 
     def __call__(self, request: Any) -> Union[bool, None, str]:
-        if not getattr(request, "context", {}).get(self.user_key):
+        try:
+            user = request.context[self.user_key]
+        except (AttributeError, KeyError):
+            raise UnauthorizedError() from None
+        if not user:
              raise UnauthorizedError()
         return True
 
-class And(Guard):
+class _CompiledGuard(Guard):
+    """
+    Base for the combinators. The whole guard tree is flattened into one
+    opcode tuple on first call (nested And/Or/Not are inlined), so
+    checking it is a single loop rather than a call per composition level.
+    """
+    _program = None
+
+    def __call__(self, request: Any):
+        program = self._program
+        if program is None:
+            program = []
+            _emit(self, program)
+            program = self._program = tuple(program)
+        ok, failure = _execute(program, request)
+        if not ok:
+            raise failure
+        return True
+
+class And(_CompiledGuard):
     """Pass only if ALL guards pass. Accepts a list or *args: And([g1, g2]) or And(g1, g2)."""
     def __init__(self, *args):
         if len(args) == 1 and isinstance(args[0], list):
@@ -131,17 +177,7 @@ class And(Guard):
         else:
             self.guards = list(args)
 
-    def __call__(self, request: Any):
-        for guard in self.guards:
-             result = guard(request)
-             # If guard returns False or string, it failed (though our guards raise exceptions)
-             if result is False:
-                 raise ForbiddenError("Guard check failed")
-             if isinstance(result, str):
-                 raise ForbiddenError(result)
-        return True
-
-class Or(Guard):
+class Or(_CompiledGuard):
     """Pass if ANY guard passes. Accepts a list or *args: Or([g1, g2]) or Or(g1, g2)."""
     def __init__(self, *args):
         if len(args) == 1 and isinstance(args[0], list):
@@ -149,35 +185,136 @@ class Or(Guard):
         else:
             self.guards = list(args)
 
-    def __call__(self, request: Any):
-        last_error = None
-        for guard in self.guards:
-            try:
-                result = guard(request)
-                if result is not False and not isinstance(result, str):
-                    return True
-            except GuardError as e:
-                last_error = e
-
-        # If we get here, all guards failed
-        if last_error:
-            raise last_error
-        raise ForbiddenError("All guards failed")
-
-class Not(Guard):
+class Not(_CompiledGuard):
     """Invert the result of a guard."""
     def __init__(self, guard: Callable):
         self.guard = guard
 
-    def __call__(self, request: Any):
-        try:
-            result = self.guard(request)
-            if result is False or isinstance(result, str):
-                 return True # Guard failed, so NOT Guard passes
-        except GuardError:
-             return True # Guard raised GuardError, so NOT Guard passes
+# Opcodes of a compiled guard program: (opcode, argument) pairs.
+_OP_CALL = 0       # call a leaf guard, recording pass/fail
+_OP_PASS = 1       # an empty And: pass
+_OP_AND_CHECK = 2  # after an And child: on failure, jump to the And's end
+_OP_OR_BEGIN = 3   # start an Or: no error seen yet
+_OP_OR_CHECK = 4   # after an Or child: on success, jump to the Or's end
+_OP_OR_END = 5     # every Or child failed
+_OP_NOT = 6        # invert the last outcome
+_OP_CHECK = 7      # after a top-level route guard: on failure, stop
+
+def _emit(guard: Callable, program: list) -> None:
+    """Append the instructions that evaluate ``guard`` to ``program``."""
+    if type(guard).__call__ is not _CompiledGuard.__call__:
+        program.append((_OP_CALL, guard))
+    elif isinstance(guard, Not):
+        _emit(guard.guard, program)
+        program.append((_OP_NOT, None))
+    elif isinstance(guard, Or):
+        program.append((_OP_OR_BEGIN, None))
+        checks = []
+        for child in guard.guards:
+            _emit(child, program)
+            checks.append(len(program))
+            program.append(None)
+        program.append((_OP_OR_END, None))
+        for index in checks:
+            program[index] = (_OP_OR_CHECK, len(program))
+    elif guard.guards:
+        checks = []
+        for child in guard.guards:
+            _emit(child, program)
+            checks.append(len(program))
+            program.append(None)
+        for index in checks:
+            program[index] = (_OP_AND_CHECK, len(program))
+    else:
+        program.append((_OP_PASS, None))
+
+def _execute(program: tuple, request: Any):
+    """
+    Run a compiled guard program.
+
+    Returns ``(ok, failure)``. A failure is the GuardError a guard raised,
+    or the raw ``False``/message a leaf returned until a combinator turns
+    it into a ForbiddenError. Non-guard exceptions propagate.
+    """
+    ok = True
+    failure = None
+    or_errors = []
+    pc = 0
+    end = len(program)
+    while pc < end:
+        op, arg = program[pc]
+        pc += 1
+        if op == _OP_CALL:
+            try:
+                result = arg(request)
+            except GuardError as e:
+                ok = False
+                failure = e
+            else:
+                # False or a message string means the guard failed
+                if result is False or isinstance(result, str):
+                    ok = False
+                    failure = result
+                else:
+                    ok = True
+        elif op == _OP_AND_CHECK:
+            if not ok:
+                if failure is False:
+                    failure = ForbiddenError("Guard check failed")
+                elif isinstance(failure, str):
+                    failure = ForbiddenError(failure)
+                pc = arg
+        elif op == _OP_OR_CHECK:
+            if ok:
+                or_errors.pop()
+                pc = arg
+            elif isinstance(failure, GuardError):
+                or_errors[-1] = failure
+        elif op == _OP_OR_BEGIN:
+            or_errors.append(None)
+        elif op == _OP_OR_END:
+            last_error = or_errors.pop()
+            ok = False
+            failure = last_error or ForbiddenError("All guards failed")
+        elif op == _OP_NOT:
+            if ok:
+                ok = False
+                failure = ForbiddenError("Guard succeeded but was expected to fail")
+            else:
+                ok = True
+        elif op == _OP_CHECK:
+            if not ok:
+                if failure is False:
+                    failure = ForbiddenError("Access denied")
+                elif isinstance(failure, str):
+                    failure = ForbiddenError(failure)
+                return ok, failure
+        else:
+            ok = True
+    return ok, failure
+
+def compile_guards(guards: List[Callable]) -> tuple:
+    """Compile a route's guard list once, for :func:`run_compiled`.
+
+    The program checks the guards in order with the same semantics as
+    :func:`verify_guards`.
+    """
+    program = []
+    for guard in guards:
+        _emit(guard, program)
+        program.append((_OP_CHECK, None))
+    return tuple(program)
 
-        raise ForbiddenError("Guard succeeded but was expected to fail")
+def run_compiled(program: tuple, request: Any):
+    """Check a request against a program from :func:`compile_guards`."""
+    try:
+        ok, failure = _execute(program, request)
+    except GuardError:
+        raise
+    except Exception as e:
+        raise ForbiddenError(f"Guard error: {str(e)}")
+    if not ok:
+        raise failure
 
 def verify_guards(guards: List[Callable], request: Any):
     """Helper to verify a list of guards (AND logic by default)."""
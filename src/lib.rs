@@ -1549,12 +1549,16 @@ pub struct PyRedisConfig {
     pub tls: bool,
     #[pyo3(get, set)]
     pub key_prefix: Option<String>,
+    #[pyo3(get, set)]
+    pub max_inflight: usize,
+    #[pyo3(get, set)]
+    pub queue_timeout: Option<f64>,
 }
 
 #[pymethods]
 impl PyRedisConfig {
     #[new]
-    #[pyo3(signature = (url="redis://127.0.0.1:6379", pool_size=10, min_idle=1, connection_timeout_secs=5, idle_timeout_secs=300, cluster_mode=false, default_ttl=None, database=0, password=None, tls=false, key_prefix=None))]
+    #[pyo3(signature = (url="redis://127.0.0.1:6379", pool_size=10, min_idle=1, connection_timeout_secs=5, idle_timeout_secs=300, cluster_mode=false, default_ttl=None, database=0, password=None, tls=false, key_prefix=None, max_inflight=10000, queue_timeout=None))]
     pub fn new(
         url: &str,
         pool_size: usize,
@@ -1567,6 +1571,8 @@ impl PyRedisConfig {
         password: Option<String>,
         tls: bool,
         key_prefix: Option<String>,
+        max_inflight: usize,
+        queue_timeout: Option<f64>,
     ) -> Self {
         Self {
             url: url.to_string(),
@@ -1580,6 +1586,8 @@ impl PyRedisConfig {
             password,
             tls,
             key_prefix,
+            max_inflight,
+            queue_timeout,
         }
     }
 
@@ -1598,6 +1606,8 @@ impl PyRedisConfig {
             None,
             false,
             None,
+            10000,
+            None,
         )
     }
 
@@ -1606,7 +1616,7 @@ impl PyRedisConfig {
     #[pyo3(signature = (url, pool_size=20, password=None))]
     pub fn cluster(url: &str, pool_size: usize, password: Option<String>) -> Self {
         Self::new(
-            url, pool_size, 2, 5, 300, true, None, 0, password, false, None,
+            url, pool_size, 2, 5, 300, true, None, 0, password, false, None, 10000, None,
         )
     }
 }
@@ -1038,6 +1038,28 @@ def test_dependency_injection_registration():
     assert result2 is None
 
 
+def test_dependency_singletons_bound_at_registration():
+    """Test that registered singletons are pre-bound into Depends params."""
+    from cello import App, Depends
+
+    app = App()
+    db = {"url": "postgres://localhost/db"}
+    app.register_singleton("database", db)
+
+    def handler(request, db=Depends("database"), cache=Depends("cache")):
+        return db, cache
+
+    bound = app._bind_singletons(handler)
+    result_db, result_cache = bound(None)
+    assert result_db is db
+    assert isinstance(result_cache, Depends)
+
+    def plain(request):
+        return {}
+
+    assert app._bind_singletons(plain) is plain
+
+
 def test_version():
     """Test that version is 1.2.0."""
     import cello
@@ -1278,6 +1300,8 @@ def test_redis_config_creation():
 
     config = RedisConfig()
     assert config is not None
+    assert config.max_inflight == 10000
+    assert config.queue_timeout is None
 
 
 def test_redis_config_custom():
@@ -1424,6 +1448,55 @@ async def test_database_connect():
     assert db._pool is not None
 
 
+@pytest.mark.asyncio
+async def test_database_connect_prewarms_pool():
+    """Test Database/Redis.connect validate min_idle connections eagerly."""
+    from types import SimpleNamespace
+    from cello.database import Database, Redis
+
+    calls = []
+
+    class CountingDatabase(Database):
+        async def _warm_connection(self):
+            calls.append("db")
+
+    class CountingRedis(Redis):
+        async def _warm_connection(self):
+            calls.append("redis")
+
+    config = SimpleNamespace(min_idle=3)
+    await CountingDatabase.connect(config)
+    await CountingRedis.connect(config)
+    assert calls == ["db"] * 3 + ["redis"] * 3
+
+    calls.clear()
+    await CountingDatabase.connect(config, prewarm=False)
+    await CountingRedis.connect(config, prewarm=False)
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_database_prewarm_runs_concurrently():
+    """Test pool warm-up overlaps the connection handshakes."""
+    import asyncio
+    from types import SimpleNamespace
+    from cello.database import Database
+
+    active = 0
+    peak = 0
+
+    class SlowDatabase(Database):
+        async def _warm_connection(self):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+
+    await SlowDatabase.connect(SimpleNamespace(min_idle=4))
+    assert peak == 4
+
+
 @pytest.mark.asyncio
 async def test_database_fetch_all():
     """Test Database.fetch_all returns empty list (mock)."""
@@ -1449,6 +1522,157 @@ async def test_database_fetch_one():
     assert row is None
 
 
+@pytest.mark.asyncio
+async def test_database_fetch_val_and_tuples():
+    """Test fetch_val/fetch_all(as_tuple=True) delegate to the connection."""
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection
+
+    class FakeConnection(_Connection):
+        async def fetch_all(self, query, *params, as_tuple=False):
+            return [(1, "Alice")] if as_tuple else [{"id": 1, "name": "Alice"}]
+
+        async def fetch_one(self, query, *params):
+            return {"id": 1, "name": "Alice"}
+
+        async def fetch_val(self, query, *params, column=0):
+            return (1, "Alice")[column]
+
+    class FakeDatabase(Database):
+        async def _open_connection(self):
+            return FakeConnection()
+
+    db = await FakeDatabase.connect(DatabaseConfig("postgresql://localhost/test"))
+    assert await db.fetch_val("SELECT id, name FROM users") == 1
+    assert await db.fetch_val("SELECT id, name FROM users", column=1) == "Alice"
+    assert await db.fetch_all("SELECT id, name FROM users", as_tuple=True) == [(1, "Alice")]
+    assert await db.fetch_one("SELECT * FROM users WHERE id = $1", 1) == {"id": 1, "name": "Alice"}
+
+    async with await db.begin() as tx:
+        assert await tx.fetch_val("SELECT count(*) FROM users") == 1
+
+
+@pytest.mark.asyncio
+async def test_database_fetch_arrow():
+    """Test fetch_arrow wraps the connection's columns in a pyarrow Table."""
+    pa = pytest.importorskip("pyarrow")
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection
+
+    class ColumnarConnection(_Connection):
+        async def fetch_arrow(self, query, *params):
+            return {"id": [1, 2], "name": ["Alice", "Bob"]}
+
+    class FakeDatabase(Database):
+        async def _open_connection(self):
+            return ColumnarConnection()
+
+    db = await FakeDatabase.connect(DatabaseConfig("postgresql://localhost/test"))
+    table = await db.fetch_arrow("SELECT id, name FROM users")
+    assert isinstance(table, pa.Table)
+    assert table.to_pylist() == [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+
+
+@pytest.mark.asyncio
+async def test_database_iter_streams_through_cursor():
+    """Test Database.iter fetches rows in prefetch-sized batches inside a transaction."""
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection
+
+    rows = [{"id": i} for i in range(5)]
+    statements = []
+
+    class FakeConnection(_Connection):
+        def __init__(self):
+            self.pos = 0
+
+        async def execute(self, query, *params):
+            statements.append(query.split()[0])
+            return 0
+
+        async def fetch_all(self, query, *params, as_tuple=False):
+            statements.append("FETCH")
+            n = int(query.split()[2])
+            batch, self.pos = rows[self.pos:self.pos + n], self.pos + n
+            return batch
+
+    class FakeDatabase(Database):
+        async def _open_connection(self):
+            return FakeConnection()
+
+    db = await FakeDatabase.connect(DatabaseConfig("postgresql://localhost/test"), prewarm=False)
+    assert [r async for r in db.iter("SELECT id FROM t", prefetch=2)] == rows
+    assert statements == ["BEGIN", "DECLARE", "FETCH", "FETCH", "FETCH", "CLOSE", "COMMIT"]
+    assert len(db._idle) == 1
+
+    statements.clear()
+    db._idle[0].pos = 0
+    async with await db.begin() as tx:
+        assert [r async for r in tx.iter("SELECT id FROM t", prefetch=5)] == rows
+    assert statements == ["BEGIN", "DECLARE", "FETCH", "FETCH", "CLOSE", "COMMIT"]
+
+
+@pytest.mark.asyncio
+async def test_database_iter_keeps_fetch_error():
+    """Test a failing FETCH surfaces its own error instead of one from CLOSE."""
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection
+
+    statements = []
+
+    class FailingConnection(_Connection):
+        async def execute(self, query, *params):
+            statements.append(query.split()[0])
+            if query.startswith("CLOSE"):
+                raise RuntimeError("current transaction is aborted")
+            return 0
+
+        async def fetch_all(self, query, *params, as_tuple=False):
+            raise ValueError("division by zero")
+
+    class FakeDatabase(Database):
+        async def _open_connection(self):
+            return FailingConnection()
+
+    db = await FakeDatabase.connect(DatabaseConfig("postgresql://localhost/test"), prewarm=False)
+    with pytest.raises(ValueError):
+        [r async for r in db.iter("SELECT 1 / 0")]
+    assert statements == ["BEGIN", "DECLARE", "ROLLBACK"]
+    assert len(db._idle) == 1
+
+
+@pytest.mark.asyncio
+async def test_database_iter_inside_readonly_transactional():
+    """Test Database.iter opens a read-only transaction on a readonly binding."""
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection, transactional
+
+    statements = []
+
+    class FakeConnection(_Connection):
+        async def execute(self, query, *params):
+            statements.append(query if query.startswith("BEGIN") else query.split()[0])
+            return 0
+
+        async def fetch_all(self, query, *params, as_tuple=False):
+            statements.append("FETCH")
+            return [{"id": 1}]
+
+    class FakeDatabase(Database):
+        async def _open_connection(self):
+            return FakeConnection()
+
+    db = await FakeDatabase.connect(DatabaseConfig("postgresql://localhost/test"), prewarm=False)
+
+    @transactional(readonly=True)
+    async def export(request, db=None):
+        return [r async for r in db.iter("SELECT id FROM t", prefetch=2)]
+
+    assert await export(None, db=db) == [{"id": 1}]
+    assert statements == ["BEGIN READ ONLY", "DECLARE", "FETCH", "CLOSE", "COMMIT"]
+    assert len(db._idle) == 1
+
+
 @pytest.mark.asyncio
 async def test_database_execute():
     """Test Database.execute returns 0 (mock)."""
@@ -1461,6 +1685,131 @@ async def test_database_execute():
     assert count == 0
 
 
+@pytest.mark.asyncio
+async def test_database_execute_many():
+    """Test Database.execute_many accepts a batch of parameter sets."""
+    from cello import DatabaseConfig
+    from cello.database import Database
+
+    db = await Database.connect(DatabaseConfig("postgresql://localhost/test"))
+    rows = (("Alice", 30), ("Bob", 25))
+    count = await db.execute_many("INSERT INTO users (name, age) VALUES ($1, $2)", rows)
+    assert count == 0  # Mock returns 0
+    assert await db.execute_many("DELETE FROM users WHERE id = $1", []) == 0
+
+    tx = await db.begin()
+    assert await tx.execute_many("DELETE FROM users WHERE id = $1", [(1,), (2,)]) == 0
+
+
+@pytest.mark.asyncio
+async def test_database_runs_sync_driver_in_thread():
+    """Test blocking connection methods are run off the event loop."""
+    import threading
+    from cello import DatabaseConfig
+    from cello.database import Database
+
+    loop_thread = threading.get_ident()
+    threads = []
+
+    class BlockingConnection:
+        def execute(self, query, *params):
+            threads.append(threading.get_ident())
+            return 1
+
+        def fetch_one(self, query, *params):
+            threads.append(threading.get_ident())
+            return {"id": params[0]}
+
+    class FakeDatabase(Database):
+        async def _open_connection(self):
+            return BlockingConnection()
+
+    db = await FakeDatabase.connect(DatabaseConfig("postgresql://localhost/test"))
+    assert await db.execute("UPDATE users SET active = true") == 1
+    assert await db.fetch_one("SELECT * FROM users WHERE id = $1", 7) == {"id": 7}
+    assert threads and loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_database_caps_checkouts_per_request():
+    """Test concurrent statements of one request share per_request_limit connections."""
+    import asyncio
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection, _request_scoped
+
+    in_use = 0
+    peak = 0
+
+    class SlowConnection(_Connection):
+        async def fetch_all(self, query, *params, as_tuple=False):
+            nonlocal in_use, peak
+            in_use += 1
+            peak = max(peak, in_use)
+            await asyncio.sleep(0)
+            in_use -= 1
+            return []
+
+    class FakeDatabase(Database):
+        per_request_limit = 2
+
+        async def _open_connection(self):
+            return SlowConnection()
+
+    db = await FakeDatabase.connect(DatabaseConfig("postgresql://localhost/test"), prewarm=False)
+
+    @_request_scoped
+    async def request():
+        await asyncio.gather(*[db.fetch_all("SELECT 1") for _ in range(8)])
+        await db.fetch_all("SELECT 1")
+
+    await request()
+    assert peak == 2
+    assert len(db._idle) == 2 and not db._leases
+
+
+@pytest.mark.asyncio
+async def test_database_prepare_parses_once_per_connection():
+    """Test prepared statements prepare once per connection and check arity."""
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection
+
+    prepared = []
+    calls = []
+
+    class PreparingConnection(_Connection):
+        async def prepare(self, query):
+            prepared.append(query)
+            return ("stmt", query)
+
+        async def execute_prepared(self, stmt, params):
+            calls.append((stmt, params))
+            return 1
+
+        async def fetch_prepared(self, stmt, params, as_tuple=False, max_rows=0):
+            calls.append((stmt, params, max_rows))
+            return [{"id": params[0]}]
+
+    class FakeDatabase(Database):
+        async def _open_connection(self):
+            return PreparingConnection()
+
+    db = await FakeDatabase.connect(DatabaseConfig("postgresql://localhost/test"))
+    update = await db.prepare("UPDATE users SET name = $2 WHERE id = $1")
+    assert update.param_count == 2
+    assert await update.execute(1, "Alice") == 1
+    assert await update.execute(2, "Bob") == 1
+    assert prepared == ["UPDATE users SET name = $2 WHERE id = $1"]
+    assert calls[1] == (("stmt", update.query), (2, "Bob"))
+
+    with pytest.raises(TypeError):
+        await update.execute(1)
+
+    get_user = await db.prepare("SELECT * FROM users WHERE id = $1")
+    assert await get_user.fetch_one(7) == {"id": 7}
+    assert calls[-1][2] == 1
+    assert (await db.prepare("SELECT now()")).param_count == 0
+
+
 @pytest.mark.asyncio
 async def test_database_begin_transaction():
     """Test Database.begin returns a Transaction."""
@@ -1551,6 +1900,43 @@ async def test_transaction_context_manager_rollback():
     assert tx._committed is False
 
 
+@pytest.mark.asyncio
+async def test_transaction_binds_one_connection():
+    """Test a transaction runs on one connection and returns it LIFO."""
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection
+
+    statements = []
+
+    class RecordingConnection(_Connection):
+        async def execute(self, query, *params):
+            statements.append((id(self), query))
+            return 0
+
+    class RecordingDatabase(Database):
+        async def _open_connection(self):
+            return RecordingConnection()
+
+    db = await RecordingDatabase.connect(DatabaseConfig("sqlite://test.db"), prewarm=False)
+    async with await db.begin() as tx:
+        await tx.execute("UPDATE accounts SET balance = 0 WHERE id = $1", 1)
+        await tx.execute("UPDATE accounts SET balance = 1 WHERE id = $1", 2)
+    assert tx._committed is True
+    assert [q for _, q in statements] == ["BEGIN", "UPDATE accounts SET balance = 0 WHERE id = $1",
+                                          "UPDATE accounts SET balance = 1 WHERE id = $1", "COMMIT"]
+    assert len({conn for conn, _ in statements}) == 1
+
+    other = await db._open_connection()
+    db._release(other)
+    tx = await db.begin()
+    assert tx._conn is other
+    await tx.rollback()
+    await tx.rollback()
+    assert tx._rolled_back is True
+    with pytest.raises(RuntimeError):
+        await tx.execute("SELECT 1")
+
+
 @pytest.mark.asyncio
 async def test_transaction_execute():
     """Test executing queries within a transaction."""
@@ -1628,6 +2014,103 @@ async def test_redis_get_set():
     assert value is None
 
 
+@pytest.mark.asyncio
+async def test_redis_json_values_and_raw_bytes():
+    """Test set/get_json round-trip and get(decode=False) returns bytes."""
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    store = {}
+
+    class DictRedis(Redis):
+        async def _round_trip(self, buf, commands):
+            replies = []
+            for args in commands:
+                if args[0] == "SET":
+                    store[args[1]] = bytes(args[2]) if isinstance(args[2], (bytes, bytearray)) else str(args[2]).encode()
+                    replies.append("OK")
+                else:
+                    replies.append(store.get(args[1]))
+            return replies
+
+    redis = await DictRedis.connect(RedisConfig(), prewarm=False)
+    assert await redis.set_json("user", {"name": "Alice", "roles": ["admin"]}) is True
+    assert await redis.get_json("user") == {"name": "Alice", "roles": ["admin"]}
+    assert await redis.get_json("missing") is None
+
+    await redis.set("config", {"debug": True})
+    assert store["config"] == b'{"debug":true}'
+
+    await redis.set("name", "Alice")
+    assert await redis.get("name") == "Alice"
+    assert await redis.get("name", decode=False) == b"Alice"
+
+
+@pytest.mark.asyncio
+async def test_redis_value_writes_encode_like_set():
+    """Test mset, hset, hset_many and pushes encode values the way set does."""
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    sent = []
+
+    class RecordingRedis(Redis):
+        async def _round_trip(self, buf, commands):
+            sent.extend(commands)
+            return ["OK"] * len(commands)
+
+    redis = await RecordingRedis.connect(RedisConfig(), prewarm=False)
+    value = {"a": 1}
+    await redis.set("k", value)
+    await redis.mset({"k": value})
+    await redis.hset("h", "f", value)
+    await redis.hset_many("h", {"f": value})
+    await redis.rpush("l", value, "plain")
+    await redis.lpush("l", value)
+
+    encoded = sent[0][2]
+    assert encoded == b'{"a":1}'
+    assert sent[1:] == [
+        ("MSET", "k", encoded),
+        ("HSET", "h", "f", encoded),
+        ("HSET", "h", "f", encoded),
+        ("RPUSH", "l", encoded, "plain"),
+        ("LPUSH", "l", encoded),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_redis_read_commands_decode_alike():
+    """Test every read command decodes to str unless decode=False."""
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    replies = {
+        "MGET": [b"Alice", None],
+        "HGET": b"Alice",
+        "HGETALL": [b"name", b"Alice"],
+        "LPOP": b"task1",
+        "LRANGE": [b"task1", b"task2"],
+    }
+
+    class ReplyRedis(Redis):
+        async def _round_trip(self, buf, commands):
+            return [replies[args[0]] for args in commands]
+
+    redis = await ReplyRedis.connect(RedisConfig(), prewarm=False)
+    assert await redis.mget(["a", "b"]) == ["Alice", None]
+    assert await redis.hget("user:1", "name") == "Alice"
+    assert await redis.hgetall("user:1") == {"name": "Alice"}
+    assert await redis.lpop("queue") == "task1"
+    assert await redis.lrange("queue") == ["task1", "task2"]
+
+    assert await redis.mget(["a", "b"], decode=False) == [b"Alice", None]
+    assert await redis.hget("user:1", "name", decode=False) == b"Alice"
+    assert await redis.hgetall("user:1", decode=False) == {b"name": b"Alice"}
+    assert await redis.lpop("queue", decode=False) == b"task1"
+    assert await redis.lrange("queue", decode=False) == [b"task1", b"task2"]
+
+
 @pytest.mark.asyncio
 async def test_redis_delete():
     """Test Redis delete operation."""
@@ -1725,6 +2208,401 @@ async def test_redis_publish():
     assert isinstance(count, int)
 
 
+@pytest.mark.asyncio
+async def test_redis_pipeline_sends_one_batch():
+    """Test Redis.pipeline queues commands and sends them together."""
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    redis = await Redis.connect(RedisConfig())
+    batches = []
+    send = redis._send
+
+    async def recording_send(commands):
+        batches.append(commands)
+        return await send(commands)
+
+    redis._send = recording_send
+
+    async with redis.pipeline() as pipe:
+        stored = pipe.set("key", "value", ttl=60)
+        value = pipe.get("key")
+        removed = pipe.delete("key")
+        assert len(pipe) == 3
+        assert not stored.done()
+
+    assert batches == [[
+        ("SET", "key", "value", "EX", 60),
+        ("GET", "key"),
+        ("DEL", "key"),
+    ]]
+    assert stored.result() is True
+    assert value.result() is None
+    assert removed.result() is True
+
+    pipe = redis.pipeline()
+    pipe.incr("a")
+    pipe.hgetall("h")
+    assert await pipe.execute() == [0, {}]
+    assert await pipe.execute() == []
+
+
+@pytest.mark.asyncio
+async def test_redis_failed_conversion_resolves_rest_of_batch():
+    """Test a converter error fails only its command and short replies fail the rest."""
+    import asyncio
+    from cello import RedisConfig
+    from cello.database import Redis, RedisError
+
+    replies = {"bad": b"\xff\xfe", "good": b"ok"}
+    short = False
+
+    class ReplyRedis(Redis):
+        async def _round_trip(self, buf, commands):
+            batch = [replies.get(args[1]) for args in commands]
+            return batch[:1] if short else batch
+
+    redis = await ReplyRedis.connect(RedisConfig(), prewarm=False)
+    results = await asyncio.wait_for(asyncio.gather(
+        redis.get("bad"), redis.get("good"), redis.exists("good"),
+        return_exceptions=True,
+    ), timeout=1)
+    assert isinstance(results[0], UnicodeDecodeError)
+    assert results[1:] == ["ok", True]
+
+    pipe = redis.pipeline()
+    bad, good = pipe.get("bad"), pipe.get("good")
+    results = await pipe.execute()
+    assert isinstance(results[0], UnicodeDecodeError)
+    assert results[1] == "ok" and good.result() == "ok"
+    assert isinstance(bad.exception(), UnicodeDecodeError)
+
+    short = True
+    pipe = redis.pipeline()
+    first, second = pipe.get("good"), pipe.get("good")
+    results = await pipe.execute()
+    assert first.result() == "ok"
+    assert isinstance(results[1], RedisError)
+    with pytest.raises(RedisError):
+        second.result()
+
+
+@pytest.mark.asyncio
+async def test_redis_auto_pipelines_same_tick():
+    """Test concurrent Redis commands are coalesced into one batch."""
+    import asyncio
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    redis = await Redis.connect(RedisConfig())
+    batches = []
+    send = redis._send
+
+    async def recording_send(commands):
+        batches.append(commands)
+        return await send(commands)
+
+    redis._send = recording_send
+
+    results = await asyncio.gather(
+        redis.set("a", 1), redis.get("a"), redis.exists("a")
+    )
+    assert results == [True, None, False]
+    assert batches == [[("SET", "a", 1), ("GET", "a"), ("EXISTS", "a")]]
+
+    await redis.incr("n")
+    assert len(batches) == 2
+
+
+def test_redis_commands_are_coroutine_functions():
+    """Test Redis commands stay coroutine functions while Pipeline queues Futures."""
+    import asyncio
+    import inspect
+    from cello.database import Redis, Pipeline
+
+    redis = Redis()
+    assert inspect.iscoroutinefunction(redis.get)
+    assert inspect.iscoroutinefunction(redis.set)
+    assert redis.get.__doc__ == Pipeline.get.__doc__
+    assert not inspect.iscoroutinefunction(Pipeline.get)
+
+    async def main():
+        task = asyncio.create_task(redis.set("k", "v"))
+        assert await task is True
+        return await redis.get("k")
+
+    assert asyncio.run(main()) is None
+    assert asyncio.run(redis.exists("k")) is False
+
+
+@pytest.mark.asyncio
+async def test_redis_runs_blocking_round_trip_in_thread():
+    """Test a blocking _round_trip is run off the event loop."""
+    import threading
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    loop_thread = threading.get_ident()
+    threads = []
+
+    class BlockingRedis(Redis):
+        def _round_trip(self, buf, commands):
+            threads.append(threading.get_ident())
+            return ["PONG" for _ in commands]
+
+    redis = await BlockingRedis.connect(RedisConfig())
+    assert await redis.get("a") == "PONG"
+    assert threads and loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_redis_bounds_inflight_commands():
+    """Test commands beyond max_inflight wait for a slot or time out."""
+    import asyncio
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    batches = []
+    gate = asyncio.Event()
+
+    class SlowRedis(Redis):
+        async def _round_trip(self, buf, commands):
+            batches.append(len(commands))
+            await gate.wait()
+            return [None] * len(commands)
+
+    redis = await SlowRedis.connect(RedisConfig(max_inflight=2), prewarm=False)
+    pending = asyncio.gather(*[redis.get(f"k{i}") for i in range(5)])
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert batches == [2]
+    gate.set()
+    assert await pending == [None] * 5
+    assert batches == [2, 2, 1]
+    assert redis._inflight == 0
+
+    gate.clear()
+    redis = await SlowRedis.connect(RedisConfig(max_inflight=1, queue_timeout=0.01), prewarm=False)
+    first = asyncio.ensure_future(redis.get("a"))
+    await asyncio.sleep(0)
+    with pytest.raises(asyncio.TimeoutError):
+        await redis.get("b")
+    gate.set()
+    assert await first is None
+
+
+@pytest.mark.asyncio
+async def test_redis_mset_mget_single_command():
+    """Test mset/mget map to one MSET/MGET command."""
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    redis = await Redis.connect(RedisConfig())
+    batches = []
+    send = redis._send
+
+    async def recording_send(commands):
+        batches.append(commands)
+        return await send(commands)
+
+    redis._send = recording_send
+
+    assert await redis.mset({"a": 1, "b": 2}) is True
+    assert await redis.mget(["a", "b", "c"]) == [None, None, None]
+    assert batches == [[("MSET", "a", 1, "b", 2)], [("MGET", "a", "b", "c")]]
+
+
+@pytest.mark.asyncio
+async def test_redis_script_falls_back_to_eval_on_noscript():
+    """Test Script uses EVALSHA and resends the source once on NOSCRIPT."""
+    import hashlib
+    from cello import RedisConfig
+    from cello.database import Redis, RedisError
+
+    sent = []
+    loaded = set()
+
+    class LuaRedis(Redis):
+        async def _round_trip(self, buf, commands):
+            replies = []
+            for args in commands:
+                sent.append(args[0])
+                if args[0] == "EVAL":
+                    loaded.add(hashlib.sha1(args[1].encode()).hexdigest())
+                    replies.append(1)
+                elif args[1] in loaded:
+                    replies.append(1)
+                else:
+                    replies.append(RedisError("NOSCRIPT No matching script."))
+            return replies
+
+    redis = await LuaRedis.connect(RedisConfig(), prewarm=False)
+    script = redis.register_script("return 1")
+    assert redis.register_script("return 1") is script
+    assert await script(keys=["k"], args=["a"]) == 1
+    assert await script() == 1
+    assert sent == ["EVALSHA", "EVAL", "EVALSHA"]
+
+    assert await redis.rate_limit_check("rl:1", limit=10, window=60) is True
+    assert await redis.compare_and_set("k", "old", "new") is True
+
+
+@pytest.mark.asyncio
+async def test_redis_bulk_push_and_variadic_helpers():
+    """Test bulk_push chunks values into variadic commands sent in one batch."""
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    batches = []
+
+    class RecordingRedis(Redis):
+        async def _round_trip(self, buf, commands):
+            batches.append(commands)
+            return [len(args) - 2 for args in commands]
+
+    redis = await RecordingRedis.connect(RedisConfig(), prewarm=False)
+    assert await redis.bulk_push("q", range(5), chunk=2) == 1
+    assert batches == [[("RPUSH", "q", 0, 1), ("RPUSH", "q", 2, 3), ("RPUSH", "q", 4)]]
+    assert await redis.bulk_push("q", [], side="l") == 0
+    with pytest.raises(ValueError):
+        await redis.bulk_push("q", [1], side="x")
+
+    batches.clear()
+    await redis.hset_many("h", {"a": 1, "b": 2})
+    await redis.sadd("s", "x", "y")
+    assert batches == [[("HSET", "h", "a", 1, "b", 2)], [("SADD", "s", "x", "y")]]
+
+
+@pytest.mark.asyncio
+async def test_redis_scan_and_hscan_follow_cursor():
+    """Test scan/hscan page through the cursor until it returns to 0."""
+    from cello import RedisConfig
+    from cello.database import Redis
+
+    sent = []
+    pages = {
+        "SCAN": {0: [b"7", [b"a", b"b"]], 7: [b"0", [b"c"]]},
+        "HSCAN": {0: [b"3", [b"f1", b"v1"]], 3: [b"0", [b"f2", b"v2"]]},
+    }
+
+    class ScanRedis(Redis):
+        async def _round_trip(self, buf, commands):
+            sent.extend(commands)
+            # The cursor follows the command name (SCAN) or the key (HSCAN)
+            return [pages[args[0]][args[1] if args[0] == "SCAN" else args[2]] for args in commands]
+
+    redis = await ScanRedis.connect(RedisConfig(), prewarm=False)
+    assert [k async for k in redis.scan(count=10)] == ["a", "b", "c"]
+    assert sent == [("SCAN", 0, "COUNT", 10), ("SCAN", 7, "COUNT", 10)]
+
+    sent.clear()
+    pairs = [p async for p in redis.hscan("h", match="f*", decode=False)]
+    assert pairs == [(b"f1", b"v1"), (b"f2", b"v2")]
+    assert sent[0] == ("HSCAN", "h", 0, "MATCH", "f*", "COUNT", 1000)
+
+
+def test_redis_resp_encoding():
+    """Test commands are encoded as RESP arrays of bulk strings."""
+    from cello.database import _encode_command
+
+    buf = bytearray()
+    _encode_command(buf, ("SET", "k", 10))
+    _encode_command(buf, ("GET", b"k"))
+    assert bytes(buf) == (
+        b"*3\r\n$3\r\nSET\r\n$1\r\nk\r\n$2\r\n10\r\n"
+        b"*2\r\n$3\r\nGET\r\n$1\r\nk\r\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_reuses_send_buffers():
+    """Test batches are encoded into a pooled buffer, overwriting old bytes."""
+    from cello import RedisConfig
+    from cello.database import Redis, _encode_command
+
+    buf = bytearray(b"stale bytes that are longer than the command")
+    end = _encode_command(buf, ("GET", "k"), 0)
+    assert bytes(buf[:end]) == b"*2\r\n$3\r\nGET\r\n$1\r\nk\r\n"
+
+    sent = []
+
+    class RecordingRedis(Redis):
+        async def _round_trip(self, buf, commands):
+            sent.append((id(buf.obj), bytes(buf)))
+            return [None] * len(commands)
+
+    redis = await RecordingRedis.connect(RedisConfig(), prewarm=False)
+    await redis.set("key", "a much longer value than the next one")
+    await redis.get("k")
+    assert sent[0][0] == sent[1][0]
+    assert sent[1][1] == b"*2\r\n$3\r\nGET\r\n$1\r\nk\r\n"
+    assert len(redis._buf_pool) == 1
+
+
+def test_redis_resp_reader_parses_fragmented_replies():
+    """Test RESP replies are parsed incrementally as bytes arrive."""
+    from cello.database import RedisError, _NO_REPLY, _RespReader
+
+    data = b"+OK\r\n:42\r\n$5\r\nhello\r\n$-1\r\n*2\r\n$1\r\na\r\n:1\r\n-ERR boom\r\n"
+    reader = _RespReader()
+    replies = []
+    for i in range(len(data)):
+        reader.feed(data[i:i + 1])
+        while (reply := reader.gets()) is not _NO_REPLY:
+            replies.append(reply)
+    assert replies[:5] == ["OK", 42, b"hello", None, [b"a", 1]]
+    assert isinstance(replies[5], RedisError) and str(replies[5]) == "ERR boom"
+
+
+@pytest.mark.asyncio
+async def test_redis_stream_reader_task_resolves_batches_in_order():
+    """Test one reader task matches streamed replies to batches in write order."""
+    import asyncio
+    from cello import RedisConfig
+    from cello.database import Redis, RedisError
+
+    reader = asyncio.StreamReader()
+    written = []
+
+    class FakeWriter:
+        def write(self, data):
+            written.append(bytes(data))
+
+        async def drain(self):
+            pass
+
+        def close(self):
+            pass
+
+    redis = await Redis.connect(RedisConfig(), prewarm=False)
+    redis._attach(reader, FakeWriter())
+
+    first = asyncio.ensure_future(redis.get("a"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    pipe = redis.pipeline()
+    pipe.incr("n")
+    pipe.get("missing")
+    second = asyncio.ensure_future(pipe.execute())
+    await asyncio.sleep(0)
+    assert len(written) == 2 and not first.done()
+
+    # Replies arrive split across reads
+    reader.feed_data(b"$5\r\nval")
+    reader.feed_data(b"ue\r\n:7\r\n$-1\r\n")
+    assert await first == "value"
+    assert await second == [7, None]
+
+    failing = asyncio.ensure_future(redis.incr("s"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    reader.feed_data(b"-WRONGTYPE not an integer\r\n")
+    with pytest.raises(RedisError):
+        await failing
+
+    await redis.close()
+
+
 @pytest.mark.asyncio
 async def test_redis_close():
     """Test Redis close resets client."""
@@ -1813,8 +2691,143 @@ async def test_transactional_rollbacks_on_error():
         await failing_handler(None, db=db)
 
 
-# =============================================================================
-# v0.8.0 Guards Tests
+@pytest.mark.asyncio
+async def test_transactional_uses_request_state_db():
+    """Test @transactional finds the database on request.state."""
+    from types import SimpleNamespace
+    from cello.database import transactional, Database
+
+    db = Database()
+
+    @transactional
+    async def handler(request, **kwargs):
+        return kwargs.get("_transaction")
+
+    request = SimpleNamespace(state=SimpleNamespace(db=db))
+    tx = await handler(request)
+    assert tx is not None and tx._committed is True
+
+    assert await handler(SimpleNamespace()) is None
+
+
+@pytest.mark.asyncio
+async def test_transactional_binds_db_to_transaction_connection():
+    """Test db calls inside @transactional run on the transaction's connection."""
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection, transactional
+
+    used = []
+
+    class RecordingConnection(_Connection):
+        async def execute(self, query, *params):
+            used.append((self, query))
+            return 1
+
+    class FakeDatabase(Database):
+        async def _open_connection(self):
+            return RecordingConnection()
+
+    db = await FakeDatabase.connect(DatabaseConfig("postgresql://localhost/test"), prewarm=False)
+
+    @transactional
+    async def handler(request, db=None, **kwargs):
+        await db.execute("UPDATE a SET x = 1")
+        await db.execute("UPDATE b SET y = 2")
+
+    await handler(None, db=db)
+    assert [q for _, q in used] == ["BEGIN", "UPDATE a SET x = 1", "UPDATE b SET y = 2", "COMMIT"]
+    assert len({conn for conn, _ in used}) == 1
+    assert db._bound_connection() is None and len(db._idle) == 1
+
+
+@pytest.mark.asyncio
+async def test_transactional_readonly_and_isolation():
+    """Test readonly handlers skip BEGIN/COMMIT and use the read pool."""
+    from cello import DatabaseConfig
+    from cello.database import Database, _Connection, transactional
+
+    used = []
+
+    class RecordingConnection(_Connection):
+        def __init__(self, pool):
+            self.pool = pool
+
+        async def execute(self, query, *params):
+            used.append((self.pool, query))
+            return 0
+
+    class FakeDatabase(Database):
+        async def _open_connection(self):
+            return RecordingConnection(self._config.url)
+
+    config = DatabaseConfig("postgresql://primary/app")
+    db = await FakeDatabase.connect(config, prewarm=False)
+    db.read_pool = await FakeDatabase.connect(DatabaseConfig("postgresql://replica/app"), prewarm=False)
+
+    @transactional(readonly=True)
+    async def report(request, db=None, **kwargs):
+        await db.execute("SELECT 1")
+        await db.execute("SELECT 2")
+        return "_transaction" in kwargs
+
+    assert await report(None, db=db) is False
+    assert used == [("postgresql://replica/app", "SELECT 1"), ("postgresql://replica/app", "SELECT 2")]
+    assert len(db.read_pool._idle) == 1 and not db._idle
+
+    used.clear()
+
+    @transactional(isolation="serializable")
+    async def transfer(request, db=None, **kwargs):
+        await db.execute("UPDATE a SET x = 1")
+
+    await transfer(None, db=db)
+    assert [q for _, q in used] == [
+        "BEGIN ISOLATION LEVEL SERIALIZABLE", "UPDATE a SET x = 1", "COMMIT"
+    ]
+
+    with pytest.raises(ValueError):
+        transactional(isolation="chaos")
+
+
+@pytest.mark.asyncio
+async def test_transactional_supports_sync_drivers():
+    """Test @transactional drives sync begin/commit/rollback methods."""
+    from cello.database import transactional
+
+    class SyncTx:
+        def __init__(self, log):
+            self.log = log
+
+        def commit(self):
+            self.log.append("commit")
+
+        def rollback(self):
+            self.log.append("rollback")
+
+    class SyncDriver:
+        def __init__(self):
+            self.log = []
+
+        def begin(self):
+            self.log.append("begin")
+            return SyncTx(self.log)
+
+    @transactional
+    def handler(request, db=None, fail=False, **kwargs):
+        assert isinstance(kwargs["_transaction"], SyncTx)
+        if fail:
+            raise ValueError("boom")
+        return "ok"
+
+    db = SyncDriver()
+    assert await handler(None, db=db) == "ok"
+    with pytest.raises(ValueError):
+        await handler(None, db=db, fail=True)
+    assert db.log == ["begin", "commit", "begin", "rollback"]
+
+
+# =============================================================================
+# v0.8.0 Guards Tests
 # =============================================================================
 
 
@@ -1940,6 +2953,75 @@ def test_authenticated_guard_fail():
         guard(MockRequest())
 
 
+def test_role_and_permission_sets():
+    """Test frozen role/permission sets and the single-item membership path."""
+    from cello.guards import Role, Permission, ForbiddenError
+
+    class MockRequest:
+        def __init__(self, user):
+            self.context = {"user": user}
+
+    admin = Role(["admin"])
+    assert admin.roles == frozenset({"admin"})
+    assert admin(MockRequest({"roles": ["user", "admin"]})) is True
+    assert admin(MockRequest({"roles": "admin"})) is True
+    # A single role string is a role, not a substring source
+    with pytest.raises(ForbiddenError, match="Requires one of roles: admin"):
+        admin(MockRequest({"roles": "superadmin"}))
+
+    both = Role(["admin", "ops"], require_all=True)
+    assert both._single is None
+    with pytest.raises(ForbiddenError, match="Missing required roles: ops"):
+        both(MockRequest({"roles": ["admin"]}))
+
+    write = Permission(["users:write"])
+    assert write(MockRequest({"permissions": ["users:write"]})) is True
+    with pytest.raises(ForbiddenError, match="Missing required permissions: users:write"):
+        write(MockRequest({"permissions": ["users:read"]}))
+    either = Permission(["a", "b"], require_all=False)
+    assert either(MockRequest({"permissions": ["b"]})) is True
+
+
+def test_guards_missing_context_or_claims():
+    """Test guards fail cleanly when the request has no context or claims."""
+    from cello.guards import Role, Permission, Authenticated, ForbiddenError, UnauthorizedError
+
+    class Bare:
+        pass
+
+    class NoRoles:
+        context = {"user": {"name": "ann"}}
+
+    for guard in (Role(["admin"]), Permission(["read"]), Authenticated()):
+        with pytest.raises(UnauthorizedError):
+            guard(Bare())
+    with pytest.raises(ForbiddenError):
+        Role(["admin"])(NoRoles())
+    with pytest.raises(ForbiddenError):
+        Permission(["read"])(NoRoles())
+    assert Permission([])(NoRoles()) is True
+
+
+def test_guards_read_context_by_key():
+    """Test guards only need item access on the request context."""
+    from cello.guards import Role, Authenticated, UnauthorizedError
+
+    class Context:
+        def __getitem__(self, key):
+            if key == "user":
+                return {"roles": ["admin"]}
+            raise KeyError(key)
+
+    class MockRequest:
+        context = Context()
+
+    assert Authenticated()(MockRequest()) is True
+    assert Role(["admin"])(MockRequest()) is True
+    with pytest.raises(UnauthorizedError) as exc_info:
+        Authenticated(user_key="account")(MockRequest())
+    assert exc_info.value.__context__ is None or exc_info.value.__suppress_context__
+
+
 def test_and_guard():
     """Test And guard requires all guards to pass."""
     from cello.guards import And, Role, Permission, ForbiddenError
@@ -2027,6 +3109,90 @@ def test_verify_guards_fails():
         verify_guards(guards, MockRequest())
 
 
+def test_nested_guards_short_circuit_and_messages():
+    """Test compiled And/Or/Not keep call order, short-circuiting and errors."""
+    from cello.guards import And, Or, Not, ForbiddenError, UnauthorizedError
+
+    calls = []
+
+    def leaf(name, result):
+        def guard(request):
+            calls.append(name)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return guard
+
+    guard = Or(
+        And(leaf("a", True), leaf("b", "no b"), leaf("c", True)),
+        Not(leaf("d", True)),
+        And(leaf("e", True), Or(leaf("f", False), leaf("g", True))),
+        leaf("h", True),
+    )
+    assert guard(None) is True
+    assert calls == ["a", "b", "d", "e", "f", "g"]
+
+    with pytest.raises(ForbiddenError, match="no b"):
+        And(leaf("a", True), leaf("b", "no b"))(None)
+    with pytest.raises(ForbiddenError, match="Guard check failed"):
+        And(leaf("a", False))(None)
+    with pytest.raises(UnauthorizedError):
+        Or(leaf("x", UnauthorizedError()), leaf("y", False))(None)
+    with pytest.raises(ForbiddenError, match="All guards failed"):
+        Or(leaf("x", False), leaf("y", "nope"))(None)
+    with pytest.raises(ForbiddenError, match="expected to fail"):
+        Not(And())(None)
+    assert Not(Or())(None) is True
+    assert Not(Not(leaf("z", True)))(None) is True
+    with pytest.raises(KeyError):
+        Or(leaf("k", KeyError("boom")), leaf("m", True))(None)
+
+
+def test_compiled_route_guards_match_verify_guards():
+    """Test compile_guards/run_compiled check a route like verify_guards."""
+    from cello.guards import (
+        compile_guards, run_compiled, verify_guards, And, Authenticated,
+        ForbiddenError, UnauthorizedError,
+    )
+
+    class MockRequest:
+        context = {}
+
+    def crash(request):
+        raise RuntimeError("db down")
+
+    cases = [
+        ([Authenticated()], UnauthorizedError, "Authentication required"),
+        ([lambda r: True, lambda r: False], ForbiddenError, "Access denied"),
+        ([lambda r: "read only"], ForbiddenError, "read only"),
+        ([And(lambda r: False)], ForbiddenError, "Guard check failed"),
+        ([And(crash)], ForbiddenError, "Guard error: db down"),
+    ]
+    for guards, error, message in cases:
+        program = compile_guards(guards)
+        with pytest.raises(error) as compiled:
+            run_compiled(program, MockRequest())
+        with pytest.raises(error) as reference:
+            verify_guards(guards, MockRequest())
+        assert compiled.value.message == reference.value.message == message
+
+    assert run_compiled(compile_guards([]), MockRequest()) is None
+    assert run_compiled(compile_guards([lambda r: None]), MockRequest()) is None
+
+
+def test_constant_time_compare_str_and_bytes():
+    """Test constant_time_compare over str, bytes and mixed inputs."""
+    from cello.guards import constant_time_compare
+
+    assert constant_time_compare("s3cret", "s3cret") is True
+    assert constant_time_compare("s3cret", "s3creT") is False
+    assert constant_time_compare(b"s3cret", b"s3cret") is True
+    assert constant_time_compare(b"s3cret", b"other") is False
+    assert constant_time_compare("clé", "clé".encode("utf-8")) is True
+    assert constant_time_compare(bytearray(b"tok"), "tok") is True
+    assert constant_time_compare(memoryview(b"tok"), b"tok!") is False
+
+
 def test_guard_error_hierarchy():
     """Test guard error class hierarchy."""
     from cello.guards import GuardError, ForbiddenError, UnauthorizedError
@@ -2065,6 +3231,100 @@ def test_logs_parameter_name():
     assert "logs" in param_names
 
 
+def test_resolve_run_config_defaults():
+    """Test run() config resolution without CLI arguments."""
+    from cello import _UNSET, _resolve_run_config
+
+    config = _resolve_run_config(
+        "127.0.0.1", 8000, _UNSET, _UNSET, _UNSET, False, _UNSET, None
+    )
+    assert config.env == "development"
+    assert config.debug is True
+    assert config.logs is True
+    assert config.workers is None
+    assert config.reload is False
+
+    config = _resolve_run_config(
+        "127.0.0.1", 8000, _UNSET, "production", _UNSET, False, _UNSET, None
+    )
+    assert config.debug is False
+    assert config.logs is False
+
+
+def test_resolve_run_config_cli_precedence():
+    """Test CLI host/port/reload override run() while other explicit arguments win."""
+    from cello import _UNSET, _resolve_run_config
+
+    argv = ["--env", "production", "--workers", "8", "--reload", "--no-logs"]
+    config = _resolve_run_config(
+        "127.0.0.1", 8000, _UNSET, _UNSET, _UNSET, False, _UNSET, argv
+    )
+    assert config.env == "production"
+    assert config.workers == 8
+    assert config.reload is True
+    assert config.debug is False
+    assert config.logs is False
+
+    config = _resolve_run_config(
+        "127.0.0.1", 8000, True, "development", 2, False, True, argv
+    )
+    assert config.env == "development"
+    assert config.workers == 2
+    assert config.debug is True
+    assert config.logs is True
+    assert config.reload is True
+
+    argv = ["--host", "0.0.0.0", "--port", "3000"]
+    config = _resolve_run_config(
+        "127.0.0.1", 8000, _UNSET, _UNSET, _UNSET, False, _UNSET, argv
+    )
+    assert (config.host, config.port, config.reload) == ("0.0.0.0", 3000, False)
+
+
+def test_build_parser_is_cached():
+    """Test that the run() CLI parser is built once per set of defaults."""
+    from cello import _build_parser
+
+    defaults = ("127.0.0.1", 8000, "development", None)
+    assert _build_parser(defaults) is _build_parser(defaults)
+    assert _build_parser(defaults) is not _build_parser(
+        ("0.0.0.0", 8000, "development", None)
+    )
+
+
+@pytest.mark.skipif(not hasattr(__import__("os"), "fork"), reason="requires os.fork")
+def test_wait_for_shutdown_returns_when_workers_exit():
+    """Test that the fork supervisor returns once every worker has exited."""
+    import os
+    import signal
+    from cello import _wait_for_shutdown
+
+    previous = signal.getsignal(signal.SIGTERM)
+    pids = []
+    for _ in range(2):
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0)
+        pids.append(pid)
+
+    _wait_for_shutdown(pids)
+
+    assert signal.getsignal(signal.SIGTERM) == previous
+
+
+def test_print_banner_plain_when_not_tty(capsys):
+    """Test that the startup banner omits ANSI escapes when piped."""
+    from cello import App
+
+    App._print_banner("0.0.0.0", 8080, 4, "production")
+    out = capsys.readouterr().out
+
+    assert "\033[" not in out
+    assert "http://0.0.0.0:8080" in out
+    assert "Workers:   4" in out
+    assert "Environment: production" in out
+
+
 def test_response_no_error_method():
     """Test that Response does not have a non-existent .error() method."""
     from cello import Response
@@ -2750,6 +4010,44 @@ def test_graphql_query_decorator():
     assert repr(users) == "<Query 'users'>"
 
 
+def test_graphql_decorators_expose_wrapped_function():
+    """Test resolver decorators keep introspection attributes without copying __dict__."""
+    import inspect
+    from cello.graphql import Mutation, Query
+
+    async def fetch(info, id: int) -> dict:
+        """Fetch one."""
+        return {"id": id}
+
+    fetch.custom_flag = True
+    query = Query(fetch)
+    assert inspect.unwrap(query) is fetch
+    assert query.__name__ == "fetch"
+    assert query.__qualname__ == fetch.__qualname__
+    assert query.__doc__ == "Fetch one."
+    assert not hasattr(query, "custom_flag")
+    assert list(inspect.signature(Mutation(fetch)).parameters) == ["info", "id"]
+
+
+def test_graphql_types_use_slots():
+    """Test Field and DataLoader use slots and decorators keep only __doc__ in __dict__."""
+    from cello.graphql import DataLoader, Field, Mutation, Query, Subscription
+
+    def resolver(info):
+        """Resolve."""
+        return None
+
+    async def batch_fn(keys):
+        return keys
+
+    for obj in (Field("name", "String"), DataLoader(batch_fn)):
+        assert not hasattr(obj, "__dict__")
+    for decorator in (Query, Mutation, Subscription):
+        obj = decorator(resolver)
+        assert vars(obj) == {"__doc__": "Resolve."}
+        assert decorator.__doc__ != "Resolve."
+
+
 def test_graphql_query_callable():
     """Test Query-decorated function is callable."""
     from cello.graphql import Query
@@ -2895,6 +4193,41 @@ def test_graphql_field_default_object_resolve():
     assert result == "Bob"
 
 
+def test_graphql_field_resolver_reassignment():
+    """Test replacing or removing a Field resolver switches the resolve path."""
+    from cello.graphql import Field
+
+    field = Field("name", "String", resolver=lambda obj, info, **kw: "custom")
+    assert field.resolve({"name": "Alice"}, {}) == "custom"
+
+    field.resolver = None
+    assert field.resolver is None
+    assert field.resolve({"name": "Alice"}, {}) == "Alice"
+
+    field.resolver = lambda obj, info, suffix="": obj["name"] + suffix
+    assert field.resolve({"name": "Bo"}, {}, suffix="!") == "Bo!"
+
+
+def test_graphql_field_resolve_list():
+    """Test Field.resolve_list over dict rows, object rows and sparse rows."""
+    from cello.graphql import Field
+
+    field = Field("name", "String")
+    assert field.resolve_list([], {}) == []
+    assert field.resolve_list([{"name": "A"}, {"name": "B"}], {}) == ["A", "B"]
+    assert field.resolve_list([{"name": "A"}, {"id": 2}], {}) == ["A", None]
+
+    class Row:
+        def __init__(self, name):
+            self.name = name
+
+    assert field.resolve_list([Row("x"), Row("y")], {}) == ["x", "y"]
+    assert field.resolve_list([Row("x"), {"name": "y"}, object()], {}) == ["x", "y", None]
+
+    upper = Field("name", "String", resolver=lambda obj, info: obj["name"].upper())
+    assert upper.resolve_list([{"name": "a"}, {"name": "b"}], {}) == ["A", "B"]
+
+
 def test_graphql_field_missing_key():
     """Test Field returns None for missing key."""
     from cello.graphql import Field
@@ -2950,6 +4283,158 @@ async def test_graphql_dataloader_load_many():
     assert results == [10, 20, 30]
 
 
+@pytest.mark.asyncio
+async def test_graphql_dataloader_load_many_dedups_and_skips_cached():
+    """Test load_many sends each uncached key to the batch function once."""
+    from cello.graphql import DataLoader
+
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(list(keys))
+        return [k * 10 for k in keys]
+
+    loader = DataLoader(batch_fn)
+    await loader.load(2)
+    results = await loader.load_many([1, 2, 1, 3, 3])
+    assert results == [10, 20, 10, 30, 30]
+    assert batches == [[2], [1, 3]]
+
+
+@pytest.mark.asyncio
+async def test_graphql_dataloader_load_many_warm_cache():
+    """Test load_many on fully cached keys returns without dispatching."""
+    from cello.graphql import DataLoader
+
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(list(keys))
+        return [k + 1 for k in keys]
+
+    loader = DataLoader(batch_fn)
+    assert await loader.load_many([1, 2]) == [2, 3]
+    assert await loader.load_many([2, 1, 2]) == [3, 2, 3]
+    assert await loader.load_many([]) == []
+    assert calls == [[1, 2]]
+    assert not loader._dispatch_scheduled
+
+
+@pytest.mark.asyncio
+async def test_graphql_dataloader_coalesces_concurrent_loads():
+    """Test loads issued in one event-loop tick share a single batch call."""
+    import asyncio
+    from cello.graphql import DataLoader
+
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(list(keys))
+        await asyncio.sleep(0)
+        return [f"user-{k}" for k in keys]
+
+    loader = DataLoader(batch_fn)
+    a, b, many, again = await asyncio.gather(
+        loader.load(1), loader.load(2), loader.load_many([2, 3]), loader.load(1),
+    )
+    assert (a, b, many, again) == ("user-1", "user-2", ["user-2", "user-3"], "user-1")
+    assert batches == [[1, 2, 3]]
+    assert loader._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_graphql_dataloader_loads_during_dispatch_start_next_batch():
+    """Test keys loaded while a batch is in flight go to the next batch."""
+    import asyncio
+    from cello.graphql import DataLoader
+
+    batches = []
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def batch_fn(keys):
+        batches.append(keys)
+        started.set()
+        await release.wait()
+        return [k * 10 for k in keys]
+
+    loader = DataLoader(batch_fn)
+    first = asyncio.ensure_future(loader.load(1))
+    await started.wait()
+    second = asyncio.ensure_future(loader.load(2))
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(first, second) == [10, 20]
+    assert batches == [[1], [2]]
+    assert loader._batch == {}
+
+
+@pytest.mark.asyncio
+async def test_graphql_dataloader_batch_error_reaches_every_load():
+    """Test a failing batch function fails each waiting load and is not cached."""
+    import asyncio
+    from cello.graphql import DataLoader
+
+    async def batch_fn(keys):
+        raise ConnectionError("db down")
+
+    loader = DataLoader(batch_fn)
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert loader._cache == {}
+
+
+@pytest.mark.asyncio
+async def test_graphql_dataloader_cancelled_load_keeps_shared_key():
+    """Test cancelling one waiter does not cancel others loading the same key."""
+    import asyncio
+    from cello.graphql import DataLoader
+
+    release = asyncio.Event()
+
+    async def batch_fn(keys):
+        await release.wait()
+        return [k for k in keys]
+
+    loader = DataLoader(batch_fn)
+    first = asyncio.ensure_future(loader.load("k"))
+    second = asyncio.ensure_future(loader.load("k"))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+    assert await second == "k"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_graphql_dataloader_shared_coalesces_without_caching():
+    """Test DataLoader.shared batches across callers but never caches."""
+    import asyncio
+    from cello.graphql import DataLoader
+
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(list(keys))
+        return [k * 2 for k in keys]
+
+    async def request(keys):
+        return await DataLoader.shared(batch_fn).load_many(keys)
+
+    try:
+        assert DataLoader.shared(batch_fn) is DataLoader.shared(batch_fn)
+        first, second = await asyncio.gather(request([1, 2]), request([2, 3]))
+        assert (first, second) == ([2, 4], [4, 6])
+        assert batches == [[1, 2, 3]]
+
+        assert await DataLoader.shared(batch_fn).load(1) == 2
+        assert batches[-1] == [1]
+        assert DataLoader.shared(batch_fn)._cache == {}
+    finally:
+        DataLoader._shared_instances.pop(batch_fn, None)
+
+
 @pytest.mark.asyncio
 async def test_graphql_dataloader_clear_key():
     """Test DataLoader.clear() for a specific key."""
@@ -3084,60 +4569,342 @@ async def test_graphql_engine_error_handling():
     assert "Something broke" in result["errors"][0]["message"]
 
 
-def test_graphql_engine_get_schema():
-    """Test GraphQL engine get_schema returns structure."""
-    from cello.graphql import GraphQL, Query, Mutation, Subscription
+@pytest.mark.asyncio
+async def test_graphql_engine_resolver_plan(monkeypatch):
+    """Test execute uses await-ness recorded at registration, honoring re-registration."""
+    import inspect
+    from cello import graphql
+    from cello.graphql import GraphQL
 
     gql = GraphQL()
 
-    @Query
-    def q1(info) -> list:
-        return []
+    def greeting(info) -> str:
+        return "sync"
 
-    @Mutation
-    def m1(info, x: int) -> dict:
-        return {}
+    gql.add_query(greeting)
 
-    @Subscription
-    def s1(info) -> dict:
-        return {}
+    async def greeting(info) -> str:  # noqa: F811 - replaces the first resolver
+        return "async"
 
-    gql.add_query(q1)
-    gql.add_mutation(m1)
-    gql.add_subscription(s1)
+    gql.add_query(greeting)
 
-    schema = gql.get_schema()
-    assert len(schema["queries"]) == 1
-    assert len(schema["mutations"]) == 1
-    assert len(schema["subscriptions"]) == 1
-    assert schema["queries"][0]["name"] == "q1"
-    assert schema["mutations"][0]["name"] == "m1"
-    assert schema["subscriptions"][0]["name"] == "s1"
+    async def rename(info, name: str) -> str:
+        return name.upper()
 
+    gql.add_mutation(rename)
 
-def test_graphql_engine_repr():
-    """Test GraphQL engine repr."""
+    def fail(*args, **kwargs):
+        raise AssertionError("execute must not introspect resolvers")
+
+    monkeypatch.setattr(graphql.inspect, "iscoroutinefunction", fail)
+    result = await gql.execute("{ greeting }", variables={"name": "bo"})
+    assert result == {"data": {"greeting": "async", "rename": "BO"}}
+    assert len(gql._queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_graphql_engine_queries_resolve_concurrently():
+    """Test async query resolvers overlap while results keep field order."""
+    import asyncio
     from cello.graphql import GraphQL
 
     gql = GraphQL()
-    assert "queries=0" in repr(gql)
-    assert "mutations=0" in repr(gql)
-    assert "subscriptions=0" in repr(gql)
+    events = []
 
+    async def slow(info):
+        events.append("slow-start")
+        await asyncio.sleep(0.01)
+        events.append("slow-end")
+        return "slow"
 
-def test_graphql_schema_builder():
-    """Test Schema builder creates GraphQL engine."""
-    from cello.graphql import Schema, Query, Mutation, Subscription
+    async def fast(info):
+        events.append("fast-start")
+        return "fast"
 
-    schema = Schema()
+    def broken(info):
+        raise ValueError("bad field")
 
-    @Query
-    def users(info) -> list:
-        return []
+    async def after(info, **variables):
+        events.append("mutation")
+        return "done"
 
-    @Mutation
-    def create_user(info, name: str) -> dict:
-        return {"name": name}
+    gql.add_query(slow)
+    gql.add_query(broken)
+    gql.add_query(fast)
+    gql.add_mutation(after)
+
+    result = await gql.execute("{ slow broken fast }")
+    assert list(result["data"]) == ["slow", "fast", "after"]
+    assert result["errors"] == [{"message": "bad field", "path": ["broken"]}]
+    assert events == ["slow-start", "fast-start", "slow-end", "mutation"]
+
+
+@pytest.mark.asyncio
+async def test_graphql_engine_mutation_receives_declared_variables():
+    """Test each mutation is called with just the variables it declares."""
+    from cello.graphql import GraphQL
+
+    gql = GraphQL()
+    seen = {}
+
+    def create_user(info, name: str, role: str = "member"):
+        seen["create_user"] = (name, role)
+        return name
+
+    def ping(info):
+        seen["ping"] = True
+        return "pong"
+
+    def audit(info, **variables):
+        seen["audit"] = variables
+        return len(variables)
+
+    gql.add_mutation(create_user)
+    gql.add_mutation(ping)
+    gql.add_mutation(audit)
+
+    variables = {"name": "Ann", "limit": 5}
+    result = await gql.execute("mutation { createUser ping audit }", variables=variables)
+    assert result == {"data": {"create_user": "Ann", "ping": "pong", "audit": 2}}
+    assert seen == {"create_user": ("Ann", "member"), "ping": True, "audit": variables}
+
+
+def test_graphql_decorators_share_resolver_base():
+    """Test Query/Mutation/Subscription share one implementation but stay distinct."""
+    from cello.graphql import Query, Mutation, Subscription
+
+    async def stream(info):
+        yield {}
+
+    q, m, s = Query(stream), Mutation(stream), Subscription(stream)
+    assert type(q).__mro__[1] is type(m).__mro__[1] is type(s).__mro__[1]
+    assert not isinstance(q, Mutation) and not isinstance(s, Query)
+    assert (repr(q), repr(m), repr(s)) == (
+        "<Query 'stream'>", "<Mutation 'stream'>", "<Subscription 'stream'>",
+    )
+    # Async generators only count as async for subscriptions
+    assert (q._is_async, m._is_async, s._is_async) == (False, False, True)
+
+
+@pytest.mark.asyncio
+async def test_graphql_engine_reuses_decorator_async_flag(monkeypatch):
+    """Test add_query/add_mutation take is-async from the decorator, not inspect."""
+    from cello import graphql
+    from cello.graphql import GraphQL, Query, Mutation
+
+    @Query
+    async def greeting(info) -> str:
+        return "hi"
+
+    @Mutation
+    def bump(info) -> int:
+        return 1
+
+    assert greeting._is_async is True
+    assert bump._is_async is False
+
+    def fail(func):
+        raise AssertionError("inspected at registration")
+
+    monkeypatch.setattr(graphql.inspect, "iscoroutinefunction", fail)
+    gql = GraphQL()
+    gql.add_query(greeting)
+    gql.add_mutation(bump)
+    result = await gql.execute("{ greeting }")
+    assert result == {"data": {"greeting": "hi", "bump": 1}}
+
+
+@pytest.mark.asyncio
+async def test_graphql_engine_mutation_generated_calls():
+    """Test generated mutation wrappers across argument shapes."""
+    from cello.graphql import GraphQL
+
+    gql = GraphQL()
+
+    def rename(info, name="anon"):
+        return name
+
+    def move(info, x=0, y=0, z=0):
+        return (x, y, z)
+
+    async def tag(info, label):
+        return label.upper()
+
+    gql.add_mutation(rename)
+    gql.add_mutation(move)
+    gql.add_mutation(tag)
+
+    result = await gql.execute("mutation { m }", variables={"y": 2, "label": "hot"})
+    assert result == {"data": {"rename": "anon", "move": (0, 2, 0), "tag": "HOT"}}
+
+    result = await gql.execute("mutation { m }", variables={"name": "Bo"})
+    assert result["data"]["rename"] == "Bo"
+    assert result["data"]["move"] == (0, 0, 0)
+    assert "label" in result["errors"][0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_graphql_engine_plan_cache():
+    """Test one execution plan is shared by all operations and reset on registration."""
+    from cello.graphql import GraphQL
+
+    gql = GraphQL()
+
+    def a(info):
+        return 1
+
+    gql.add_query(a)
+    await gql.execute("{ a }")
+    plan = gql._cached_plan
+    await gql.execute("{\n  a\n}", operation_name="Named")
+    assert gql._cached_plan is plan
+
+    def b(info):
+        return 2
+
+    gql.add_query(b)
+    assert gql._cached_plan is None
+    assert (await gql.execute("{ a }"))["data"] == {"a": 1, "b": 2}
+
+
+def test_graphql_engine_interns_resolver_names():
+    """Test registered resolver names are interned."""
+    import sys
+    from cello.graphql import GraphQL
+
+    gql = GraphQL()
+
+    def a(info):
+        return None
+
+    gql.add_query(a)
+    gql.add_mutation(a)
+    assert next(iter(gql._queries)) is sys.intern("a")
+    assert next(iter(gql._mutations)) is sys.intern("a")
+
+
+def test_graphql_engine_get_schema():
+    """Test GraphQL engine get_schema returns structure."""
+    import json
+    from cello.graphql import GraphQL, Query, Mutation, Subscription
+
+    gql = GraphQL()
+
+    @Query
+    def q1(info) -> list:
+        return []
+
+    @Mutation
+    def m1(info, x: int) -> dict:
+        return {}
+
+    @Subscription
+    def s1(info) -> dict:
+        return {}
+
+    gql.add_query(q1)
+    gql.add_mutation(m1)
+    gql.add_subscription(s1)
+
+    schema = gql.get_schema()
+    assert len(schema["queries"]) == 1
+    assert len(schema["mutations"]) == 1
+    assert len(schema["subscriptions"]) == 1
+    assert schema["queries"][0]["name"] == "q1"
+    assert schema["mutations"][0]["name"] == "m1"
+    assert schema["subscriptions"][0]["name"] == "s1"
+    assert isinstance(schema, dict)
+    assert json.loads(json.dumps(schema)) == schema
+
+
+def test_graphql_signature_parsed_once(monkeypatch):
+    """Test resolver signatures are memoized and descriptors stay independent."""
+    import inspect
+    from cello import graphql
+    from cello.graphql import GraphQL, Query
+
+    @Query
+    def user(info, id: int) -> dict:
+        return {"id": id}
+
+    gql = GraphQL()
+    gql.add_query(user)
+    gql.get_schema()
+
+    calls = []
+    real_signature = inspect.signature
+    monkeypatch.setattr(
+        graphql.inspect, "signature", lambda f: calls.append(f) or real_signature(f)
+    )
+    first = gql.get_schema()
+    first["queries"][0]["parameters"]["id"] = "mutated"
+    second = gql.get_schema()
+
+    assert calls == []
+    assert second["queries"][0] == {
+        "name": "user", "return_type": "dict", "parameters": {"id": "int"},
+    }
+    assert user.parameters == {"id": "int"}
+
+
+def test_graphql_schema_view_describes_sections_lazily(monkeypatch):
+    """Test schema_view only describes the sections that are read."""
+    from cello import graphql
+    from cello.graphql import GraphQL
+
+    def ping(info) -> str:
+        return "pong"
+
+    def save(info, x: int) -> bool:
+        return True
+
+    gql = GraphQL()
+    gql.add_query(ping)
+    gql.add_mutation(save)
+
+    described = []
+    real_describe = graphql._describe
+    monkeypatch.setattr(
+        graphql, "_describe", lambda r: described.append(list(r)) or real_describe(r)
+    )
+
+    schema = gql.schema_view()
+    assert described == []
+    assert schema["queries"] is schema["queries"]
+    assert described == [["ping"]]
+
+    assert list(schema) == ["queries", "mutations", "subscriptions"]
+    assert dict(schema) == {
+        "queries": [{"name": "ping", "return_type": "str", "parameters": {}}],
+        "mutations": [{"name": "save", "return_type": "bool", "parameters": {"x": "int"}}],
+        "subscriptions": [],
+    }
+    assert len(described) == 3
+
+
+def test_graphql_engine_repr():
+    """Test GraphQL engine repr."""
+    from cello.graphql import GraphQL
+
+    gql = GraphQL()
+    assert "queries=0" in repr(gql)
+    assert "mutations=0" in repr(gql)
+    assert "subscriptions=0" in repr(gql)
+
+
+def test_graphql_schema_builder():
+    """Test Schema builder creates GraphQL engine."""
+    from cello.graphql import Schema, Query, Mutation, Subscription
+
+    schema = Schema()
+
+    @Query
+    def users(info) -> list:
+        return []
+
+    @Mutation
+    def create_user(info, name: str) -> dict:
+        return {"name": name}
 
     @Subscription
     def on_message(info) -> dict:
@@ -3177,6 +4944,34 @@ def test_graphql_schema_builder_chaining():
     assert len(s["queries"]) == 2
 
 
+@pytest.mark.asyncio
+async def test_graphql_schema_builder_class_based():
+    """Test class-based resolver types register own and inherited public methods."""
+    from cello.graphql import Schema
+
+    class BaseQueries:
+        def ping(info):
+            return "pong"
+
+    class UserQueries(BaseQueries):
+        version = "1.0"
+
+        def users(info):
+            return [{"id": 1}]
+
+        @staticmethod
+        def admins(info):
+            return []
+
+        def _hidden(info):
+            return "hidden"
+
+    gql = Schema().query(UserQueries).build()
+    assert [q["name"] for q in gql.get_schema()["queries"]] == ["ping", "users", "admins"]
+    result = await gql.execute("{ users }")
+    assert result["data"] == {"ping": "pong", "users": [{"id": 1}], "admins": []}
+
+
 def test_graphql_schema_repr():
     """Test Schema repr."""
     from cello.graphql import Schema
@@ -3220,6 +5015,35 @@ def test_grpc_service_subclass():
     assert method_map["list_users"]["stream"] is True
 
 
+def test_grpc_service_methods_discovered_per_class():
+    """Test gRPC methods are found once per class, including inherited ones."""
+    from cello.grpc import GrpcService, grpc_method
+
+    class BaseService(GrpcService):
+        @grpc_method
+        def ping(self, request):
+            return {"pong": True}
+
+    class UserService(BaseService):
+        @grpc_method(stream=True)
+        def watch(self, request):
+            yield {}
+
+        def helper(self):
+            return None
+
+    assert UserService._grpc_methods_cache == (
+        ("ping", "ping", False), ("watch", "watch", True),
+    )
+
+    first, second = UserService(), UserService()
+    assert first._methods["ping"]["handler"].__self__ is first
+    assert second._methods["ping"]["handler"].__self__ is second
+    assert first.ping(None) == {"pong": True}
+    assert [m["name"] for m in first.get_methods()] == ["ping", "watch"]
+    assert GrpcService().get_methods() == []
+
+
 def test_grpc_service_custom_name():
     """Test GrpcService with explicit custom name."""
     from cello.grpc import GrpcService
@@ -3272,6 +5096,22 @@ def test_grpc_method_decorator_with_stream():
     assert streaming_method._grpc_stream is True
 
 
+def test_grpc_method_decorator_returns_function():
+    """Test @grpc_method marks the function in place instead of wrapping it."""
+    import inspect
+    from cello.grpc import grpc_method
+
+    def unary(self, request):
+        return {}
+
+    def streaming(self, request):
+        yield {}
+
+    assert grpc_method(unary) is unary
+    assert grpc_method(stream=True)(streaming) is streaming
+    assert inspect.isgeneratorfunction(streaming)
+
+
 def test_grpc_request_creation():
     """Test GrpcRequest creation and properties."""
     from cello.grpc import GrpcRequest
@@ -3498,6 +5338,33 @@ async def test_grpc_channel_close():
     assert channel._connected is False
 
 
+@pytest.mark.asyncio
+async def test_grpc_channel_pool_round_robin():
+    """Test GrpcChannel spreads calls over its pooled connections in turn."""
+    from cello.grpc import GrpcChannel
+
+    channel = await GrpcChannel.connect("localhost:50051", pool_size=3)
+    pool = channel._pool
+    assert len(pool) == 3
+    assert [pool.pick()["pool_id"] for _ in range(7)] == [0, 1, 2, 0, 1, 2, 0]
+
+    await channel.call("UserService", "GetUser", {"id": 1})
+    assert pool.pick()["pool_id"] == 2
+
+    await channel.close()
+    assert channel._pool is None
+    assert len(pool) == 0
+
+
+def test_grpc_channel_pool_size_validation():
+    """Test GrpcChannel rejects an empty pool."""
+    from cello.grpc import GrpcChannel
+
+    assert GrpcChannel("localhost:50051")._pool_size == 4
+    with pytest.raises(ValueError):
+        GrpcChannel("localhost:50051", pool_size=0)
+
+
 def test_grpc_channel_repr():
     """Test GrpcChannel repr."""
     from cello.grpc import GrpcChannel
@@ -4397,6 +6264,91 @@ def test_event_json():
     assert "version" in data
 
 
+def test_event_shares_empty_metadata():
+    """Test events without metadata share a read-only mapping that still serializes."""
+    import json
+    from cello.eventsourcing import Event
+
+    a, b = Event("A", {}), Event("B", {})
+    assert a.metadata is b.metadata
+    assert a.metadata == {}
+    with pytest.raises(TypeError):
+        a.metadata["k"] = "v"
+    assert type(a.json()["metadata"]) is dict
+    json.dumps(a.json())
+
+    own = {}
+    assert Event("C", {}, metadata=own).metadata is own
+
+
+def test_event_json_generated_from_slots():
+    """Test the generated Event.json keeps its docstring and slot order."""
+    from cello.eventsourcing import Event
+
+    event = Event("OrderCreated", {"id": 1}, metadata={"user": "u1"})
+    assert tuple(event.json()) == Event.__slots__
+    assert event.json()["metadata"] == {"user": "u1"}
+    assert Event.json.__qualname__ == "Event.json"
+    assert "Serialize the event" in Event.json.__doc__
+
+
+def test_event_type_is_interned():
+    """Test event types built at runtime share one interned string."""
+    import json
+    from cello.eventsourcing import Event
+
+    decoded = json.loads('{"t": "OrderCreated"}')["t"]
+    assert Event(decoded, {}).event_type is Event("OrderCreated", {}).event_type
+
+
+def test_event_type_accepts_str_enum():
+    """Test str subclasses such as str-based enums work as event types."""
+    from enum import Enum
+    from cello.eventsourcing import Aggregate, Event, event_handler
+
+    class OrderEvent(str, Enum):
+        CREATED = "OrderCreated"
+
+    class Order(Aggregate):
+        @event_handler(OrderEvent.CREATED)
+        def on_created(self, event):
+            self.state["status"] = "created"
+
+    event = Event(OrderEvent.CREATED, {})
+    assert event.event_type is OrderEvent.CREATED
+    order = Order()
+    order.apply(event)
+    assert order.state["status"] == "created"
+
+
+def test_event_explicit_timestamp():
+    """Test a batch of events can share one clock reading."""
+    from cello.eventsourcing import Event
+
+    events = [Event("ItemAdded", {"n": n}, timestamp=1234.5) for n in range(3)]
+    assert {e.timestamp for e in events} == {1234.5}
+    assert Event("ItemAdded", {}).timestamp > 1234.5
+
+
+def test_event_and_aggregate_id_factory():
+    """Test IDs are UUID4 hex and the factory can be overridden per class."""
+    import itertools
+    from cello.eventsourcing import Aggregate, Event
+
+    assert len(Event("X", {}).id) == 32
+    assert len(Aggregate().id) == 32
+
+    counter = itertools.count(1)
+
+    class SeqEvent(Event):
+        __slots__ = ()
+        _id_factory = staticmethod(lambda: f"evt-{next(counter)}")
+
+    assert SeqEvent("X", {}).id == "evt-1"
+    assert SeqEvent("X", {}).id == "evt-2"
+    assert Aggregate(aggregate_id="given").id == "given"
+
+
 def test_event_repr():
     """Test Event repr contains event_type."""
     from cello.eventsourcing import Event
@@ -4485,6 +6437,30 @@ def test_aggregate_clear_uncommitted():
     assert len(agg.uncommitted_events) == 0
 
 
+def test_aggregate_max_uncommitted():
+    """Test max_uncommitted flags aggregates whose events are never cleared."""
+    from cello.eventsourcing import Aggregate, Event
+
+    class CartAggregate(Aggregate):
+        max_uncommitted = 2
+
+    cart = CartAggregate()
+    pending = cart.uncommitted_events
+    cart.apply(Event("ItemAdded", {}))
+    with pytest.raises(RuntimeError, match="max_uncommitted=2"):
+        cart.apply_many([Event("ItemAdded", {}), Event("ItemAdded", {})])
+    assert cart.version == 1
+
+    cart.apply(Event("ItemAdded", {}))
+    with pytest.raises(RuntimeError):
+        cart.apply(Event("ItemAdded", {}))
+
+    cart.clear_uncommitted()
+    assert cart.uncommitted_events is pending
+    cart.apply(Event("ItemAdded", {}))
+    assert cart.version == 3
+
+
 def test_aggregate_load_from_events():
     """Test replaying a list of events onto an aggregate."""
     from cello.eventsourcing import Aggregate, Event
@@ -4506,6 +6482,28 @@ def test_aggregate_load_from_events():
     assert agg.version == len(events)
 
 
+def test_aggregate_load_from_events_rejects_gaps():
+    """Test replay dispatches repeated types and stops at a version gap."""
+    from cello.eventsourcing import Aggregate, Event, event_handler
+
+    class CounterAggregate(Aggregate):
+        @event_handler("Incremented")
+        def on_incremented(self, event):
+            self.state["n"] = self.state.get("n", 0) + 1
+
+    events = [Event("Incremented", {}) for _ in range(4)]
+    for i, event in enumerate(events, start=1):
+        event.version = i
+    agg = CounterAggregate()
+    agg.load_from_events(events)
+    assert agg.state == {"n": 4} and agg.version == 4
+
+    events[2].version = 7
+    with pytest.raises(ValueError, match="expected 3, got 7"):
+        agg.load_from_events(events)
+    assert agg.version == 2
+
+
 def test_aggregate_event_handler_decorator():
     """Test @event_handler decorator on aggregate method."""
     from cello.eventsourcing import Aggregate, Event, event_handler
@@ -4531,6 +6529,65 @@ def test_aggregate_event_handler_decorator():
     assert agg.status == "shipped"
 
 
+def test_aggregate_handler_map_built_once_per_class():
+    """Test @event_handler methods are collected on the class, honoring overrides."""
+    from cello.eventsourcing import Aggregate, Event, event_handler
+
+    class BaseAggregate(Aggregate):
+        @event_handler("Created")
+        def on_created(self, event):
+            self.state["created"] = "base"
+
+        @event_handler("Closed")
+        def on_closed(self, event):
+            self.state["closed"] = True
+
+    class ChildAggregate(BaseAggregate):
+        def on_created(self, event):  # overrides without the decorator
+            self.state["created"] = "child"
+
+        @event_handler("Renamed")
+        def on_renamed(self, event):
+            self.state["name"] = event.data["name"]
+
+    assert BaseAggregate._cello_handler_map == {"Created": "on_created", "Closed": "on_closed"}
+    assert ChildAggregate._cello_handler_map == {"Closed": "on_closed", "Renamed": "on_renamed"}
+
+    agg = ChildAggregate()
+    agg.apply(Event("Created", {}))
+    agg.apply(Event("Closed", {}))
+    agg.apply(Event("Renamed", {"name": "x"}))
+    assert agg.state == {"closed": True, "name": "x"}
+    assert "_event_handlers" not in vars(agg)
+
+
+def test_aggregate_handle_convention_in_handler_map():
+    """Test _handle_<type> methods are dispatched, after decorated handlers."""
+    from cello.eventsourcing import Aggregate, Event, event_handler
+
+    class OrderAggregate(Aggregate):
+        @event_handler("OrderCreated")
+        def on_created(self, event):
+            self.state["by"] = "decorator"
+
+        def _handle_OrderCreated(self, event):
+            self.state["by"] = "convention"
+
+        def _handle_OrderShipped(self, event):
+            self.state["shipped"] = True
+
+    assert OrderAggregate._cello_handler_map == {
+        "OrderCreated": "on_created",
+        "OrderShipped": "_handle_OrderShipped",
+    }
+    events = [Event("OrderCreated", {}), Event("OrderShipped", {})]
+    for i, event in enumerate(events, start=1):
+        event.version = i
+    agg = OrderAggregate()
+    agg.load_from_events(events)
+    assert agg.state == {"by": "decorator", "shipped": True}
+
+
 def test_aggregate_version_tracking():
     """Test version tracking with multiple events."""
     from cello.eventsourcing import Aggregate, Event
@@ -4547,6 +6604,26 @@ def test_aggregate_version_tracking():
     assert agg.version == 5
 
 
+def test_aggregate_apply_many_matches_apply():
+    """Test apply_many versions, records and dispatches like repeated apply."""
+    from cello.eventsourcing import Aggregate, Event, event_handler
+
+    class CartAggregate(Aggregate):
+        @event_handler("ItemAdded")
+        def on_item_added(self, event):
+            self.state.setdefault("seen", []).append((self.version, event.data["sku"]))
+
+    cart = CartAggregate(aggregate_id="cart-1")
+    cart.apply(Event("ItemAdded", {"sku": "A"}))
+    events = [Event("ItemAdded", {"sku": "B"}), Event("Ignored", {}), Event("ItemAdded", {"sku": "C"})]
+    cart.apply_many(events)
+
+    assert cart.version == 4
+    assert [e.version for e in cart.uncommitted_events] == [1, 2, 3, 4]
+    assert all(e.aggregate_id == "cart-1" for e in events)
+    assert cart.state["seen"] == [(0, "A"), (1, "B"), (3, "C")]
+
+
 def test_aggregate_repr():
     """Test Aggregate repr."""
     from cello.eventsourcing import Aggregate
@@ -4578,6 +6655,14 @@ def test_snapshot_properties():
     assert snap.timestamp is not None
 
 
+def test_event_and_snapshot_use_slots():
+    """Test Event and Snapshot carry no per-instance __dict__."""
+    from cello.eventsourcing import Event, Snapshot
+
+    assert not hasattr(Event("OrderCreated", {}), "__dict__")
+    assert not hasattr(Snapshot("agg-1", 1, {}), "__dict__")
+
+
 @pytest.mark.asyncio
 async def test_event_store_creation():
     """Test EventStore creation."""
@@ -4613,6 +6698,36 @@ async def test_event_store_append_and_get():
     assert retrieved[1].event_type == "OrderShipped"
 
 
+@pytest.mark.asyncio
+async def test_event_store_append_continues_versions():
+    """Test successive appends extend one stream with sequential versions."""
+    from cello.eventsourcing import EventStore, Event
+
+    store = await EventStore.connect()
+    await store.append("cart-1", [Event("A", {}), Event("B", {})])
+    await store.append("cart-1", [Event("C", {})])
+    await store.append("cart-1", [])
+
+    stream = await store.get_events("cart-1")
+    assert [(e.event_type, e.version) for e in stream] == [("A", 1), ("B", 2), ("C", 3)]
+    assert {e.aggregate_id for e in stream} == {"cart-1"}
+
+
+@pytest.mark.asyncio
+async def test_event_store_append_reuses_last_stream():
+    """Test alternating and repeated appends keep streams separate."""
+    from cello.eventsourcing import Aggregate, EventStore, Event
+
+    built = "".join(["order", "-7"])
+    assert Aggregate(aggregate_id=built).id is Aggregate(aggregate_id="order-7").id
+
+    store = await EventStore.connect()
+    for aggregate_id in ("a", "a", "b", "a", "b"):
+        await store.append(aggregate_id, [Event("E", {})])
+    assert [e.version for e in await store.get_events("a")] == [1, 2, 3]
+    assert [r["version"] for r in await store.get_events_raw("b")] == [1, 2]
+
+
 @pytest.mark.asyncio
 async def test_event_store_get_since_version():
     """Test get_events with since_version filter."""
@@ -4631,6 +6746,133 @@ async def test_event_store_get_since_version():
     assert retrieved[1].event_type == "OrderDelivered"
 
 
+@pytest.mark.asyncio
+async def test_event_store_get_since_version_bounds():
+    """Test get_events slicing at and beyond the stream edges."""
+    from cello.eventsourcing import EventStore, Event
+
+    store = await EventStore.connect()
+    await store.append("s", [Event("E", {"n": n}) for n in range(5)])
+
+    assert [e.version for e in await store.get_events("s", since_version=-3)] == [1, 2, 3, 4, 5]
+    assert [e.version for e in await store.get_events("s", since_version=3)] == [4, 5]
+    assert await store.get_events("s", since_version=5) == []
+    assert await store.get_events("s", since_version=9) == []
+    assert await store.get_events("missing") == []
+
+    everything = await store.get_events("s")
+    everything.clear()
+    assert len(await store.get_events("s")) == 5
+
+
+@pytest.mark.asyncio
+async def test_event_store_get_events_raw():
+    """Test get_events_raw returns the serialized events as appended."""
+    from cello.eventsourcing import EventStore, Event
+
+    store = await EventStore.connect()
+    events = [Event("A", {"n": 1}), Event("B", {"n": 2}), Event("C", {"n": 3})]
+    await store.append("r", events)
+    assert "r" not in store._rows
+
+    raw = await store.get_events_raw("r")
+    assert raw == [e.json() for e in events]
+    raw[0]["event_type"] = "mutated"
+    assert (await store.get_events_raw("r"))[0]["event_type"] == "A"
+    assert [row["version"] for row in await store.get_events_raw("r", since_version=2)] == [3]
+
+    await store.append("r", [Event("D", {"n": 4})])
+    assert [row["event_type"] for row in await store.get_events_raw("r", since_version=2)] == ["C", "D"]
+    assert await store.get_events_raw("missing") == []
+    assert "missing" not in store._events and "missing" not in store._rows
+
+    await store.close()
+    with pytest.raises(RuntimeError):
+        await store.get_events_raw("r")
+
+
+@pytest.mark.asyncio
+async def test_event_store_get_event_columns():
+    """Test get_event_columns transposes the selected events."""
+    import json
+    from cello.eventsourcing import EventStore, Event
+
+    store = await EventStore.connect()
+    await store.append("c", [Event("A", {"n": 1}), Event("B", {"n": 2}), Event("C", {"n": 3})])
+
+    columns = await store.get_event_columns("c", since_version=1)
+    assert tuple(columns) == Event.__slots__
+    assert columns["event_type"] == ["B", "C"]
+    assert columns["version"] == [2, 3]
+    assert columns["data"] == [{"n": 2}, {"n": 3}]
+    assert json.loads(json.dumps(columns["metadata"])) == [{}, {}]
+
+    empty = await store.get_event_columns("missing")
+    assert empty == {name: [] for name in Event.__slots__}
+    await store.close()
+    with pytest.raises(RuntimeError):
+        await store.get_event_columns("c")
+
+
+@pytest.mark.asyncio
+async def test_event_store_prunes_snapshotted_events_past_max_events():
+    """Test max_events drops only events covered by the latest snapshot."""
+    from cello.eventsourcing import (
+        Aggregate, Event, EventSourcingConfig, EventStore, Snapshot, event_handler,
+    )
+
+    class Counter(Aggregate):
+        @event_handler("Incremented")
+        def on_incremented(self, event):
+            self.state["n"] = self.state.get("n", 0) + 1
+
+    store = await EventStore.connect(EventSourcingConfig(max_events=4))
+    await store.append("c", [Event("Incremented", {}) for _ in range(5)])
+    assert len(await store.get_events("c")) == 5  # nothing snapshotted yet
+
+    await store.save_snapshot(Snapshot("c", 3, {"n": 3}))
+    assert [e.version for e in await store.get_events("c")] == [4, 5]
+    assert [r["version"] for r in await store.get_events_raw("c", since_version=4)] == [5]
+
+    await store.append("c", [Event("Incremented", {}) for _ in range(3)])
+    assert [e.version for e in await store.get_events("c")] == [4, 5, 6, 7, 8]
+
+    counter = Counter(aggregate_id="c")
+    counter.load_from_events(
+        await store.get_events("c"), snapshot=await store.get_snapshot("c")
+    )
+    assert counter.version == 8
+    assert counter.state == {"n": 8}
+
+
+@pytest.mark.asyncio
+async def test_event_store_fully_snapshotted_stream_keeps_versions():
+    """Test a snapshot covering the whole stream does not reset versions."""
+    from cello.eventsourcing import (
+        Aggregate, Event, EventSourcingConfig, EventStore, Snapshot, event_handler,
+    )
+
+    class Counter(Aggregate):
+        @event_handler("Incremented")
+        def on_incremented(self, event):
+            self.state["n"] = self.state.get("n", 0) + 1
+
+    store = await EventStore.connect(EventSourcingConfig(max_events=2))
+    await store.append("c", [Event("Incremented", {}) for _ in range(3)])
+    await store.save_snapshot(Snapshot("c", 3, {"n": 3}))
+    assert await store.get_events("c") == []
+
+    await store.append("c", [Event("Incremented", {})])
+    assert [e.version for e in await store.get_events("c")] == [4]
+
+    counter = Counter(aggregate_id="c")
+    counter.load_from_events(
+        await store.get_events("c"), snapshot=await store.get_snapshot("c")
+    )
+    assert counter.version == 4
+    assert counter.state == {"n": 4}
+
+
 @pytest.mark.asyncio
 async def test_event_store_snapshot():
     """Test saving and retrieving a snapshot."""
@@ -4658,6 +6900,52 @@ async def test_event_store_close():
     assert store.connected is False
 
 
+@pytest.mark.asyncio
+async def test_event_store_connection_state_swaps_methods():
+    """Test connected stores bind unguarded methods and closing restores the guard."""
+    from cello.eventsourcing import EventStore, Event, Snapshot
+
+    store = await EventStore.connect()
+    assert "append" in vars(store)
+    await store.append("a", [Event("E", {})])
+    await store.save_snapshot(Snapshot("a", 1, {}))
+    assert (await store.get_snapshot("a")).version == 1
+
+    await store.close()
+    assert "append" not in vars(store)
+    with pytest.raises(RuntimeError):
+        await store.get_events("a")
+
+    store.connected = True
+    assert len(await store.get_events("a")) == 1
+
+    class AuditedStore(EventStore):
+        appended = 0
+
+        async def append(self, aggregate_id, events):
+            self.appended += len(events)
+            await super().append(aggregate_id, events)
+
+    audited = await AuditedStore.connect()
+    await audited.append("a", [Event("E", {})])
+    assert audited.appended == 1
+    assert len(await audited.get_events("a")) == 1
+
+
+@pytest.mark.asyncio
+async def test_event_store_sync_bodies_share_storage():
+    """Test the synchronous in-memory bodies back the async API."""
+    from cello.eventsourcing import EventStore, Event, Snapshot
+
+    store = await EventStore.connect()
+    store._append_sync("s", [Event("A", {}), Event("B", {})])
+    store._save_snapshot_sync(Snapshot("s", 2, {"n": 2}))
+
+    assert [e.version for e in await store.get_events("s")] == [1, 2]
+    assert store._get_events_sync("s", 1)[0].event_type == "B"
+    assert (await store.get_snapshot("s")).state == {"n": 2}
+
+
 def test_eventsourcing_config_python():
     """Test Python-side EventSourcingConfig usage."""
     from cello import EventSourcingConfig
@@ -4699,6 +6987,7 @@ def test_command_properties():
     assert cmd.id is not None
     assert cmd.command_type is not None
     assert cmd.timestamp is not None
+    assert isinstance(cmd.timestamp, int)
 
 
 def test_command_to_dict():
@@ -4717,6 +7006,53 @@ def test_command_to_dict():
     assert "command_type" in data
 
 
+def test_command_id_is_lazy():
+    """Test Command ids are generated on first access and can be supplied."""
+    from cello.cqrs import Command
+
+    class CreateOrder(Command):
+        pass
+
+    cmd = CreateOrder(user_id=1)
+    assert cmd._id is None
+    assert len(cmd.id) == 32
+    assert cmd.id == cmd.id
+    assert CreateOrder().id != CreateOrder().id
+
+    explicit = CreateOrder(id="cmd-1", user_id=1)
+    assert explicit.id == "cmd-1"
+    assert explicit.to_dict()["id"] == "cmd-1"
+    assert "id" not in explicit.__dict__
+
+
+def test_command_to_dict_per_layout():
+    """Test Command.to_dict() for instances with different attributes."""
+    from cello.cqrs import Command
+
+    class CreateOrder(Command):
+        pass
+
+    a = CreateOrder(user_id=1, product="Widget")
+    b = CreateOrder(user_id=2, _internal="hidden")
+    b2 = CreateOrder(user_id=3, _internal="hidden")
+
+    assert a.to_dict() == {
+        "id": a.id,
+        "command_type": "CreateOrder",
+        "timestamp": a.timestamp,
+        "user_id": 1,
+        "product": "Widget",
+    }
+    assert b.to_dict() == {
+        "id": b.id,
+        "command_type": "CreateOrder",
+        "timestamp": b.timestamp,
+        "user_id": 2,
+    }
+    assert b2.to_dict()["user_id"] == 3
+    assert len(CreateOrder._to_dict_layouts) == 2
+
+
 def test_command_type_is_class_name():
     """Test that command_type defaults to the class name."""
     from cello.cqrs import Command
@@ -4726,6 +7062,7 @@ def test_command_type_is_class_name():
 
     cmd = CreateOrder(user_id=1)
     assert cmd.command_type == "CreateOrder"
+    assert CreateOrder.command_type == "CreateOrder"
 
 
 def test_command_repr():
@@ -4738,6 +7075,8 @@ def test_command_repr():
     cmd = CreateOrder(user_id=1)
     r = repr(cmd)
     assert "CreateOrder" in r
+    assert r == f"CreateOrder(id={cmd.id!r}, user_id=1)"
+    assert repr(CreateOrder()).endswith("')")
 
 
 def test_query_creation():
@@ -4789,6 +7128,7 @@ def test_query_type_is_class_name():
 
     q = GetOrder(order_id="order-1")
     assert q.query_type == "GetOrder"
+    assert GetOrder.query_type == "GetOrder"
 
 
 def test_query_repr():
@@ -4843,6 +7183,25 @@ def test_command_result_success_flag():
     assert fail_result.success is False
 
 
+def test_command_result_fail_exc_is_lazy():
+    """Test CommandResult.fail_exc stringifies the exception on demand."""
+    from cello.cqrs import CommandResult
+
+    class ExpensiveError(Exception):
+        calls = 0
+
+        def __str__(self):
+            ExpensiveError.calls += 1
+            return "expensive"
+
+    result = CommandResult.fail_exc(ExpensiveError())
+    assert result.success is False
+    assert ExpensiveError.calls == 0
+    assert result.error == "expensive"
+    assert result.error == "expensive"
+    assert ExpensiveError.calls == 1
+
+
 def test_query_result_ok():
     """Test QueryResult.ok() factory."""
     from cello.cqrs import QueryResult
@@ -4861,6 +7220,8 @@ def test_query_result_not_found():
     assert result.found is False
     assert result.data is None
     assert result.error is None
+    assert QueryResult.not_found() is result
+    assert not hasattr(result, "__dict__")
 
 
 def test_query_result_fail():
@@ -4952,6 +7313,8 @@ async def test_command_bus_missing_handler():
     bus = CommandBus()
     result = await bus.dispatch(UnregisteredCommand())
     assert result.success is False
+    assert result.error == "No handler registered for command: UnregisteredCommand"
+    assert await bus.dispatch(UnregisteredCommand()) is result
 
 
 @pytest.mark.asyncio
@@ -4988,6 +7351,289 @@ async def test_query_bus_missing_handler():
     assert result.found is False
 
 
+@pytest.mark.asyncio
+async def test_command_bus_sync_handler():
+    """Test CommandBus dispatches to a synchronous handler."""
+    from cello.cqrs import Command, CommandBus
+
+    class CreateOrder(Command):
+        pass
+
+    bus = CommandBus()
+    bus.register(CreateOrder, lambda cmd: {"user": cmd.user_id})
+
+    result = await bus.dispatch(CreateOrder(user_id=7))
+    assert result.success is True
+    assert result.data == {"user": 7}
+
+
+@pytest.mark.asyncio
+async def test_query_bus_keys_handlers_by_class():
+    """Test QueryBus distinguishes query classes that share a name."""
+    from cello.cqrs import Query, QueryBus
+
+    def make_query_class():
+        class GetOrder(Query):
+            pass
+        return GetOrder
+
+    first, second = make_query_class(), make_query_class()
+    bus = QueryBus()
+    bus.register(first, lambda q: "first")
+
+    assert (await bus.execute(first())).data == "first"
+    assert (await bus.execute(second())).found is False
+    assert repr(bus) == "QueryBus(handlers=['GetOrder'])"
+
+
+def test_command_bus_dispatch_sync():
+    """Test CommandBus.dispatch_sync with sync and async handlers."""
+    from cello.cqrs import Command, CommandBus
+
+    class CreateOrder(Command):
+        pass
+
+    class CancelOrder(Command):
+        pass
+
+    async def handle_cancel(cmd):
+        return None
+
+    bus = CommandBus()
+    bus.register(CreateOrder, lambda cmd: {"user": cmd.user_id})
+    bus.register(CancelOrder, handle_cancel)
+
+    result = bus.dispatch_sync(CreateOrder(user_id=3))
+    assert result.success is True
+    assert result.data == {"user": 3}
+
+    with pytest.raises(TypeError):
+        bus.dispatch_sync(CancelOrder())
+
+
+def test_query_bus_execute_sync():
+    """Test QueryBus.execute_sync with a sync handler."""
+    from cello.cqrs import Query, QueryBus
+
+    class GetOrder(Query):
+        pass
+
+    bus = QueryBus()
+    bus.register(GetOrder, lambda q: {"order_id": q.order_id})
+
+    result = bus.execute_sync(GetOrder(order_id="order-1"))
+    assert result.found is True
+    assert result.data == {"order_id": "order-1"}
+
+
+@pytest.mark.asyncio
+async def test_command_bus_capture_errors():
+    """Test CommandBus error capture can be disabled."""
+    from cello.cqrs import Command, CommandBus
+
+    class CreateOrder(Command):
+        pass
+
+    def failing_handler(cmd):
+        raise RuntimeError("boom")
+
+    captured = CommandBus()
+    captured.register(CreateOrder, failing_handler)
+    result = await captured.dispatch(CreateOrder())
+    assert result.success is False
+    assert result.error == "boom"
+
+    raising = CommandBus(capture_errors=False)
+    raising.register(CreateOrder, failing_handler)
+    with pytest.raises(RuntimeError):
+        await raising.dispatch(CreateOrder())
+
+
+def test_cqrs_python_config_is_frozen():
+    """Test the pure-Python CqrsConfig defaults and immutability."""
+    import dataclasses
+    from cello.cqrs import CqrsConfig
+
+    config = CqrsConfig(command_timeout_ms=10000)
+    assert config.enable_event_sync is True
+    assert config.command_timeout_ms == 10000
+    assert config.query_timeout_ms == 3000
+    assert config.max_retries == 3
+    assert repr(config).startswith("CqrsConfig(enable_event_sync=True")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.max_retries = 5
+
+
+@pytest.mark.asyncio
+async def test_command_bus_rejects_invalid_command():
+    """Test CommandBus runs overridden validate() before the handler."""
+    from cello.cqrs import Command, CommandBus
+
+    class CreateOrder(Command):
+        def validate(self):
+            if not self.items:
+                raise ValueError("Order must have at least one item")
+
+    class PingOrder(Command):
+        pass
+
+    assert CreateOrder._has_validate is True
+    assert PingOrder._has_validate is False
+
+    bus = CommandBus()
+    bus.register(CreateOrder, lambda cmd: {"created": True})
+
+    result = await bus.dispatch(CreateOrder(items=[]))
+    assert result.success is False
+    assert result.error == "Rejected: Order must have at least one item"
+
+    result = await bus.dispatch(CreateOrder(items=["Widget"]))
+    assert result.success is True
+
+
+@pytest.mark.asyncio
+async def test_query_bus_result_cache():
+    """Test QueryBus caches successful results of cacheable queries."""
+    from cello.cqrs import Query, QueryResult, QueryBus
+
+    class GetOrder(Query):
+        pass
+
+    calls = []
+
+    async def handle_get(q):
+        calls.append(q.order_id)
+        if q.order_id == "bad":
+            return QueryResult.fail("lookup failed")
+        return {"order_id": q.order_id}
+
+    bus = QueryBus(cache_size=2)
+    bus.register(GetOrder, handle_get, cacheable=True)
+
+    first = await bus.execute(GetOrder(order_id="a"))
+    second = await bus.execute(GetOrder(order_id="a"))
+    assert second is first
+    assert calls == ["a"]
+
+    await bus.execute(GetOrder(order_id="bad"))
+    await bus.execute(GetOrder(order_id="bad"))
+    assert calls == ["a", "bad", "bad"]
+
+    await bus.execute(GetOrder(order_id="b"))
+    await bus.execute(GetOrder(order_id="c"))
+    await bus.execute(GetOrder(order_id="a"))
+    assert calls[-1] == "a"  # evicted by the LRU
+
+    bus.invalidate(GetOrder)
+    await bus.execute(GetOrder(order_id="c"))
+    assert calls[-1] == "c"
+
+
+@pytest.mark.asyncio
+async def test_query_bus_cache_keys_fields_set_after_init():
+    """Test fields assigned after super().__init__() key the cache and serialize."""
+    from cello.cqrs import Query, QueryBus
+
+    class GetUser(Query):
+        def __init__(self, user_id):
+            super().__init__()
+            self.user_id = user_id
+
+    async def handle(q):
+        return {"id": q.user_id}
+
+    bus = QueryBus(cache_size=8)
+    bus.register(GetUser, handle, cacheable=True)
+
+    assert (await bus.execute(GetUser(1))).data == {"id": 1}
+    assert (await bus.execute(GetUser(2))).data == {"id": 2}
+
+    query = GetUser(3)
+    assert query.to_dict()["user_id"] == 3
+    assert "user_id=3" in repr(query)
+
+
+def test_query_bus_cacheable_requires_cache():
+    """Test QueryBus rejects cacheable handlers when caching is disabled."""
+    from cello.cqrs import Query, QueryBus
+
+    class GetOrder(Query):
+        pass
+
+    with pytest.raises(ValueError):
+        QueryBus().register(GetOrder, lambda q: None, cacheable=True)
+
+
+@pytest.mark.asyncio
+async def test_command_bus_dispatch_many():
+    """Test CommandBus.dispatch_many preserves input order across types."""
+    from cello.cqrs import Command, CommandBus
+
+    class CreateOrder(Command):
+        def validate(self):
+            if self.qty <= 0:
+                raise ValueError("qty must be positive")
+
+    class Ping(Command):
+        pass
+
+    class Unknown(Command):
+        pass
+
+    async def handle_create(cmd):
+        return {"qty": cmd.qty}
+
+    bus = CommandBus()
+    bus.register(CreateOrder, handle_create)
+    bus.register(Ping, lambda cmd: "pong")
+
+    results = await bus.dispatch_many([
+        CreateOrder(qty=1), Ping(), CreateOrder(qty=0), Unknown(), CreateOrder(qty=2),
+    ])
+    assert [r.success for r in results] == [True, True, False, False, True]
+    assert results[0].data == {"qty": 1}
+    assert results[1].data == "pong"
+    assert results[2].error.startswith("Rejected:")
+    assert results[4].data == {"qty": 2}
+
+
+@pytest.mark.asyncio
+async def test_command_bus_dispatch_many_validates_before_lookup():
+    """Test dispatch_many rejects invalid commands without a handler like dispatch."""
+    from cello.cqrs import Command, CommandBus
+
+    class Unhandled(Command):
+        def validate(self):
+            if not self.name:
+                raise ValueError("name required")
+
+    bus = CommandBus()
+    commands = [Unhandled(name=""), Unhandled(name="x")]
+    batch = await bus.dispatch_many(commands)
+    single = [await bus.dispatch(cmd) for cmd in commands]
+    assert [r.error for r in batch] == [r.error for r in single]
+    assert batch[0].error.startswith("Rejected:")
+
+
+@pytest.mark.asyncio
+async def test_query_bus_execute_many():
+    """Test QueryBus.execute_many returns results in input order."""
+    from cello.cqrs import Query, QueryBus
+
+    class GetOrder(Query):
+        pass
+
+    async def handle_get(q):
+        return {"order_id": q.order_id}
+
+    bus = QueryBus()
+    bus.register(GetOrder, handle_get)
+
+    results = await bus.execute_many([GetOrder(order_id=i) for i in range(5)])
+    assert [r.data["order_id"] for r in results] == [0, 1, 2, 3, 4]
+
+
 def test_command_bus_repr():
     """Test CommandBus repr."""
     from cello.cqrs import CommandBus